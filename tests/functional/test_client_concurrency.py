@@ -0,0 +1,126 @@
+import json
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Iterator
+from unittest.mock import Mock, PropertyMock, patch
+
+import jwt
+import pytest
+from uncertainty_engine_types import JobInfo, JobStatus
+
+from tests.local_core_api import LocalCoreApi
+from uncertainty_engine import Client, Environment
+from uncertainty_engine.auth_service import AuthService
+from uncertainty_engine.cognito_authenticator import CognitoToken
+
+THREADS = 200
+TASKS = 1000
+
+
+def make_token(expires_in: float, name: str) -> CognitoToken:
+    """
+    Create a Cognito token whose access token expires in `expires_in` seconds.
+    """
+
+    access_token = jwt.encode(
+        {"exp": int(time.time() + expires_in), "sub": name},
+        "mock_signing_key_that_is_long_enough",
+    )
+    return CognitoToken(access_token, "refresh", f"{name}_id")
+
+
+@pytest.fixture
+def expiring_token() -> CognitoToken:
+    return make_token(10, "expiring")
+
+
+@pytest.fixture
+def refreshed_token() -> CognitoToken:
+    return make_token(3600, "refreshed")
+
+
+@pytest.fixture
+def core_api(refreshed_token: CognitoToken) -> Iterator[LocalCoreApi]:
+    # Only the refreshed token is accepted, so any request sent with the
+    # expiring token shows up as a 401.
+    with LocalCoreApi({refreshed_token.access_token}) as api:
+        yield api
+
+
+@pytest.fixture
+def shared_client(
+    core_api: LocalCoreApi,
+    expiring_token: CognitoToken,
+    refreshed_token: CognitoToken,
+    tmp_path: Path,
+) -> Iterator[Client]:
+    auth_file = tmp_path / ".ue_auth"
+
+    with patch.object(
+        AuthService,
+        "auth_file_path",
+        new_callable=PropertyMock,
+        return_value=auth_file,
+    ):
+        client = Client(
+            env=Environment(
+                cognito_user_pool_client_id="local",
+                core_api=core_api.url,
+                region="eu-west-2",
+                resource_api=core_api.url,
+            ),
+            pool_maxsize=THREADS,
+        )
+
+        client.auth_service.token = expiring_token
+        client.auth_service.account_id = "account"
+        client.auth_service.resource_token = "resource"
+
+        def slow_refresh(refresh_token: str) -> CognitoToken:
+            # Give every other thread time to pile up behind the refresh.
+            time.sleep(0.2)
+            return refreshed_token
+
+        client.auth_service.authenticator.refresh_tokens = Mock(
+            side_effect=slow_refresh
+        )
+
+        with client:
+            yield client
+
+
+def test_shared_client_under_load(
+    shared_client: Client,
+    core_api: LocalCoreApi,
+    refreshed_token: CognitoToken,
+    tmp_path: Path,
+) -> None:
+    """
+    Verify that one client shared by hundreds of threads refreshes its token
+    exactly once, never sends a stale token and returns every result intact.
+    """
+
+    def run(i: int) -> tuple[int, JobInfo]:
+        job = shared_client.queue_node("Add", {"lhs": i, "rhs": 1})
+        return i, shared_client.job_status(job)
+
+    with ThreadPoolExecutor(max_workers=THREADS) as executor:
+        results = list(executor.map(run, range(TASKS)))
+
+    assert len(results) == TASKS
+    for i, info in results:
+        assert info.status == JobStatus.COMPLETED
+        assert info.inputs == {"lhs": i, "rhs": 1}
+
+    shared_client.auth_service.authenticator.refresh_tokens.assert_called_once()
+    assert core_api.requests["401"] == 0
+    assert core_api.requests["POST /nodes/queue"] == TASKS
+    assert core_api.requests["GET /nodes/status"] == TASKS
+
+    expected_header = f"Bearer {refreshed_token.access_token}"
+    for provider in shared_client._providers:
+        assert provider.client.default_headers["Authorization"] == expected_header
+
+    with open(tmp_path / ".ue_auth") as f:
+        assert json.load(f)["access_token"] == refreshed_token.access_token
@@ -0,0 +1,91 @@
+import time
+from random import Random
+from typing import Callable, Iterator
+
+import pytest
+from uncertainty_engine_types import JobStatus
+
+from tests.local_core_api import LocalCoreApi
+from uncertainty_engine import Client, Environment
+from uncertainty_engine.cognito_authenticator import CognitoToken
+from uncertainty_engine.nodes.sensor_designer import BuildSensorDesigner
+
+ACCESS_TOKEN = "access"
+
+SENSORS = 20
+ROWS = 5000
+
+
+@pytest.fixture
+def core_api() -> Iterator[LocalCoreApi]:
+    with LocalCoreApi({ACCESS_TOKEN}) as api:
+        yield api
+
+
+@pytest.fixture
+def sensor_designer() -> BuildSensorDesigner:
+    """
+    A sensor designer whose sensor data is inlined as a CSV dataset.
+    """
+
+    rng = Random(0)
+    sensor_data = {
+        f"sensor_{i}": [round(rng.gauss(0, 1), 6) for _ in range(ROWS)]
+        for i in range(SENSORS)
+    }
+    return BuildSensorDesigner(sensor_data=sensor_data, sigma=0.1)
+
+
+def make_client(core_api: LocalCoreApi, gzip_threshold: int | None) -> Client:
+    client = Client(
+        env=Environment(
+            cognito_user_pool_client_id="local",
+            core_api=core_api.url,
+            region="eu-west-2",
+            resource_api=core_api.url,
+        ),
+        gzip_threshold=gzip_threshold,
+    )
+    client.auth_service.token = CognitoToken(ACCESS_TOKEN, "refresh", "id")
+    client.auth_service.account_id = "account"
+    return client
+
+
+def send(client: Client, core_api: LocalCoreApi, node: BuildSensorDesigner) -> int:
+    """
+    Queue a node and return the number of bytes the API received.
+    """
+
+    before = core_api.bytes_received
+    with client:
+        job = client.queue_node(node)
+        assert client.job_status(job).status == JobStatus.COMPLETED
+    return core_api.bytes_received - before
+
+
+def test_gzip_reduces_upload_size(
+    core_api: LocalCoreApi,
+    sensor_designer: BuildSensorDesigner,
+    record_property: Callable[[str, object], None],
+) -> None:
+    """
+    Measure the upload saved by compressing a large inline dataset, and
+    verify that the API receives the same job either way.
+    """
+
+    started = time.perf_counter()
+    raw = send(make_client(core_api, None), core_api, sensor_designer)
+    raw_time = time.perf_counter() - started
+
+    started = time.perf_counter()
+    compressed = send(make_client(core_api, 64 * 1024), core_api, sensor_designer)
+    compressed_time = time.perf_counter() - started
+
+    record_property("raw_bytes", raw)
+    record_property("raw_seconds", raw_time)
+    record_property("compressed_bytes", compressed)
+    record_property("compressed_seconds", compressed_time)
+
+    first, second = core_api.jobs.values()
+    assert first == second
+    assert compressed < raw / 2
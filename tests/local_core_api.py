@@ -0,0 +1,138 @@
+import gzip
+import json
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from itertools import count
+from threading import Lock, Thread
+from typing import Any
+
+
+class _Server(ThreadingHTTPServer):
+    # Queue every client of a load test rather than reset connections beyond
+    # the default backlog of 5. Resets would make the client fail requests
+    # that it can't safely retry.
+    request_queue_size = 1024
+
+
+class LocalCoreApi:
+    """
+    A minimal, thread-safe stand-in for the Core API that runs on localhost.
+
+    Jobs complete as soon as they are queued. Requests whose bearer token is
+    not in `valid_tokens` are rejected with a 401. gzip-encoded request
+    bodies are decoded, and the size of every body as sent is recorded in
+    `bytes_received`.
+
+    Args:
+        valid_tokens: Access tokens the API accepts.
+    """
+
+    def __init__(self, valid_tokens: set[str]) -> None:
+        self.valid_tokens = valid_tokens
+        self.requests: Counter[str] = Counter()
+        self.bytes_received = 0
+        self.jobs: dict[str, dict[str, Any]] = {}
+
+        self._job_ids = count()
+        self._lock = Lock()
+        self._server = _Server(("127.0.0.1", 0), self._handler())
+        self._server.daemon_threads = True
+        self._thread = Thread(target=self._server.serve_forever, daemon=True)
+
+    @property
+    def url(self) -> str:
+        """
+        Base URL of the running API.
+        """
+
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def __enter__(self) -> "LocalCoreApi":
+        self._thread.start()
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+    def _record(self, key: str) -> None:
+        with self._lock:
+            self.requests[key] += 1
+
+    def _receive(self, length: int) -> None:
+        with self._lock:
+            self.bytes_received += length
+
+    def _queue(self, body: dict[str, Any]) -> str:
+        with self._lock:
+            job_id = f"job-{next(self._job_ids)}"
+            self.jobs[job_id] = body
+        return job_id
+
+    def _handler(self) -> type[BaseHTTPRequestHandler]:
+        api = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def log_message(self, *args: Any) -> None:
+                pass
+
+            def _send(self, status: int, payload: Any) -> None:
+                body = json.dumps(payload).encode()
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def _authorised(self) -> bool:
+                token = self.headers.get("Authorization", "").removeprefix("Bearer ")
+                if token in api.valid_tokens:
+                    return True
+
+                api._record("401")
+                self._send(401, {"detail": "Unauthorized"})
+                return False
+
+            def do_GET(self) -> None:
+                if not self._authorised():
+                    return
+
+                # /nodes/status/<node_id>/<job_id>
+                *_, job_id = self.path.split("/")
+                api._record("GET /nodes/status")
+
+                body = api.jobs.get(job_id)
+                if body is None:
+                    self._send(404, {"detail": "Not found"})
+                    return
+
+                self._send(
+                    200,
+                    {
+                        "status": "completed",
+                        "message": f"{job_id} completed",
+                        "inputs": body["inputs"],
+                        "outputs": {"job_id": job_id},
+                    },
+                )
+
+            def do_POST(self) -> None:
+                length = int(self.headers.get("Content-Length", 0))
+                data = self.rfile.read(length)
+                api._receive(length)
+
+                if self.headers.get("Content-Encoding") == "gzip":
+                    data = gzip.decompress(data)
+
+                body = json.loads(data or b"{}")
+
+                if not self._authorised():
+                    return
+
+                api._record("POST /nodes/queue")
+                self._send(200, api._queue(body))
+
+        return Handler
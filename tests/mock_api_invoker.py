@@ -5,6 +5,7 @@ from pytest import MonkeyPatch
 
 from uncertainty_engine.api_invoker import ApiInvoker
 from uncertainty_engine.client import Client
+from uncertainty_engine.timeouts import Deadline
 
 
 class MockApiInvoker(ApiInvoker):
@@ -46,6 +47,7 @@ class MockApiInvoker(ApiInvoker):
         method: str,
         path: str,
         body: Any | None = None,
+        deadline: Deadline | None = None,
     ) -> Any:
         """
         Mocks an invocation of the API and asserts that it was expected.
@@ -54,6 +56,7 @@ class MockApiInvoker(ApiInvoker):
             method: HTTP method.
             path: API path.
             body: Optional body.
+            deadline: Optional deadline. Ignored.
 
         Raises:
             Raises exception if the response is an Exception.
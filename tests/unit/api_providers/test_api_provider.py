@@ -1,4 +1,4 @@
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
 import pytest
 from uncertainty_engine_resource_client.exceptions import UnauthorizedException
@@ -6,6 +6,9 @@ from uncertainty_engine_resource_client.exceptions import UnauthorizedException
 from tests.unit.api_providers.conftest import MockResource, MockResourceCustomFields
 from uncertainty_engine.api_providers.api_provider import ApiProviderBase
 from uncertainty_engine.auth_service import AuthService
+from uncertainty_engine.circuit_breaker import CircuitBreaker, CircuitBreakerPolicy
+from uncertainty_engine.exceptions import CircuitOpenError
+from uncertainty_engine.rate_limit import RateLimiter
 
 
 class ApiProviderTestClass(ApiProviderBase):
@@ -68,7 +71,7 @@ def test_api_call_with_refresh(mock_auth_service: AuthService, mock_access_token
     result = provider.make_api_call()
 
     assert provider.call_count == 2
-    mock_auth_service.refresh.assert_called_once()
+    mock_auth_service.refresh.assert_called_once_with(mock_auth_service.token)
     mock_auth_service.get_auth_header.assert_called_once()
     assert (
         result
@@ -76,6 +79,18 @@ def test_api_call_with_refresh(mock_auth_service: AuthService, mock_access_token
     )
 
 
+def test_api_call_proactive_refresh(mock_auth_service: AuthService):
+    """Test headers are updated before the call when the token was refreshed"""
+    mock_auth_service.refresh_if_expiring.return_value = True
+    provider = ApiProviderTestClass("test-deployment", mock_auth_service)
+
+    result = provider.make_api_call()
+
+    assert provider.call_count == 1
+    mock_auth_service.get_auth_header.assert_called_once()
+    assert result != "Success with header: Initial Auth Header"
+
+
 def test_api_call_other_exception(mock_auth_service: AuthService):
     """Test API call that raises a non-auth exception"""
     provider = ApiProviderTestClass("test-deployment", mock_auth_service)
@@ -172,3 +187,49 @@ def test_get_id_by_name_no_resource_type(
 
     with pytest.raises(ValueError, match="No item found with name: nonexistent"):
         provider.get_id_by_name(list_func, "nonexistent")
+
+
+def test_create_api_client() -> None:
+    client = ApiProviderBase.create_api_client("https://test-api", pool_maxsize=64)
+
+    assert client.configuration.host == "https://test-api"
+    assert client.rest_client.pool_manager.connection_pool_kw["maxsize"] == 64
+
+
+def test_create_api_client_with_circuit_breaker() -> None:
+    breaker = CircuitBreaker(
+        "https://test-api",
+        CircuitBreakerPolicy(failure_threshold=1),
+    )
+    client = ApiProviderBase.create_api_client(
+        "https://test-api",
+        circuit_breaker=breaker,
+    )
+
+    with patch.object(
+        client.rest_client,
+        "request",
+        return_value=MagicMock(status=503),
+    ) as request:
+        client.call_api("GET", "https://test-api/foo")
+
+        with pytest.raises(CircuitOpenError):
+            client.call_api("GET", "https://test-api/foo")
+
+    request.assert_called_once()
+
+
+def test_create_api_client_with_rate_limiter() -> None:
+    limiter = MagicMock(spec=RateLimiter)
+    client = ApiProviderBase.create_api_client(
+        "https://test-api",
+        rate_limiter=limiter,
+    )
+
+    with patch.object(
+        client.rest_client, "request", return_value=MagicMock(status=200)
+    ):
+        client.call_api("GET", "https://test-api/foo")
+        client.call_api("GET", "https://test-api/foo")
+
+    assert limiter.acquire.call_count == 2
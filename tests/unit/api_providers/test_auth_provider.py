@@ -0,0 +1,46 @@
+from unittest.mock import MagicMock
+
+from uncertainty_engine.api_providers import AuthProvider
+from uncertainty_engine.api_providers.api_provider import ApiProviderBase
+from uncertainty_engine.auth_service import AuthService
+
+
+def test_uses_shared_api_client(mock_auth_service: AuthService) -> None:
+    mock_auth_service.token = MagicMock()
+    api_client = ApiProviderBase.create_api_client("https://test-api")
+
+    provider = AuthProvider(mock_auth_service, "https://test-api", api_client)
+
+    assert provider.client is api_client
+    assert provider.auth_client.api_client is api_client
+
+
+def test_get_tokens_sends_id_token_only_with_request(
+    mock_auth_service: AuthService,
+    mock_access_token: str,
+    mock_id_token: str,
+) -> None:
+    """
+    Verify that the ID token is sent to the token endpoint but isn't added
+    to headers that are shared with other providers.
+    """
+
+    mock_auth_service.token = MagicMock()
+    mock_auth_service.get_auth_header.side_effect = lambda include_id=False: {
+        "Authorization": f"Bearer {mock_access_token}",
+        **({"X-ID-Token": mock_id_token} if include_id else {}),
+    }
+
+    provider = AuthProvider(mock_auth_service, "https://test-api")
+    provider.auth_client = MagicMock()
+
+    provider.get_tokens()
+
+    provider.auth_client.get_tokens.assert_called_once_with(
+        _headers={"X-ID-Token": mock_id_token},
+    )
+    assert "X-ID-Token" not in provider.client.default_headers
+    assert (
+        provider.client.default_headers["Authorization"]
+        == f"Bearer {mock_access_token}"
+    )
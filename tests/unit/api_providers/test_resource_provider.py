@@ -14,6 +14,8 @@ from uncertainty_engine_resource_client.models import (
 
 from uncertainty_engine.api_providers import ResourceProvider
 from uncertainty_engine.auth_service import AuthService
+from uncertainty_engine.exceptions import DeadlineExceeded
+from uncertainty_engine.timeouts import DEFAULT_TIMEOUT, Deadline
 
 
 def test_init_default(mock_auth_service: AuthService):
@@ -109,6 +111,7 @@ def test_upload_success(
                     name=name, owner_id=resource_provider.account_id
                 )
             ),
+            _request_timeout=DEFAULT_TIMEOUT,
         )
 
         resource_provider.resources_client.post_resource_version.assert_called_once_with(
@@ -121,15 +124,20 @@ def test_upload_success(
                 ),
                 resource_file_extension="csv",
             ),
+            _request_timeout=DEFAULT_TIMEOUT,
         )
 
         mock_file.assert_called_once_with(file_path, "rb")
         mock_requests_put.assert_called_once_with(
-            "https://upload-url.com", data=mock_file()
+            "https://upload-url.com", data=mock_file(), timeout=DEFAULT_TIMEOUT
         )
 
         resource_provider.resources_client.put_upload_resource_version.assert_called_once_with(
-            project_id, resource_type, "test-resource-id", "test-pending-id"
+            project_id,
+            resource_type,
+            "test-resource-id",
+            "test-pending-id",
+            _request_timeout=DEFAULT_TIMEOUT,
         )
 
 
@@ -275,6 +283,21 @@ def test_upload_excel_file_dataset_error(
         )
 
 
+def test_download_deadline_exceeded(resource_provider: ResourceProvider):
+    """Test download stops before any request once the deadline has passed."""
+    resource_provider.resources_client.get_latest_resource_version = MagicMock()
+
+    with pytest.raises(DeadlineExceeded):
+        resource_provider.download(
+            project_id="test-project",
+            resource_type="dataset",
+            resource_id="test-resource-id",
+            deadline=Deadline(0),
+        )
+
+    resource_provider.resources_client.get_latest_resource_version.assert_not_called()
+
+
 def test_download_success_with_filepath(
     resource_provider: ResourceProvider,
     mock_file: MagicMock,
@@ -302,14 +325,19 @@ def test_download_success_with_filepath(
 
         # Verify method calls
         resource_provider.resources_client.get_latest_resource_version.assert_called_once_with(
-            "test-project", "dataset", "test-resource-id"
+            "test-project",
+            "dataset",
+            "test-resource-id",
+            _request_timeout=DEFAULT_TIMEOUT,
         )
 
         mock_makedirs.assert_called_once_with(
             os.path.dirname(os.path.abspath("path/to/download/file.csv")),
             exist_ok=True,
         )
-        requests.get.assert_called_once_with("https://upload-url.com")
+        requests.get.assert_called_once_with(
+            "https://upload-url.com", timeout=DEFAULT_TIMEOUT
+        )
         mock_get_response.raise_for_status.assert_called_once()
         mock_file.assert_called_once_with("path/to/download/file.csv", "wb")
         mock_file().write.assert_called_once_with(b"test file content")
@@ -340,9 +368,14 @@ def test_download_success_without_filepath(
         # Verify result and method calls
         assert result == expected_content
         resource_provider.resources_client.get_latest_resource_version.assert_called_once_with(
-            "test-project", "dataset", "test-resource-id"
+            "test-project",
+            "dataset",
+            "test-resource-id",
+            _request_timeout=DEFAULT_TIMEOUT,
+        )
+        requests.get.assert_called_once_with(
+            "https://upload-url.com", timeout=DEFAULT_TIMEOUT
         )
-        requests.get.assert_called_once_with("https://upload-url.com")
         mock_get_response.raise_for_status.assert_called_once()
 
 
@@ -448,7 +481,10 @@ def test_update_success(
 
             # Verify method calls
             resource_provider.resources_client.get_resource_record.assert_called_once_with(
-                "test-project", "dataset", "test-resource-id"
+                "test-project",
+                "dataset",
+                "test-resource-id",
+                _request_timeout=DEFAULT_TIMEOUT,
             )
 
             # Expected version name should be resource name + v3 (since there are two existing versions)
@@ -463,15 +499,20 @@ def test_update_success(
                     ),
                     resource_file_extension="json",
                 ),
+                _request_timeout=DEFAULT_TIMEOUT,
             )
 
             mock_file.assert_called_once_with("path/to/updated_file.json", "rb")
             requests.put.assert_called_once_with(
-                "https://upload-url.com", data=mock_file()
+                "https://upload-url.com", data=mock_file(), timeout=DEFAULT_TIMEOUT
             )
 
             resource_provider.resources_client.put_upload_resource_version.assert_called_once_with(
-                "test-project", "dataset", "test-resource-id", "test-pending-id"
+                "test-project",
+                "dataset",
+                "test-resource-id",
+                "test-pending-id",
+                _request_timeout=DEFAULT_TIMEOUT,
             )
 
 
@@ -34,6 +34,7 @@ def unauthenticated_auth_service():
     auth_service = Mock(spec=AuthService)
     auth_service.is_authenticated = False
     auth_service.account_id = None
+    auth_service.token = None
     auth_service.get_auth_header.return_value = {}
     return auth_service
 
@@ -283,10 +283,12 @@ def mock_cognito_authenticator(
 def mock_auth_service(mock_access_token: str, mock_account_id: str):
     auth_service = MagicMock(spec=AuthService)
     auth_service.refresh = MagicMock()
+    auth_service.refresh_if_expiring = MagicMock(return_value=False)
     auth_service.get_auth_header = MagicMock(
         return_value={"Authorization": f"Bearer {mock_access_token}"}
     )
     auth_service.account_id = mock_account_id
+    auth_service.token = None
     return auth_service
 
 
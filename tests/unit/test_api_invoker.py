@@ -1,11 +1,31 @@
-from typing import Iterator
-from unittest.mock import Mock, PropertyMock, call, patch
+import gzip
+import json
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Iterator
+from unittest.mock import ANY, Mock, PropertyMock, call, patch
 
-from pytest import fixture, raises
+from pytest import fixture, mark, raises
+from requests import ConnectionError, ConnectTimeout, ReadTimeout
+from urllib3.exceptions import MaxRetryError, NewConnectionError, ProtocolError
 
-from uncertainty_engine.api_invoker import HttpApiInvoker
+from uncertainty_engine.api_invoker import (
+    IDEMPOTENCY_KEY_HEADER,
+    ApiInvoker,
+    HttpApiInvoker,
+)
+from uncertainty_engine.circuit_breaker import (
+    CircuitBreaker,
+    CircuitBreakerPolicy,
+    CircuitState,
+)
+from uncertainty_engine.exceptions import CircuitOpenError, DeadlineExceeded
+from uncertainty_engine.rate_limit import EndpointClass, RateLimiter
+from uncertainty_engine.retry import RetryPolicy
+from uncertainty_engine.timeouts import DEFAULT_TIMEOUT, Deadline
 
-REQUEST_TARGET = "uncertainty_engine.api_invoker.request"
+REQUEST_TARGET = "uncertainty_engine.api_invoker.Session.request"
+SLEEP_TARGET = "uncertainty_engine.api_invoker.sleep"
 
 
 @fixture
@@ -51,15 +71,16 @@ def test_get(api: HttpApiInvoker, req: Mock) -> None:
     req.assert_called_once_with(
         "GET",
         "https://test-api/foo",
+        timeout=DEFAULT_TIMEOUT,
         headers={
             "Authorisation": "Bearer FOO",
         },
     )
 
 
-def test_get_with_one_failure(api: HttpApiInvoker) -> None:
+def test_get_with_one_auth_failure(api: HttpApiInvoker) -> None:
     response = Mock()
-    type(response).status_code = PropertyMock(side_effect=[400, 200])
+    type(response).status_code = PropertyMock(side_effect=[401, 200])
 
     with patch(REQUEST_TARGET, return_value=response) as request:
         api.get("/foo")
@@ -69,6 +90,7 @@ def test_get_with_one_failure(api: HttpApiInvoker) -> None:
                 call(
                     "GET",
                     "https://test-api/foo",
+                    timeout=DEFAULT_TIMEOUT,
                     headers={
                         "Authorisation": "Bearer FOO",
                     },
@@ -76,6 +98,7 @@ def test_get_with_one_failure(api: HttpApiInvoker) -> None:
                 call(
                     "GET",
                     "https://test-api/foo",
+                    timeout=DEFAULT_TIMEOUT,
                     headers={
                         "Authorisation": "Bearer BAR",
                     },
@@ -84,10 +107,28 @@ def test_get_with_one_failure(api: HttpApiInvoker) -> None:
         )
 
 
-def test_get_with_two_failures(api: HttpApiInvoker) -> None:
+def test_auth_failure_refreshes_token_sent(
+    api: HttpApiInvoker, auth_service: Mock
+) -> None:
+    sent = auth_service.token
+    response = Mock()
+    type(response).status_code = PropertyMock(side_effect=[401, 200])
+
+    with patch(REQUEST_TARGET, return_value=response):
+        api.get("/foo")
+
+    # Only the rejected token is refreshed, so a refresh made by another
+    # thread since the request was sent isn't repeated.
+    auth_service.refresh.assert_called_once_with(sent)
+    auth_service.get_auth_header.assert_called_with(
+        token=auth_service.refresh.return_value,
+    )
+
+
+def test_get_with_two_auth_failures(api: HttpApiInvoker) -> None:
     response = Mock()
     response.raise_for_status = Mock(side_effect=Exception("raised for status"))
-    type(response).status_code = PropertyMock(side_effect=[400, 400])
+    type(response).status_code = PropertyMock(side_effect=[401, 401])
 
     with patch(REQUEST_TARGET, return_value=response):
         with raises(Exception) as ex:
@@ -96,6 +137,23 @@ def test_get_with_two_failures(api: HttpApiInvoker) -> None:
     assert str(ex.value) == "raised for status"
 
 
+def test_get_client_error_not_retried(
+    api: HttpApiInvoker,
+    auth_service: Mock,
+) -> None:
+    response = Mock()
+    response.status_code = 400
+    response.raise_for_status = Mock(side_effect=Exception("raised for status"))
+
+    with patch(REQUEST_TARGET, return_value=response) as request:
+        with raises(Exception) as ex:
+            api.get("/foo")
+
+    assert str(ex.value) == "raised for status"
+    assert request.call_count == 1
+    auth_service.refresh.assert_not_called()
+
+
 def test_post(api: HttpApiInvoker, req: Mock) -> None:
     api.post(
         "/foo",
@@ -105,8 +163,529 @@ def test_post(api: HttpApiInvoker, req: Mock) -> None:
     req.assert_called_once_with(
         "POST",
         "https://test-api/foo",
+        timeout=DEFAULT_TIMEOUT,
         headers={
             "Authorisation": "Bearer FOO",
+            IDEMPOTENCY_KEY_HEADER: ANY,
         },
         json={"greeting": "hello"},
     )
+
+
+def test_session_pool_size(auth_service: Mock) -> None:
+    api = HttpApiInvoker(
+        auth_service,
+        "https://test-api",
+        pool_connections=3,
+        pool_maxsize=42,
+        pool_block=True,
+    )
+
+    adapter = api._session.get_adapter("https://test-api/foo")
+
+    assert adapter._pool_connections == 3
+    assert adapter._pool_maxsize == 42
+    assert adapter._pool_block is True
+
+
+def test_session_reused(api: HttpApiInvoker, req: Mock) -> None:
+    session = api._session
+
+    api.get("/foo")
+    api.get("/bar")
+
+    assert api._session is session
+    assert req.call_count == 2
+
+
+def test_close(api: HttpApiInvoker) -> None:
+    with patch.object(api._session, "close") as close:
+        api.close()
+
+    close.assert_called_once_with()
+
+
+def test_context_manager(api: HttpApiInvoker) -> None:
+    with patch.object(api._session, "close") as close:
+        with api as entered:
+            assert entered is api
+
+    close.assert_called_once_with()
+
+
+def test_base_close_is_noop() -> None:
+    class NoopInvoker(ApiInvoker):
+        def _invoke(self, method, path, body=None):
+            return None
+
+    with NoopInvoker() as api:
+        api.close()
+
+
+def make_response(status_code: int, headers: dict[str, str] | None = None) -> Mock:
+    response = Mock()
+    response.status_code = status_code
+    response.headers = headers or {}
+    response.json = Mock(return_value={"foo": "bar"})
+    response.raise_for_status = Mock(side_effect=Exception(f"{status_code}"))
+    return response
+
+
+@mark.parametrize("status_code", [429, 500, 502, 503, 504])
+def test_transient_status_retried_without_refresh(
+    api: HttpApiInvoker,
+    auth_service: Mock,
+    status_code: int,
+) -> None:
+    responses = [make_response(status_code), make_response(200)]
+
+    with (
+        patch(REQUEST_TARGET, side_effect=responses) as request,
+        patch(SLEEP_TARGET) as sleep,
+    ):
+        assert api.get("/foo") == {"foo": "bar"}
+
+    assert request.call_count == 2
+    sleep.assert_called_once()
+    auth_service.refresh.assert_not_called()
+
+
+def test_retry_after_honoured(api: HttpApiInvoker) -> None:
+    responses = [
+        make_response(429, {"Retry-After": "7"}),
+        make_response(200),
+    ]
+
+    with (
+        patch(REQUEST_TARGET, side_effect=responses),
+        patch(SLEEP_TARGET) as sleep,
+    ):
+        api.get("/foo")
+
+    sleep.assert_called_once_with(7.0)
+
+
+def test_connection_error_retried(api: HttpApiInvoker) -> None:
+    responses = [ConnectionError("reset"), make_response(200)]
+
+    with (
+        patch(REQUEST_TARGET, side_effect=responses) as request,
+        patch(SLEEP_TARGET),
+    ):
+        assert api.get("/foo") == {"foo": "bar"}
+
+    assert request.call_count == 2
+
+
+def test_connection_error_raised_when_attempts_spent(auth_service: Mock) -> None:
+    api = HttpApiInvoker(
+        auth_service,
+        "https://test-api",
+        retry_policy=RetryPolicy(max_attempts=3),
+    )
+
+    with (
+        patch(REQUEST_TARGET, side_effect=ConnectionError("reset")) as request,
+        patch(SLEEP_TARGET),
+    ):
+        with raises(ConnectionError):
+            api.get("/foo")
+
+    assert request.call_count == 3
+
+
+def test_transient_status_raised_when_attempts_spent(auth_service: Mock) -> None:
+    api = HttpApiInvoker(
+        auth_service,
+        "https://test-api",
+        retry_policy=RetryPolicy(max_attempts=2),
+    )
+
+    with (
+        patch(REQUEST_TARGET, return_value=make_response(503)) as request,
+        patch(SLEEP_TARGET),
+    ):
+        with raises(Exception) as ex:
+            api.get("/foo")
+
+    assert str(ex.value) == "503"
+    assert request.call_count == 2
+
+
+def test_post_retries_reuse_idempotency_key(api: HttpApiInvoker) -> None:
+    responses = [make_response(429), make_response(200)]
+
+    with (
+        patch(REQUEST_TARGET, side_effect=responses) as request,
+        patch(SLEEP_TARGET),
+    ):
+        api.post("/nodes/queue", {"node_id": "Add"})
+
+    first, second = request.call_args_list
+    first_key = first.kwargs["headers"][IDEMPOTENCY_KEY_HEADER]
+
+    assert first_key
+    assert second.kwargs["headers"][IDEMPOTENCY_KEY_HEADER] == first_key
+
+
+@mark.parametrize(
+    "failure",
+    [
+        make_response(503),
+        ReadTimeout(),
+        ConnectionError(MaxRetryError(None, "/", ProtocolError("reset"))),
+    ],
+)
+def test_queue_not_retried_once_sent(api: HttpApiInvoker, failure: Any) -> None:
+    with (
+        patch(REQUEST_TARGET, side_effect=[failure, make_response(200)]) as request,
+        patch(SLEEP_TARGET),
+    ):
+        # The server may have queued the job, so it isn't sent again.
+        with raises(Exception):
+            api.post("/nodes/queue", {"node_id": "Add"})
+
+    assert request.call_count == 1
+
+
+@mark.parametrize(
+    "failure",
+    [
+        ConnectTimeout(),
+        ConnectionError(MaxRetryError(None, "/", NewConnectionError(None, "refused"))),
+    ],
+)
+def test_queue_retried_before_connecting(api: HttpApiInvoker, failure: Any) -> None:
+    with (
+        patch(REQUEST_TARGET, side_effect=[failure, make_response(200)]) as request,
+        patch(SLEEP_TARGET),
+    ):
+        api.post("/nodes/queue", {"node_id": "Add"})
+
+    assert request.call_count == 2
+
+
+def test_idempotent_post_retried(api: HttpApiInvoker) -> None:
+    with (
+        patch(
+            REQUEST_TARGET, side_effect=[make_response(503), make_response(200)]
+        ) as request,
+        patch(SLEEP_TARGET),
+    ):
+        api.post("/nodes/query", {"ids": ["job_id"]})
+
+    assert request.call_count == 2
+
+
+def test_get_has_no_idempotency_key(api: HttpApiInvoker, req: Mock) -> None:
+    api.get("/foo")
+
+    assert IDEMPOTENCY_KEY_HEADER not in req.call_args.kwargs["headers"]
+
+
+def test_timeout_configurable(auth_service: Mock, req: Mock) -> None:
+    api = HttpApiInvoker(auth_service, "https://test-api", timeout=(1, 2))
+
+    api.get("/foo")
+
+    assert req.call_args.kwargs["timeout"] == (1, 2)
+
+
+def test_timeout_clipped_to_deadline(api: HttpApiInvoker, req: Mock) -> None:
+    api.get("/foo", deadline=Deadline(5))
+
+    connect, read = req.call_args.kwargs["timeout"]
+
+    assert 0 < connect <= 5
+    assert 0 < read <= 5
+
+
+def test_expired_deadline_not_requested(api: HttpApiInvoker, req: Mock) -> None:
+    with raises(DeadlineExceeded):
+        api.get("/foo", deadline=Deadline(0))
+
+    req.assert_not_called()
+
+
+def test_retry_abandoned_when_past_deadline(api: HttpApiInvoker) -> None:
+    responses = [make_response(429, {"Retry-After": "30"}), make_response(200)]
+
+    with (
+        patch(REQUEST_TARGET, side_effect=responses) as request,
+        patch(SLEEP_TARGET) as sleep,
+    ):
+        with raises(Exception) as ex:
+            api.get("/foo", deadline=Deadline(10))
+
+    assert str(ex.value) == "429"
+    assert request.call_count == 1
+    sleep.assert_not_called()
+
+
+def test_refreshes_expiring_token_before_request(
+    api: HttpApiInvoker,
+    auth_service: Mock,
+    req: Mock,
+) -> None:
+    api.get("/foo")
+
+    auth_service.refresh_if_expiring.assert_called_once_with()
+
+
+def test_body_not_compressed_by_default(api: HttpApiInvoker, req: Mock) -> None:
+    api.post("/foo", {"data": "x" * 10_000})
+
+    assert req.call_args.kwargs["json"] == {"data": "x" * 10_000}
+    assert "Content-Encoding" not in req.call_args.kwargs["headers"]
+
+
+def test_small_body_not_compressed(auth_service: Mock, req: Mock) -> None:
+    api = HttpApiInvoker(auth_service, "https://test-api", gzip_threshold=1024)
+
+    api.post("/foo", {"foo": "bar"})
+
+    kwargs = req.call_args.kwargs
+    assert kwargs["data"] == b'{"foo": "bar"}'
+    assert kwargs["headers"]["Content-Type"] == "application/json"
+    assert "Content-Encoding" not in kwargs["headers"]
+
+
+def test_large_body_compressed(auth_service: Mock, req: Mock) -> None:
+    api = HttpApiInvoker(auth_service, "https://test-api", gzip_threshold=1024)
+    body = {"data": "x" * 10_000}
+
+    api.post("/foo", body)
+
+    kwargs = req.call_args.kwargs
+    assert kwargs["headers"]["Content-Encoding"] == "gzip"
+    assert kwargs["headers"]["Content-Type"] == "application/json"
+    assert "json" not in kwargs
+    assert json.loads(gzip.decompress(kwargs["data"])) == body
+
+
+def test_body_compressed_once_across_retries(auth_service: Mock) -> None:
+    api = HttpApiInvoker(auth_service, "https://test-api", gzip_threshold=0)
+
+    ok = make_response(200)
+
+    with (
+        patch(
+            REQUEST_TARGET,
+            side_effect=[make_response(503), ok],
+        ) as req,
+        patch(SLEEP_TARGET),
+        patch(
+            "uncertainty_engine.api_invoker.gzip.compress",
+            wraps=gzip.compress,
+        ) as compress,
+    ):
+        api.post("/foo", {"foo": "bar"})
+
+    compress.assert_called_once()
+    first, second = req.call_args_list
+    assert first.kwargs["data"] is second.kwargs["data"]
+
+
+def test_accepts_compressed_responses(api: HttpApiInvoker) -> None:
+    assert "gzip" in api._session.headers["Accept-Encoding"]
+
+
+def run_concurrently(calls: int, func: Callable[[], Any]) -> list[Any]:
+    """
+    Call `func` from `calls` threads at once and return the results.
+    """
+
+    with ThreadPoolExecutor(max_workers=calls) as executor:
+        futures = [executor.submit(func) for _ in range(calls)]
+        return [future.result() for future in futures]
+
+
+def slow_request(response: Mock, delay: float = 0.2) -> Callable[..., Mock]:
+    def request(*args: Any, **kwargs: Any) -> Mock:
+        time.sleep(delay)
+        return response
+
+    return request
+
+
+def test_identical_gets_coalesced(api: HttpApiInvoker) -> None:
+    with patch(REQUEST_TARGET, side_effect=slow_request(make_response(200))) as req:
+        results = run_concurrently(10, lambda: api.get("/foo"))
+
+    req.assert_called_once()
+    assert results == [{"foo": "bar"}] * 10
+    assert api._in_flight == {}
+
+
+def test_coalesced_callers_get_own_copy(api: HttpApiInvoker) -> None:
+    with patch(REQUEST_TARGET, side_effect=slow_request(make_response(200))):
+        results = run_concurrently(2, lambda: api.get("/foo"))
+
+    first, second = results
+    first["foo"] = "changed"
+    assert second == {"foo": "bar"}
+
+
+def test_different_gets_not_coalesced(api: HttpApiInvoker) -> None:
+    paths = iter(["/foo", "/bar"])
+
+    with patch(REQUEST_TARGET, side_effect=slow_request(make_response(200))) as req:
+        run_concurrently(2, lambda: api.get(next(paths)))
+
+    assert req.call_count == 2
+
+
+def test_idempotent_posts_coalesced(api: HttpApiInvoker) -> None:
+    with patch(REQUEST_TARGET, side_effect=slow_request(make_response(200))) as req:
+        run_concurrently(5, lambda: api.post("/nodes/query", {"queries": []}))
+
+    req.assert_called_once()
+
+
+def test_other_posts_not_coalesced(api: HttpApiInvoker, auth_service: Mock) -> None:
+    auth_service.get_auth_header = Mock(return_value={})
+
+    with patch(REQUEST_TARGET, side_effect=slow_request(make_response(200))) as req:
+        run_concurrently(5, lambda: api.post("/nodes/queue", {"node_id": "Add"}))
+
+    assert req.call_count == 5
+
+
+def test_coalesced_error_shared(auth_service: Mock) -> None:
+    api = HttpApiInvoker(
+        auth_service,
+        "https://test-api",
+        retry_policy=RetryPolicy(max_attempts=1),
+    )
+
+    with patch(REQUEST_TARGET, side_effect=slow_request(make_response(500))) as req:
+        with ThreadPoolExecutor(max_workers=5) as executor:
+            futures = [executor.submit(api.get, "/foo") for _ in range(5)]
+
+        for future in futures:
+            with raises(Exception, match="500"):
+                future.result()
+
+    req.assert_called_once()
+
+
+def test_coalesced_waiter_honours_deadline(api: HttpApiInvoker) -> None:
+    with patch(REQUEST_TARGET, side_effect=slow_request(make_response(200), 0.5)):
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            leader = executor.submit(api.get, "/foo")
+            time.sleep(0.1)
+            waiter = executor.submit(api.get, "/foo", Deadline(0.1))
+
+            with raises(DeadlineExceeded):
+                waiter.result()
+
+            assert leader.result() == {"foo": "bar"}
+
+
+def test_coalescing_disabled(auth_service: Mock) -> None:
+    auth_service.get_auth_header = Mock(return_value={})
+    api = HttpApiInvoker(auth_service, "https://test-api", coalesce=False)
+
+    with patch(REQUEST_TARGET, side_effect=slow_request(make_response(200))) as req:
+        run_concurrently(3, lambda: api.get("/foo"))
+
+    assert req.call_count == 3
+
+
+def test_circuit_breaker_fails_fast(auth_service: Mock) -> None:
+    breaker = CircuitBreaker(
+        "https://test-api",
+        CircuitBreakerPolicy(failure_threshold=2),
+    )
+    api = HttpApiInvoker(
+        auth_service,
+        "https://test-api",
+        retry_policy=RetryPolicy(max_attempts=5),
+        circuit_breaker=breaker,
+    )
+
+    with (
+        patch(REQUEST_TARGET, return_value=make_response(503)) as req,
+        patch(SLEEP_TARGET),
+    ):
+        with raises(CircuitOpenError):
+            api.get("/foo")
+
+        with raises(CircuitOpenError):
+            api.get("/foo")
+
+    # The breaker opened after two failed attempts and stopped the retries.
+    assert req.call_count == 2
+    assert breaker.state == CircuitState.OPEN
+
+
+def test_circuit_breaker_records_connection_errors(auth_service: Mock) -> None:
+    breaker = CircuitBreaker("https://test-api")
+    api = HttpApiInvoker(
+        auth_service,
+        "https://test-api",
+        retry_policy=RetryPolicy(max_attempts=1),
+        circuit_breaker=breaker,
+    )
+
+    with patch(REQUEST_TARGET, side_effect=ConnectionError()):
+        with raises(ConnectionError):
+            api.get("/foo")
+
+    assert breaker.failure_count == 1
+
+
+def test_rate_limiters(auth_service: Mock) -> None:
+    auth_service.get_auth_header = Mock(return_value={})
+    queue = Mock(spec=RateLimiter)
+    status = Mock(spec=RateLimiter)
+    api = HttpApiInvoker(
+        auth_service,
+        "https://test-api",
+        retry_policy=RetryPolicy(max_attempts=2),
+        rate_limiters={EndpointClass.QUEUE: queue, EndpointClass.STATUS: status},
+    )
+    deadline = Deadline(60)
+
+    with (
+        patch(
+            REQUEST_TARGET,
+            side_effect=[make_response(429), make_response(200), make_response(200)],
+        ),
+        patch(SLEEP_TARGET),
+    ):
+        api.post("/nodes/queue", {"node_id": "Add"}, deadline=deadline)
+        api.get("/nodes/status/Add/job_id")
+
+    # Every attempt, including retries, waits for its endpoint's limiter.
+    assert queue.acquire.call_count == 2
+    queue.acquire.assert_called_with(deadline)
+    status.acquire.assert_called_once_with(None)
+
+
+def test_deadline_spent_waiting_for_rate_limit(auth_service: Mock, req: Mock) -> None:
+    breaker = CircuitBreaker("https://test-api")
+    status = Mock(spec=RateLimiter)
+    api = HttpApiInvoker(
+        auth_service,
+        "https://test-api",
+        circuit_breaker=breaker,
+        rate_limiters={EndpointClass.STATUS: status},
+    )
+
+    with patch("uncertainty_engine.timeouts.monotonic", return_value=100.0):
+        deadline = Deadline(5)
+
+    # The deadline runs out while the limiter blocks.
+    def expire(deadline: Deadline) -> None:
+        deadline.expires_at = 0.0
+
+    status.acquire.side_effect = expire
+
+    with raises(DeadlineExceeded):
+        api.get("/foo", deadline=deadline)
+
+    # No request is sent with a zero timeout, and it isn't a failure of the
+    # API.
+    req.assert_not_called()
+    assert breaker.failure_count == 0
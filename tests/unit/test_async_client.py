@@ -0,0 +1,341 @@
+import asyncio
+from threading import Lock
+from time import sleep
+from unittest.mock import patch
+
+import pytest
+from uncertainty_engine_types import JobInfo, JobStatus
+
+from tests.mock_api_invoker import mock_core_api
+from uncertainty_engine import AsyncClient
+from uncertainty_engine.client import Job
+from uncertainty_engine.exceptions import DeadlineExceeded, JobTimeoutError
+from uncertainty_engine.job_retry import JobRetryPolicy
+from uncertainty_engine.memo import NodeMemo
+from uncertainty_engine.polling import FixedPoll
+from uncertainty_engine.timeouts import Deadline
+
+PENDING = JobInfo(
+    status=JobStatus.PENDING,
+    message="Job is pending",
+    inputs={},
+    outputs=None,
+)
+
+COMPLETED = JobInfo(
+    status=JobStatus.COMPLETED,
+    message="Job completed",
+    inputs={},
+    outputs={"result": 42},
+)
+
+
+@pytest.fixture
+def async_client() -> AsyncClient:
+    return AsyncClient(env="local", max_concurrency=4)
+
+
+@pytest.fixture
+def mock_job() -> Job:
+    return Job(node_id="node_id", job_id="job_id")
+
+
+def test_init_pool_size() -> None:
+    client = AsyncClient(env="local", max_concurrency=16)
+
+    adapter = client.client.core_api._session.get_adapter(client.client.env.core_api)
+
+    assert adapter._pool_maxsize == 16
+    assert client._executor._max_workers == 16
+
+
+def test_context_manager() -> None:
+    async def main() -> AsyncClient:
+        async with AsyncClient(env="local") as client:
+            return client
+
+    with patch("uncertainty_engine.client.HttpApiInvoker.close") as close:
+        client = asyncio.run(main())
+
+    close.assert_called_once_with()
+    assert client._executor._shutdown
+
+
+def test_queue_node(async_client: AsyncClient) -> None:
+    with mock_core_api(async_client.client) as api:
+        api.expect_post(
+            "/nodes/queue",
+            {"node_id": "Add", "inputs": {"lhs": 1, "rhs": 2}},
+            "job_id",
+        )
+
+        job = asyncio.run(async_client.queue_node("Add", {"lhs": 1, "rhs": 2}))
+
+    assert job == Job(node_id="Add", job_id="job_id")
+
+
+def test_job_status(async_client: AsyncClient, mock_job: Job) -> None:
+    with mock_core_api(async_client.client) as api:
+        api.expect_get(
+            f"/nodes/status/{mock_job.node_id}/{mock_job.job_id}",
+            COMPLETED.model_dump(),
+        )
+
+        info = asyncio.run(async_client.job_status(mock_job))
+
+    assert info == COMPLETED
+
+
+def test_wait_for_job(async_client: AsyncClient, mock_job: Job) -> None:
+    with mock_core_api(async_client.client) as api:
+        api.expect_get(
+            f"/nodes/status/{mock_job.node_id}/{mock_job.job_id}",
+            PENDING.model_dump(),
+            PENDING.model_dump(),
+            COMPLETED.model_dump(),
+        )
+
+        info = asyncio.run(async_client.wait_for_job(mock_job, poll=FixedPoll(0.01)))
+
+    assert info == COMPLETED
+
+
+def test_watch(async_client: AsyncClient, mock_job: Job) -> None:
+    running = JobInfo(
+        status=JobStatus.RUNNING,
+        message="Job is running",
+        inputs={},
+        outputs=None,
+    )
+
+    async def watch() -> list[JobInfo]:
+        return [
+            info async for info in async_client.watch(mock_job, poll=FixedPoll(0.01))
+        ]
+
+    with patch.object(
+        async_client.client,
+        "job_status",
+        side_effect=[PENDING, PENDING, running, running, COMPLETED],
+    ):
+        updates = asyncio.run(watch())
+
+    assert updates == [PENDING, running, COMPLETED]
+
+
+def test_wait_for_job_deadline(async_client: AsyncClient, mock_job: Job) -> None:
+    with mock_core_api(async_client.client) as api:
+        api.expect_get(
+            f"/nodes/status/{mock_job.node_id}/{mock_job.job_id}",
+            *[PENDING.model_dump()] * 5,
+        )
+
+        with pytest.raises(DeadlineExceeded):
+            asyncio.run(
+                async_client.wait_for_job(
+                    mock_job,
+                    deadline=0.15,
+                    poll=FixedPoll(0.1),
+                )
+            )
+
+
+def test_wait_for_job_does_not_block_event_loop(
+    async_client: AsyncClient,
+    mock_job: Job,
+) -> None:
+    """
+    Verify that other coroutines keep running while a job is polled.
+    """
+
+    ticks = 0
+
+    async def tick() -> None:
+        nonlocal ticks
+        while True:
+            ticks += 1
+            await asyncio.sleep(0.01)
+
+    async def main() -> JobInfo:
+        ticker = asyncio.create_task(tick())
+        try:
+            return await async_client.wait_for_job(mock_job, poll=FixedPoll(0.2))
+        finally:
+            ticker.cancel()
+
+    with mock_core_api(async_client.client) as api:
+        api.expect_get(
+            f"/nodes/status/{mock_job.node_id}/{mock_job.job_id}",
+            PENDING.model_dump(),
+            COMPLETED.model_dump(),
+        )
+
+        asyncio.run(main())
+
+    assert ticks >= 10
+
+
+def test_wait_for_job_timeout_cancels_job(
+    async_client: AsyncClient,
+    mock_job: Job,
+) -> None:
+    cancelled = JobInfo(
+        status=JobStatus.CANCELLED,
+        message="Job cancelled",
+        inputs={},
+        outputs=None,
+    )
+    statuses = [PENDING] * 3
+
+    def job_status(job: Job, deadline: Deadline | None = None) -> JobInfo:
+        return statuses.pop(0) if statuses else cancelled
+
+    with patch.object(
+        async_client.client, "job_status", side_effect=job_status
+    ), patch.object(
+        async_client.client, "cancel_job", return_value=True
+    ) as cancel_job, patch(
+        "uncertainty_engine.client.CANCEL_CONFIRM_INTERVAL", 0.01
+    ):
+        with pytest.raises(JobTimeoutError) as error:
+            asyncio.run(
+                async_client.wait_for_job(
+                    mock_job,
+                    poll=FixedPoll(0.05),
+                    timeout=0.12,
+                    cancel_on_timeout=True,
+                )
+            )
+
+    cancel_job.assert_called_once_with(mock_job)
+    assert error.value.cancelled == [mock_job.job_id]
+
+
+def test_cancel_jobs(async_client: AsyncClient) -> None:
+    jobs = [Job(node_id="Add", job_id=f"job_{i}") for i in range(2)]
+
+    with patch.object(
+        async_client.client, "cancel_job", side_effect=[True, RuntimeError()]
+    ):
+        results = asyncio.run(async_client.cancel_jobs(jobs))
+
+    assert results[0] is True
+    assert isinstance(results[1], RuntimeError)
+
+
+def test_run_node(async_client: AsyncClient, mock_job: Job) -> None:
+    with patch.object(
+        async_client.client, "queue_node", return_value=mock_job
+    ) as queue_node, patch.object(
+        async_client.client, "job_status", return_value=COMPLETED
+    ) as job_status:
+        info = asyncio.run(async_client.run_node("Add", {"lhs": 1, "rhs": 2}))
+
+    assert info == COMPLETED
+    queue_node.assert_called_once_with("Add", {"lhs": 1, "rhs": 2}, deadline=None)
+    job_status.assert_called_once_with(mock_job, deadline=None)
+
+
+def test_run_node_memo(async_client: AsyncClient) -> None:
+    client = async_client.client
+
+    with mock_core_api(client) as api, patch.object(
+        client, "memo", NodeMemo(nodes={"Add"})
+    ):
+        api.expect_post(
+            "/nodes/queue",
+            expect_body={"node_id": "Add", "inputs": {"lhs": 1, "rhs": 2}},
+            response="job_1",
+        )
+        api.expect_get("/nodes/status/Add/job_1", COMPLETED.model_dump())
+
+        first = asyncio.run(async_client.run_node("Add", {"lhs": 1, "rhs": 2}))
+        second = asyncio.run(async_client.run_node("Add", {"rhs": 2, "lhs": 1}))
+
+        assert client.memo.stats.hits == 1
+
+    assert first == second == COMPLETED
+
+
+def test_run_node_retry(async_client: AsyncClient) -> None:
+    failed = JobInfo(status=JobStatus.FAILED, message="Timed out", inputs={})
+    jobs = [Job(node_id="Add", job_id="first"), Job(node_id="Add", job_id="second")]
+
+    with patch.object(
+        async_client.client, "queue_node", side_effect=jobs
+    ) as queue_node, patch.object(
+        async_client.client, "job_status", side_effect=[failed, COMPLETED]
+    ):
+        info = asyncio.run(
+            async_client.run_node(
+                "Add",
+                {"lhs": 1, "rhs": 2},
+                retry=JobRetryPolicy(backoff_base=0.01),
+            )
+        )
+
+    assert info == COMPLETED
+    assert queue_node.call_count == 2
+    queue_node.assert_called_with("Add", {"lhs": 1, "rhs": 2}, deadline=None)
+
+
+def test_run_workflow(async_client: AsyncClient, mock_job: Job) -> None:
+    with patch.object(
+        async_client.client, "queue_workflow", return_value=mock_job
+    ) as queue_workflow, patch.object(
+        async_client.client, "job_status", return_value=COMPLETED
+    ):
+        info = asyncio.run(async_client.run_workflow("project_id", "workflow_id"))
+
+    assert info == COMPLETED
+    queue_workflow.assert_called_once_with(
+        "project_id", "workflow_id", None, None, deadline=None
+    )
+
+
+def test_cancel_job(async_client: AsyncClient, mock_job: Job) -> None:
+    with patch.object(async_client.client, "cancel_job", return_value=True) as cancel:
+        assert asyncio.run(async_client.cancel_job(mock_job))
+
+    cancel.assert_called_once_with(mock_job)
+
+
+def test_provider_operations(async_client: AsyncClient) -> None:
+    with patch.object(
+        async_client.client.workflows, "list_workflows", return_value=[]
+    ) as list_workflows:
+        result = asyncio.run(async_client.workflows.list_workflows("project_id"))
+
+    assert result == []
+    list_workflows.assert_called_once_with("project_id")
+
+
+def test_bounded_concurrency(async_client: AsyncClient, mock_job: Job) -> None:
+    """
+    Verify that no more than `max_concurrency` requests run at once.
+    """
+
+    lock = Lock()
+    running = 0
+    peak = 0
+
+    def job_status(job: Job, deadline: None = None) -> JobInfo:
+        nonlocal running, peak
+        with lock:
+            running += 1
+            peak = max(peak, running)
+        sleep(0.02)
+        with lock:
+            running -= 1
+        return COMPLETED
+
+    async def main() -> list[JobInfo]:
+        return await asyncio.gather(
+            *[async_client.job_status(mock_job) for _ in range(20)]
+        )
+
+    with patch.object(async_client.client, "job_status", side_effect=job_status):
+        results = asyncio.run(main())
+
+    assert results == [COMPLETED] * 20
+    assert peak == 4
@@ -1,7 +1,10 @@
 import json
+import time
 from pathlib import Path
+from threading import Barrier, Thread
 from unittest.mock import MagicMock, mock_open, patch
 
+import jwt
 import pytest
 from pytest import MonkeyPatch, mark
 
@@ -316,3 +319,133 @@ def test_load_from_file_missing_keys(auth_service_no_file: AuthService):
 
             # Verify token and account_id weren't set
             assert auth_service_no_file.token is None
+
+
+def make_token(expires_in: float, access: str = "access") -> CognitoToken:
+    """Create a Cognito token whose access token expires in `expires_in` seconds."""
+    access_token = jwt.encode(
+        {"exp": int(time.time() + expires_in), "sub": access},
+        "mock_signing_key",
+    )
+    return CognitoToken(access_token, "refresh", "id")
+
+
+def test_refresh_if_expiring_not_expiring(
+    auth_service_no_file: AuthService,
+    mock_cognito_authenticator: CognitoAuthenticator,
+):
+    """Test a token far from expiry is not refreshed"""
+    auth_service_no_file.token = make_token(3600)
+
+    assert auth_service_no_file.refresh_if_expiring() is False
+    mock_cognito_authenticator.refresh_tokens.assert_not_called()
+
+
+def test_refresh_if_expiring_within_skew(
+    auth_service_no_file: AuthService,
+    mock_cognito_authenticator: CognitoAuthenticator,
+    mock_refreshed_cognito_tokens: CognitoToken,
+):
+    """Test a token within the refresh skew is refreshed"""
+    auth_service_no_file.refresh_skew = 120
+    auth_service_no_file.token = make_token(60)
+
+    assert auth_service_no_file.refresh_if_expiring() is True
+    assert auth_service_no_file.token == mock_refreshed_cognito_tokens
+    mock_cognito_authenticator.refresh_tokens.assert_called_once_with("refresh")
+
+
+def test_refresh_if_expiring_unreadable_token(
+    auth_service_no_file: AuthService,
+    mock_cognito_authenticator: CognitoAuthenticator,
+):
+    """Test a token without a readable expiry is left for the API to judge"""
+    auth_service_no_file.token = CognitoToken("not-a-jwt", "refresh", "id")
+
+    assert auth_service_no_file.refresh_if_expiring() is False
+    mock_cognito_authenticator.refresh_tokens.assert_not_called()
+
+
+def test_refresh_if_expiring_failure_keeps_valid_token(
+    auth_service_no_file: AuthService,
+    mock_cognito_authenticator: CognitoAuthenticator,
+):
+    """Test a failed proactive refresh keeps a token that is still valid"""
+    token = make_token(30)
+    auth_service_no_file.token = token
+    mock_cognito_authenticator.refresh_tokens.side_effect = Exception("offline")
+
+    assert auth_service_no_file.refresh_if_expiring() is False
+    assert auth_service_no_file.token is token
+
+
+def test_refresh_if_expiring_failure_on_expired_token(
+    auth_service_no_file: AuthService,
+    mock_cognito_authenticator: CognitoAuthenticator,
+):
+    """Test a failed refresh of an expired token raises and clears state"""
+    auth_service_no_file.token = make_token(-30)
+    mock_cognito_authenticator.refresh_tokens.side_effect = Exception("offline")
+
+    with patch.object(auth_service_no_file, "clear") as clear:
+        with pytest.raises(ValueError):
+            auth_service_no_file.refresh_if_expiring()
+
+    clear.assert_called_once()
+
+
+def test_refresh_single_flight(
+    auth_service_no_file: AuthService,
+    mock_cognito_authenticator: CognitoAuthenticator,
+    mock_refreshed_cognito_tokens: CognitoToken,
+):
+    """Test concurrent refreshes of an expiring token call Cognito once"""
+    auth_service_no_file.token = make_token(10)
+
+    def slow_refresh(refresh_token: str) -> CognitoToken:
+        time.sleep(0.05)
+        return mock_refreshed_cognito_tokens
+
+    mock_cognito_authenticator.refresh_tokens.side_effect = slow_refresh
+    barrier = Barrier(20)
+
+    def worker() -> None:
+        barrier.wait()
+        auth_service_no_file.refresh_if_expiring()
+
+    threads = [Thread(target=worker) for _ in range(20)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    mock_cognito_authenticator.refresh_tokens.assert_called_once()
+    assert auth_service_no_file.token == mock_refreshed_cognito_tokens
+
+
+def test_refresh_stale_token_already_replaced(
+    auth_service_no_file: AuthService,
+    mock_cognito_authenticator: CognitoAuthenticator,
+    mock_refreshed_cognito_tokens: CognitoToken,
+):
+    """Test a rejected token that another thread already replaced isn't refreshed again"""
+    stale = make_token(3600, "stale")
+    current = make_token(3600, "current")
+    auth_service_no_file.token = current
+
+    assert auth_service_no_file.refresh(stale) is current
+    mock_cognito_authenticator.refresh_tokens.assert_not_called()
+
+    assert auth_service_no_file.refresh(current) == mock_refreshed_cognito_tokens
+    mock_cognito_authenticator.refresh_tokens.assert_called_once()
+
+
+def test_refresh_notifies_listeners(auth_service_no_file: AuthService):
+    """Test refresh listeners run after a refresh"""
+    auth_service_no_file.token = make_token(3600)
+    listener = MagicMock()
+    auth_service_no_file.add_refresh_listener(listener)
+
+    auth_service_no_file.refresh()
+
+    listener.assert_called_once_with()
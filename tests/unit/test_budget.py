@@ -0,0 +1,122 @@
+import time
+from threading import Thread
+from unittest.mock import Mock, patch
+
+from pytest import raises
+
+from uncertainty_engine.budget import TokenBudget, TokenBudgetPolicy
+from uncertainty_engine.exceptions import DeadlineExceeded, TokenBudgetExceeded
+from uncertainty_engine.timeouts import Deadline
+
+MONOTONIC_TARGET = "uncertainty_engine.budget.monotonic"
+
+
+def make_budget(*balances: int, **policy: object) -> TokenBudget:
+    """
+    Create a budget whose balance checks return `balances` in turn, then the
+    last balance forever.
+    """
+
+    policy.setdefault("sample_interval", 0.01)
+    view_tokens = Mock(side_effect=[*balances[:-1], *[balances[-1]] * 100])
+    return TokenBudget(TokenBudgetPolicy(**policy), view_tokens)
+
+
+def test_tracks_spend() -> None:
+    budget = make_budget(1000, 900, 700, sample_interval=0.01)
+
+    with patch(MONOTONIC_TARGET, side_effect=range(100)):
+        budget.acquire()
+        budget.acquire()
+
+    report = budget.report()
+
+    assert report.start_balance == 1000
+    assert report.balance == 700
+    assert report.spent == 300
+    assert report.submitted == 2
+    assert report.refused == 0
+
+
+def test_samples_balance_periodically() -> None:
+    budget = make_budget(1000, sample_interval=60)
+
+    for _ in range(5):
+        budget.acquire()
+
+    budget.view_tokens.assert_called_once_with()
+
+
+def test_pauses_while_balance_is_low() -> None:
+    budget = make_budget(50, 60, 500, min_balance=100)
+
+    budget.acquire()
+
+    assert budget.view_tokens.call_count == 3
+    assert budget.report().paused > 0
+
+
+def test_report_does_not_wait_for_paused_acquire() -> None:
+    budget = make_budget(50, min_balance=100, sample_interval=60)
+    errors: list[Exception] = []
+
+    def acquire() -> None:
+        try:
+            budget.acquire(Deadline(1))
+        except DeadlineExceeded as e:
+            errors.append(e)
+
+    thread = Thread(target=acquire)
+    thread.start()
+    time.sleep(0.1)
+
+    # The paused thread doesn't hold the lock while it waits.
+    started = time.monotonic()
+    report = budget.report()
+    assert time.monotonic() - started < 0.5
+    assert report.paused > 0
+
+    thread.join()
+    assert len(errors) == 1
+
+
+def test_gives_up_after_max_pause() -> None:
+    budget = make_budget(50, min_balance=100, max_pause=0.05)
+
+    with raises(TokenBudgetExceeded, match="stayed below 100"):
+        budget.acquire()
+
+    with raises(TokenBudgetExceeded):
+        budget.acquire()
+
+    assert budget.report().refused == 2
+
+
+def test_pause_respects_deadline() -> None:
+    budget = make_budget(50, min_balance=100)
+
+    with raises(DeadlineExceeded):
+        budget.acquire(Deadline(0.05))
+
+
+def test_stops_at_max_spend() -> None:
+    budget = make_budget(1000, 950, 900, max_spend=100)
+
+    with patch(MONOTONIC_TARGET, side_effect=range(100)):
+        budget.acquire()
+        budget.acquire()
+
+        with raises(TokenBudgetExceeded, match="spent 100 of its 100"):
+            budget.acquire()
+
+
+def test_stops_when_projected_spend_exceeds_budget() -> None:
+    budget = make_budget(1000, max_spend=100, cost_per_job=30, sample_interval=60)
+
+    for _ in range(3):
+        budget.acquire()
+
+    with raises(TokenBudgetExceeded, match="projected"):
+        budget.acquire()
+
+    assert budget.report().submitted == 3
@@ -0,0 +1,152 @@
+from typing import Iterator
+from unittest.mock import Mock, patch
+
+from pytest import fixture, raises
+
+from uncertainty_engine.circuit_breaker import (
+    CircuitBreaker,
+    CircuitBreakerPolicy,
+    CircuitState,
+)
+from uncertainty_engine.exceptions import CircuitOpenError
+
+MONOTONIC_TARGET = "uncertainty_engine.circuit_breaker.monotonic"
+
+
+@fixture
+def clock() -> Iterator[Mock]:
+    with patch(MONOTONIC_TARGET, return_value=1000.0) as monotonic:
+        yield monotonic
+
+
+@fixture
+def breaker(clock: Mock) -> CircuitBreaker:
+    return CircuitBreaker(
+        "https://test-api",
+        CircuitBreakerPolicy(failure_threshold=3, recovery_timeout=10),
+    )
+
+
+def trip(breaker: CircuitBreaker) -> None:
+    for _ in range(breaker.policy.failure_threshold):
+        breaker.before_call()
+        breaker.record_failure()
+
+
+def test_starts_closed(breaker: CircuitBreaker) -> None:
+    assert breaker.state == CircuitState.CLOSED
+    assert breaker.failure_count == 0
+    breaker.before_call()
+
+
+def test_opens_after_consecutive_failures(breaker: CircuitBreaker) -> None:
+    breaker.record_failure()
+    breaker.record_failure()
+    assert breaker.state == CircuitState.CLOSED
+
+    breaker.record_failure()
+    assert breaker.state == CircuitState.OPEN
+
+
+def test_success_resets_failures(breaker: CircuitBreaker) -> None:
+    breaker.record_failure()
+    breaker.record_failure()
+    breaker.record_success()
+    breaker.record_failure()
+
+    assert breaker.state == CircuitState.CLOSED
+    assert breaker.failure_count == 1
+
+
+def test_open_fails_fast(breaker: CircuitBreaker, clock: Mock) -> None:
+    trip(breaker)
+    clock.return_value = 1004.0
+
+    with raises(CircuitOpenError) as error:
+        breaker.before_call()
+
+    assert error.value.endpoint == "https://test-api"
+    assert error.value.retry_in == 6.0
+
+
+def test_half_opens_after_recovery_timeout(
+    breaker: CircuitBreaker,
+    clock: Mock,
+) -> None:
+    trip(breaker)
+    clock.return_value = 1010.0
+
+    assert breaker.state == CircuitState.HALF_OPEN
+
+
+def test_half_open_limits_trial_calls(breaker: CircuitBreaker, clock: Mock) -> None:
+    trip(breaker)
+    clock.return_value = 1010.0
+
+    breaker.before_call()
+
+    with raises(CircuitOpenError):
+        breaker.before_call()
+
+
+def test_successful_trial_closes(breaker: CircuitBreaker, clock: Mock) -> None:
+    trip(breaker)
+    clock.return_value = 1010.0
+
+    breaker.before_call()
+    breaker.record_success()
+
+    assert breaker.state == CircuitState.CLOSED
+    assert breaker.failure_count == 0
+    breaker.before_call()
+
+
+def test_failed_trial_reopens(breaker: CircuitBreaker, clock: Mock) -> None:
+    trip(breaker)
+    clock.return_value = 1010.0
+
+    breaker.before_call()
+    breaker.record_failure()
+
+    assert breaker.state == CircuitState.OPEN
+    clock.return_value = 1019.0
+    assert breaker.state == CircuitState.OPEN
+
+
+def test_late_success_while_open_ignored(breaker: CircuitBreaker) -> None:
+    trip(breaker)
+    breaker.record_success()
+
+    assert breaker.state == CircuitState.OPEN
+
+
+def test_record_status(breaker: CircuitBreaker) -> None:
+    breaker.record_status(503)
+    breaker.record_status(503)
+    breaker.record_status(404)
+    assert breaker.failure_count == 0
+
+    for _ in range(3):
+        breaker.record_status(502)
+    assert breaker.state == CircuitState.OPEN
+
+
+def test_disabled_never_opens(clock: Mock) -> None:
+    breaker = CircuitBreaker(
+        "https://test-api",
+        CircuitBreakerPolicy(enabled=False, failure_threshold=1),
+    )
+
+    for _ in range(10):
+        breaker.before_call()
+        breaker.record_failure()
+
+    assert breaker.state == CircuitState.CLOSED
+
+
+def test_throttling_does_not_open(breaker: CircuitBreaker) -> None:
+    for _ in range(breaker.policy.failure_threshold + 1):
+        breaker.record_status(429)
+        breaker.record_status(408)
+
+    assert breaker.state == CircuitState.CLOSED
@@ -1,4 +1,9 @@
-from unittest.mock import Mock, patch
+import time
+from itertools import islice
+from pathlib import Path
+from threading import Lock
+from typing import Iterator
+from unittest.mock import Mock, call, patch
 
 import pytest
 from requests import HTTPError
@@ -13,8 +18,24 @@ from uncertainty_engine_types import (
 
 from tests.mock_api_invoker import mock_core_api
 from uncertainty_engine import Client, Environment
+from uncertainty_engine.budget import TokenBudget, TokenBudgetPolicy
+from uncertainty_engine.circuit_breaker import CircuitBreakerPolicy, CircuitState
 from uncertainty_engine.client import Job
+from uncertainty_engine.durations import DurationHistory
+from uncertainty_engine.exceptions import (
+    DeadlineExceeded,
+    JobTimeoutError,
+    TokenBudgetExceeded,
+)
+from uncertainty_engine.hedging import HedgePolicy
+from uncertainty_engine.job_cache import JobInfoCache
+from uncertainty_engine.job_retry import JobRetryPolicy
+from uncertainty_engine.journal import JobJournal
+from uncertainty_engine.memo import NodeMemo
 from uncertainty_engine.nodes.base import Node
+from uncertainty_engine.polling import ExponentialBackoffPoll, FixedPoll
+from uncertainty_engine.rate_limit import EndpointClass, RateLimit, RateLimitPolicy
+from uncertainty_engine.timeouts import Deadline
 
 
 def test_init_default() -> None:
@@ -49,6 +70,82 @@ def test_init_with_custom_env() -> None:
     assert client.env == custom_env
 
 
+def test_init_pool_size() -> None:
+    client = Client(env="local", pool_connections=2, pool_maxsize=64)
+
+    adapter = client.core_api._session.get_adapter(client.env.core_api)
+
+    assert adapter._pool_connections == 2
+    assert adapter._pool_maxsize == 64
+
+
+def test_providers_share_resource_api_client() -> None:
+    client = Client(env="local", pool_maxsize=64)
+
+    api_client = client._resource_api_client
+    pool_kw = api_client.rest_client.pool_manager.connection_pool_kw
+
+    assert pool_kw["maxsize"] == 64
+    for provider in client._providers:
+        assert provider.client is api_client
+
+
+def test_circuit_breakers() -> None:
+    policy = CircuitBreakerPolicy(failure_threshold=3)
+    client = Client(env="local", circuit_breaker_policy=policy)
+
+    core_breaker = client.circuit_breakers["core_api"]
+    resource_breaker = client.circuit_breakers["resource_api"]
+
+    assert core_breaker.endpoint == client.env.core_api
+    assert core_breaker.policy == policy
+    assert core_breaker.state == CircuitState.CLOSED
+    assert client.core_api.circuit_breaker is core_breaker
+    assert resource_breaker.endpoint == client.env.resource_api
+    assert client._resource_api_client.circuit_breaker is resource_breaker
+
+
+def test_rate_limiters() -> None:
+    policy = RateLimitPolicy(queue=RateLimit(rate=5), resource=RateLimit(rate=2))
+    client = Client(env="local", rate_limit_policy=policy)
+
+    assert set(client.rate_limiters) == {EndpointClass.QUEUE, EndpointClass.RESOURCE}
+    assert client.core_api._rate_limiters is client.rate_limiters
+    assert (
+        client._resource_api_client.rate_limiter
+        is client.rate_limiters[EndpointClass.RESOURCE]
+    )
+    assert Client(env="local").rate_limiters == {}
+
+
+def test_default_poll_strategy() -> None:
+    assert isinstance(Client(env="local").poll_strategy, ExponentialBackoffPoll)
+
+    poll = FixedPoll(1)
+    assert Client(env="local", poll_strategy=poll).poll_strategy is poll
+
+
+def test_close() -> None:
+    client = Client(env="local")
+    pool_manager = client._resource_api_client.rest_client.pool_manager
+
+    with patch.object(client.core_api, "close") as close, patch.object(
+        pool_manager, "clear"
+    ) as clear:
+        client.close()
+
+    close.assert_called_once_with()
+    clear.assert_called_once_with()
+
+
+def test_context_manager() -> None:
+    with patch("uncertainty_engine.client.HttpApiInvoker.close") as close:
+        with Client(env="local") as client:
+            assert isinstance(client, Client)
+
+    close.assert_called_once_with()
+
+
 class TestClientMethods:
 
     def test_list_nodes(self, client: Client):
@@ -211,6 +308,112 @@ class TestClientMethods:
             with pytest.raises(ValueError):
                 client.queue_node(node="node_a")
 
+    def test_queue_nodes(self, client: Client):
+        """
+        Verify that queue_nodes returns a job or error for each node in the
+        order given, however the requests finish.
+
+        Args:
+            client: A Client instance.
+        """
+
+        def post(path: str, body: dict, deadline: Deadline | None = None) -> str:
+            lhs = body["inputs"]["lhs"]
+            if lhs == 2:
+                raise HTTPError("500 Server Error")
+
+            # Later nodes finish first.
+            time.sleep(0.01 * (5 - lhs))
+            return f"job_{lhs}"
+
+        nodes = [
+            ("Add", {"lhs": 0, "rhs": 1}),
+            Node("Add", "0.2.0", lhs=1, rhs=1),
+            ("Add", {"lhs": 2, "rhs": 1}),
+            ("Add", {"lhs": 3, "rhs": 1}),
+        ]
+
+        with patch.object(client.core_api, "post", side_effect=post):
+            results = client.queue_nodes(nodes)
+
+        assert results[0] == Job(node_id="Add", job_id="job_0")
+        assert results[1] == Job(node_id="Add", job_id="job_1")
+        assert isinstance(results[2], HTTPError)
+        assert results[3] == Job(node_id="Add", job_id="job_3")
+
+    def test_queue_nodes_max_in_flight(self, client: Client):
+        """
+        Verify that queue_nodes makes no more than `max_in_flight` requests
+        at once.
+
+        Args:
+            client: A Client instance.
+        """
+
+        lock = Lock()
+        running = 0
+        peak = 0
+
+        def post(path: str, body: dict, deadline: Deadline | None = None) -> str:
+            nonlocal running, peak
+            with lock:
+                running += 1
+                peak = max(peak, running)
+            time.sleep(0.02)
+            with lock:
+                running -= 1
+            return "job_id"
+
+        nodes = [("Add", {"lhs": i, "rhs": 1}) for i in range(12)]
+
+        with patch.object(client.core_api, "post", side_effect=post):
+            results = client.queue_nodes(nodes, max_in_flight=4)
+
+        assert len(results) == 12
+        assert peak == 4
+
+    def test_queue_nodes_empty(self, client: Client):
+        """
+        Verify that queue_nodes with no nodes makes no requests.
+
+        Args:
+            client: A Client instance.
+        """
+
+        with patch.object(client.core_api, "post") as post:
+            assert client.queue_nodes([]) == []
+
+        post.assert_not_called()
+
+    def test_queue_nodes_budget(self, client: Client):
+        """
+        Verify that queue_nodes stops queueing once the token budget is
+        projected to run out.
+
+        Args:
+            client: A Client instance.
+        """
+
+        nodes = [("Add", {"lhs": i, "rhs": 1}) for i in range(5)]
+
+        with patch.object(client, "view_tokens", return_value=1000), patch.object(
+            client.core_api, "post", return_value="job_id"
+        ) as post:
+            budget = client.token_budget(
+                TokenBudgetPolicy(max_spend=100, cost_per_job=40)
+            )
+            results = client.queue_nodes(nodes, budget=budget)
+            report = budget.report()
+
+        assert post.call_count == 2
+        assert [isinstance(result, Job) for result in results].count(True) == 2
+        assert all(
+            isinstance(result, TokenBudgetExceeded)
+            for result in results
+            if not isinstance(result, Job)
+        )
+        assert report.refused == 3
+
     def test_wait_for_job(self, client: Client, mock_job: Job):
         """
         Verify that the _wait_for_job method pokes the correct endpoint and behaves as expected.
@@ -220,10 +423,7 @@ class TestClientMethods:
             mock_job: A Job instance.
         """
 
-        with mock_core_api(client) as api, patch(
-            "uncertainty_engine.client.STATUS_WAIT_TIME",
-            0.1,  # Reduce wait time for testing
-        ):
+        with mock_core_api(client) as api:
 
             pending = JobInfo(
                 status=JobStatus.PENDING,
@@ -251,12 +451,690 @@ class TestClientMethods:
                 completed.model_dump(),
             )
 
-            response = client._wait_for_job(mock_job)
+            response = client._wait_for_job(mock_job, poll=FixedPoll(0.1))
 
             assert isinstance(response, JobInfo)
             assert response.status == JobStatus.COMPLETED
             assert response.outputs == {"result": 42}
 
+    def test_wait_for_job_uses_poll_strategy(self, client: Client, mock_job: Job):
+        """
+        Verify that _wait_for_job waits as long as its poll strategy says.
+
+        Args:
+            client: A Client instance.
+            mock_job: A Job instance.
+        """
+
+        pending = JobInfo(
+            status=JobStatus.PENDING,
+            message="Job is pending",
+            inputs={},
+            outputs=None,
+        )
+        completed = JobInfo(
+            status=JobStatus.COMPLETED,
+            message="Job completed",
+            inputs={},
+            outputs=None,
+        )
+
+        poll = Mock()
+        poll.delays_for.return_value = iter([1.0, 2.0])
+
+        with mock_core_api(client) as api, patch(
+            "uncertainty_engine.client.sleep"
+        ) as sleep:
+            api.expect_get(
+                f"/nodes/status/{mock_job.node_id}/{mock_job.job_id}",
+                pending.model_dump(),
+                pending.model_dump(),
+                completed.model_dump(),
+            )
+
+            client._wait_for_job(mock_job, poll=poll)
+
+        poll.delays_for.assert_called_once_with(mock_job)
+        assert sleep.call_args_list == [call(1.0), call(2.0)]
+
+    def test_wait_all(self, client: Client):
+        """
+        Verify that wait_all returns results in the order of the jobs given,
+        not the order they finish.
+
+        Args:
+            client: A Client instance.
+        """
+
+        jobs = [Job(node_id="Add", job_id=f"job_{i}") for i in range(3)]
+        checks = {"job_0": 3, "job_1": 1, "job_2": 2}
+
+        def job_status(job: Job, deadline: Deadline | None = None) -> JobInfo:
+            checks[job.job_id] -= 1
+            status = (
+                JobStatus.COMPLETED if not checks[job.job_id] else JobStatus.RUNNING
+            )
+            return JobInfo(
+                status=status, message="", inputs={}, outputs={"id": job.job_id}
+            )
+
+        with patch.object(client, "job_status", side_effect=job_status):
+            results = client.wait_all(jobs, poll=FixedPoll(0.01))
+
+        assert [info.outputs["id"] for info in results] == ["job_0", "job_1", "job_2"]
+        assert all(info.status == JobStatus.COMPLETED for info in results)
+
+    def test_as_completed(self, client: Client):
+        """
+        Verify that as_completed yields each job with its result as it
+        finishes.
+
+        Args:
+            client: A Client instance.
+        """
+
+        slow = Job(node_id="Add", job_id="slow")
+        fast = Job(node_id="Add", job_id="fast")
+        checks = {"slow": 2, "fast": 1}
+
+        def job_status(job: Job, deadline: Deadline | None = None) -> JobInfo:
+            checks[job.job_id] -= 1
+            status = (
+                JobStatus.COMPLETED if not checks[job.job_id] else JobStatus.RUNNING
+            )
+            return JobInfo(status=status, message="", inputs={}, outputs=None)
+
+        with patch.object(client, "job_status", side_effect=job_status):
+            results = list(client.as_completed([slow, fast], poll=FixedPoll(0.05)))
+
+        assert [job for job, _ in results] == [fast, slow]
+
+    def test_submit_node(self, client: Client, mock_job: Job):
+        """
+        Verify that submit_node queues the node and returns a future that
+        resolves once the job finishes.
+
+        Args:
+            client: A Client instance.
+            mock_job: A mock Job instance.
+        """
+
+        completed = JobInfo(
+            status=JobStatus.COMPLETED, message="", inputs={}, outputs={"ans": 3}
+        )
+        running = JobInfo(status=JobStatus.RUNNING, message="", inputs={}, outputs={})
+
+        with patch.object(
+            client, "queue_node", return_value=mock_job
+        ) as queue_node, patch.object(
+            client, "job_status", side_effect=[running, completed]
+        ):
+            future = client.submit_node(
+                "Add", {"lhs": 1, "rhs": 2}, poll=FixedPoll(0.01)
+            )
+            info = future.result(timeout=5)
+
+        client.close()
+
+        assert info == completed
+        assert future.job == mock_job
+        queue_node.assert_called_once_with("Add", {"lhs": 1, "rhs": 2}, deadline=None)
+
+    def test_submit_workflow(self, client: Client, mock_job: Job):
+        """
+        Verify that submit_workflow queues the workflow and returns a future
+        for its result.
+
+        Args:
+            client: A Client instance.
+            mock_job: A mock Job instance.
+        """
+
+        completed = JobInfo(status=JobStatus.COMPLETED, message="", inputs={})
+
+        with patch.object(
+            client, "queue_workflow", return_value=mock_job
+        ) as queue_workflow, patch.object(client, "job_status", return_value=completed):
+            future = client.submit_workflow("project_id", "workflow_id")
+            info = future.result(timeout=5)
+
+        client.close()
+
+        assert info == completed
+        queue_workflow.assert_called_once_with(
+            "project_id", "workflow_id", None, None, deadline=None
+        )
+
+    def test_job_future_cancel(self, client: Client, mock_job: Job):
+        """
+        Verify that cancelling a job future cancels the job.
+
+        Args:
+            client: A Client instance.
+            mock_job: A mock Job instance.
+        """
+
+        running = JobInfo(status=JobStatus.RUNNING, message="", inputs={})
+
+        with patch.object(client, "job_status", return_value=running), patch.object(
+            client, "cancel_job", return_value=True
+        ) as cancel_job:
+            future = client.job_future(mock_job, poll=FixedPoll(60))
+
+            assert future.cancel()
+
+        client.close()
+
+        cancel_job.assert_called_once_with(mock_job)
+        assert future.cancelled()
+
+    def test_close_stops_job_futures(self, client: Client, mock_job: Job):
+        """
+        Verify that closing the client fails futures that haven't resolved.
+
+        Args:
+            client: A Client instance.
+            mock_job: A mock Job instance.
+        """
+
+        running = JobInfo(status=JobStatus.RUNNING, message="", inputs={})
+
+        with patch.object(client, "job_status", return_value=running):
+            future = client.job_future(mock_job, poll=FixedPoll(60))
+            client.close()
+
+        with pytest.raises(RuntimeError):
+            future.result(timeout=5)
+
+    def test_map_ordered(self, client: Client):
+        """
+        Verify that map with `ordered=True` yields results in input order.
+
+        Args:
+            client: A Client instance.
+        """
+
+        # Later items finish first.
+        checks = {f"job_{i}": 4 - i for i in range(4)}
+
+        def queue_node(
+            name: str,
+            inputs: dict,
+            deadline: Deadline | None,
+            budget: TokenBudget | None,
+        ) -> Job:
+            return Job(node_id=name, job_id=f"job_{inputs['lhs']}")
+
+        def job_status(job: Job, deadline: Deadline | None = None) -> JobInfo:
+            checks[job.job_id] -= 1
+            status = (
+                JobStatus.COMPLETED if not checks[job.job_id] else JobStatus.RUNNING
+            )
+            return JobInfo(status=status, message=job.job_id, inputs={})
+
+        with patch.object(client, "queue_node", side_effect=queue_node), patch.object(
+            client, "job_status", side_effect=job_status
+        ):
+            results = list(
+                client.map(
+                    lambda i: ("Add", {"lhs": i, "rhs": 1}),
+                    range(4),
+                    ordered=True,
+                    poll=FixedPoll(0.01),
+                )
+            )
+
+        client.close()
+
+        assert [info.message for info in results] == [
+            "job_0",
+            "job_1",
+            "job_2",
+            "job_3",
+        ]
+
+    def test_map_retry(self, client: Client):
+        """
+        Verify that map queues jobs that fail with a transient error again
+        and yields their last attempt.
+
+        Args:
+            client: A Client instance.
+        """
+
+        failed = JobInfo(status=JobStatus.FAILED, message="Timed out", inputs={})
+        completed = JobInfo(status=JobStatus.COMPLETED, message="", inputs={})
+
+        def job_status(job: Job, deadline: Deadline | None = None) -> JobInfo:
+            return failed if job.job_id == "first" else completed
+
+        with patch.object(
+            client,
+            "queue_node",
+            side_effect=[
+                Job(node_id="Add", job_id="first"),
+                Job(node_id="Add", job_id="second"),
+            ],
+        ) as queue_node, patch.object(client, "job_status", side_effect=job_status):
+            results = list(
+                client.map(
+                    lambda i: ("Add", {"lhs": i, "rhs": 1}),
+                    range(1),
+                    poll=FixedPoll(0.01),
+                    retry=JobRetryPolicy(backoff_base=0.01),
+                )
+            )
+
+        client.close()
+
+        assert results == [completed]
+        assert queue_node.call_count == 2
+
+    def test_map_budget(self, client: Client):
+        """
+        Verify that map finishes the jobs its token budget allowed before
+        raising TokenBudgetExceeded.
+
+        Args:
+            client: A Client instance.
+        """
+
+        completed = JobInfo(status=JobStatus.COMPLETED, message="", inputs={})
+        results = []
+
+        with patch.object(client, "view_tokens", return_value=1000), patch.object(
+            client.core_api, "post", return_value="job_id"
+        ), patch.object(client, "job_status", return_value=completed):
+            budget = client.token_budget(
+                TokenBudgetPolicy(max_spend=10, cost_per_job=5)
+            )
+            with pytest.raises(TokenBudgetExceeded):
+                for info in client.map(
+                    lambda i: ("Add", {"lhs": i, "rhs": 1}),
+                    range(5),
+                    poll=FixedPoll(0.01),
+                    budget=budget,
+                ):
+                    results.append(info)
+
+        client.close()
+
+        assert len(results) == 2
+
+    def test_budget_not_used_by_memo_hits(self, client: Client):
+        """
+        Verify that nodes the memo already holds aren't counted against a
+        token budget, since nothing is queued for them.
+
+        Args:
+            client: A Client instance.
+        """
+
+        completed = JobInfo(status=JobStatus.COMPLETED, message="", inputs={})
+
+        with mock_core_api(client) as api, patch.object(
+            client, "memo", NodeMemo(nodes={"Add"})
+        ), patch.object(client, "view_tokens", return_value=1000):
+            api.expect_post("/nodes/queue", response="job_1")
+            api.expect_get("/nodes/status/Add/job_1", completed.model_dump())
+            client.run_node("Add", {"lhs": 1})
+
+            budget = client.token_budget()
+            jobs = client.queue_nodes([("Add", {"lhs": 1})] * 3, budget=budget)
+
+        assert jobs == [Job(node_id="Add", job_id="job_1")] * 3
+        assert budget.report().submitted == 0
+
+    @pytest.mark.parametrize("max_in_flight", [0, -1])
+    def test_map_invalid_max_in_flight(self, client: Client, max_in_flight: int):
+        """
+        Verify that map rejects a `max_in_flight` below 1 when called.
+
+        Args:
+            client: A Client instance.
+            max_in_flight: An invalid limit.
+        """
+
+        with pytest.raises(ValueError, match="max_in_flight"):
+            client.map(lambda i: ("Add", {"lhs": i}), range(3), max_in_flight)
+
+    def test_map_cancel_failure(self, client: Client):
+        """
+        Verify that a failed cancel while map cleans up doesn't hide the
+        original error or stop the other jobs being cancelled.
+
+        Args:
+            client: A Client instance.
+        """
+
+        running = JobInfo(status=JobStatus.RUNNING, message="", inputs={})
+
+        def node_factory(i: int) -> tuple[str, dict]:
+            if i == 2:
+                raise KeyError("bad item")
+
+            return "Add", {"lhs": i}
+
+        def queue_node(
+            name: str,
+            inputs: dict,
+            deadline: Deadline | None,
+            budget: TokenBudget | None,
+        ) -> Job:
+            return Job(node_id=name, job_id=f"job_{inputs['lhs']}")
+
+        with patch.object(client, "queue_node", side_effect=queue_node), patch.object(
+            client, "job_status", return_value=running
+        ), patch.object(
+            client, "cancel_job", side_effect=[RuntimeError("cancel failed"), True]
+        ) as cancel_job:
+            with pytest.raises(KeyError, match="bad item"):
+                list(client.map(node_factory, range(4), poll=FixedPoll(60)))
+
+        client.close()
+
+        assert cancel_job.call_count == 2
+
+    def test_map_unordered(self, client: Client):
+        """
+        Verify that map yields results as jobs finish by default.
+
+        Args:
+            client: A Client instance.
+        """
+
+        checks = {"job_0": 5, "job_1": 1}
+
+        def queue_node(
+            name: str,
+            inputs: dict,
+            deadline: Deadline | None,
+            budget: TokenBudget | None,
+        ) -> Job:
+            return Job(node_id=name, job_id=f"job_{inputs['lhs']}")
+
+        def job_status(job: Job, deadline: Deadline | None = None) -> JobInfo:
+            checks[job.job_id] -= 1
+            status = (
+                JobStatus.COMPLETED if not checks[job.job_id] else JobStatus.RUNNING
+            )
+            return JobInfo(status=status, message=job.job_id, inputs={})
+
+        with patch.object(client, "queue_node", side_effect=queue_node), patch.object(
+            client, "job_status", side_effect=job_status
+        ):
+            results = list(
+                client.map(
+                    lambda i: ("Add", {"lhs": i, "rhs": 1}),
+                    range(2),
+                    poll=FixedPoll(0.01),
+                )
+            )
+
+        client.close()
+
+        assert [info.message for info in results] == ["job_1", "job_0"]
+
+    def test_map_backpressure(self, client: Client):
+        """
+        Verify that map pulls inputs lazily, keeps no more than
+        `max_in_flight` jobs queued and cancels running jobs when closed
+        early.
+
+        Args:
+            client: A Client instance.
+        """
+
+        pulled = 0
+
+        def inputs() -> Iterator[int]:
+            nonlocal pulled
+            while True:
+                pulled += 1
+                yield pulled
+
+        def queue_node(
+            name: str,
+            inputs: dict,
+            deadline: Deadline | None,
+            budget: TokenBudget | None,
+        ) -> Job:
+            return Job(node_id=name, job_id=f"job_{inputs['lhs']}")
+
+        def job_status(job: Job, deadline: Deadline | None = None) -> JobInfo:
+            # Only odd jobs finish.
+            done = int(job.job_id.split("_")[1]) % 2
+            status = JobStatus.COMPLETED if done else JobStatus.RUNNING
+            return JobInfo(status=status, message=job.job_id, inputs={})
+
+        with patch.object(client, "queue_node", side_effect=queue_node), patch.object(
+            client, "job_status", side_effect=job_status
+        ), patch.object(client, "cancel_job", return_value=True) as cancel_job:
+            results = client.map(
+                lambda i: ("Add", {"lhs": i, "rhs": 1}),
+                inputs(),
+                max_in_flight=4,
+                poll=FixedPoll(0.01),
+            )
+            first = list(islice(results, 3))
+            results.close()
+
+        client.close()
+
+        assert len(first) == 3
+        # Never more than `max_in_flight` items pulled beyond those consumed.
+        assert pulled <= len(first) + 4
+        # The even jobs never finish and are cancelled.
+        assert cancel_job.call_count == pulled - len(first)
+
+    def test_queue_node_journal(self, client: Client, tmp_path: Path):
+        """
+        Verify that a client with a journal records queued nodes and doesn't
+        queue the same inputs twice.
+
+        Args:
+            client: A Client instance.
+            tmp_path: Temporary directory for the journal.
+        """
+
+        with mock_core_api(client) as api, patch.object(
+            client, "journal", JobJournal(tmp_path)
+        ):
+            api.expect_post(
+                "/nodes/queue",
+                expect_body={"node_id": "Add", "inputs": {"lhs": 1, "rhs": 2}},
+                response="job_1",
+            )
+
+            first = client.queue_node("Add", {"lhs": 1, "rhs": 2})
+            second = client.queue_node("Add", {"rhs": 2, "lhs": 1})
+
+            assert client.journal.unfinished() == [first]
+
+        assert first == second == Job(node_id="Add", job_id="job_1")
+
+    def test_job_status_journal(self, client: Client, tmp_path: Path):
+        """
+        Verify that job_status records jobs that finish in the journal.
+
+        Args:
+            client: A Client instance.
+            tmp_path: Temporary directory for the journal.
+        """
+
+        journal = JobJournal(tmp_path)
+        running = Job(node_id="Add", job_id="running")
+        completed = Job(node_id="Add", job_id="completed")
+        journal.record(running, "running")
+        journal.record(completed, "completed")
+
+        with mock_core_api(client) as api, patch.object(client, "journal", journal):
+            api.expect_get(
+                "/nodes/status/Add/running",
+                JobInfo(status=JobStatus.RUNNING, message="", inputs={}).model_dump(),
+            )
+            api.expect_get(
+                "/nodes/status/Add/completed",
+                JobInfo(status=JobStatus.COMPLETED, message="", inputs={}).model_dump(),
+            )
+
+            client.job_status(running)
+            client.job_status(completed)
+
+        assert journal.unfinished() == [running]
+
+    def test_job_status_cache(self, client: Client, mock_job: Job):
+        """
+        Verify that job_status serves finished jobs from the cache and
+        always fetches unfinished ones.
+
+        Args:
+            client: A Client instance.
+            mock_job: A Job instance.
+        """
+
+        cache = JobInfoCache()
+        running = JobInfo(status=JobStatus.RUNNING, message="", inputs={})
+        completed = JobInfo(status=JobStatus.COMPLETED, message="", inputs={})
+
+        with mock_core_api(client) as api, patch.object(client, "job_cache", cache):
+            api.expect_get(
+                f"/nodes/status/{mock_job.node_id}/{mock_job.job_id}",
+                running.model_dump(),
+                completed.model_dump(),
+            )
+
+            assert client.job_status(mock_job) == running
+            assert client.job_status(mock_job) == completed
+            assert client.job_status(mock_job) == completed
+
+        assert cache.stats.hits == 1
+        assert cache.stats.misses == 2
+
+    def test_run_node_memo(self, client: Client):
+        """
+        Verify that a client with a memo runs an allowed node once per set of
+        inputs and reuses its result.
+
+        Args:
+            client: A Client instance.
+        """
+
+        completed = JobInfo(
+            status=JobStatus.COMPLETED, message="", inputs={}, outputs={"ans": 3}
+        )
+
+        with mock_core_api(client) as api, patch.object(
+            client, "memo", NodeMemo(nodes={"Add"})
+        ):
+            api.expect_post(
+                "/nodes/queue",
+                expect_body={"node_id": "Add", "inputs": {"lhs": 1, "rhs": 2}},
+                response="job_1",
+            )
+            api.expect_get("/nodes/status/Add/job_1", completed.model_dump())
+
+            first = client.run_node("Add", {"lhs": 1, "rhs": 2})
+            second = client.run_node("Add", {"rhs": 2, "lhs": 1})
+            job = client.queue_node("Add", {"lhs": 1, "rhs": 2})
+
+            assert client.memo.stats.hits == 2
+
+        assert first == second == completed
+        assert job == Job(node_id="Add", job_id="job_1")
+
+    def test_memoised_jobs_not_polled(self, client: Client):
+        """
+        Verify that every way of waiting for a job the memo handed back gets
+        its result without a status request.
+
+        Args:
+            client: A Client instance.
+        """
+
+        completed = JobInfo(
+            status=JobStatus.COMPLETED, message="", inputs={}, outputs={"ans": 3}
+        )
+
+        with mock_core_api(client) as api, patch.object(
+            client, "memo", NodeMemo(nodes={"Add"})
+        ):
+            api.expect_post(
+                "/nodes/queue",
+                expect_body={"node_id": "Add", "inputs": {"lhs": 1, "rhs": 2}},
+                response="job_1",
+            )
+            api.expect_get("/nodes/status/Add/job_1", completed.model_dump())
+
+            client.run_node("Add", {"lhs": 1, "rhs": 2})
+
+            job = client.queue_node("Add", {"lhs": 1, "rhs": 2})
+            waited = client.wait_all([job])
+            future = client.submit_node("Add", {"lhs": 1, "rhs": 2})
+            mapped = list(client.map(lambda _: ("Add", {"lhs": 1, "rhs": 2}), [0]))
+
+            assert future.result(timeout=5) == completed
+
+        client.close()
+
+        assert waited == mapped == [completed]
+
+    def test_run_node_durations(self, client: Client):
+        """
+        Verify that a client with a duration history records how long each
+        node version takes to complete.
+
+        Args:
+            client: A Client instance.
+        """
+
+        completed = JobInfo(status=JobStatus.COMPLETED, message="", inputs={})
+        node = Node("Add", version="0.2.0", lhs=1, rhs=2)
+
+        with mock_core_api(client) as api, patch.object(
+            client, "durations", DurationHistory()
+        ):
+            api.expect_post("/nodes/queue", response="job_1")
+            api.expect_get("/nodes/status/Add/job_1", completed.model_dump())
+
+            client.run_node(node)
+
+            assert client.durations.percentile("Add@0.2.0") is not None
+            assert client.durations.percentile("Add") is None
+
+    def test_resume(self, client: Client, tmp_path: Path):
+        """
+        Verify that resume returns futures for unfinished jobs and adopts the
+        journal.
+
+        Args:
+            client: A Client instance.
+            tmp_path: Temporary directory for the journal.
+        """
+
+        journal = JobJournal(tmp_path)
+        done = Job(node_id="Add", job_id="done")
+        pending = Job(node_id="Add", job_id="pending")
+        journal.record(done, "done")
+        journal.record(pending, "pending")
+        journal.mark_finished(done, JobStatus.COMPLETED)
+
+        completed = JobInfo(status=JobStatus.COMPLETED, message="", inputs={})
+
+        with patch.object(
+            client, "job_status", return_value=completed
+        ) as job_status, patch.object(client, "journal", None):
+            futures = client.resume(journal, poll=FixedPoll(0.01))
+            results = [future.result(timeout=5) for future in futures]
+
+            assert client.journal is journal
+
+        client.close()
+
+        assert [future.job for future in futures] == [pending]
+        assert results == [completed]
+        job_status.assert_called_once_with(pending, deadline=None)
+
     def test_wait_for_job_invalid_status(self, client: Client, mock_job: Job):
         """
         Verify that the _wait_for_job raises an error if the status is invalid.
@@ -275,6 +1153,294 @@ class TestClientMethods:
             with pytest.raises(ValueError):
                 client._wait_for_job(mock_job)
 
+    def test_wait_for_job_deadline(self, client: Client, mock_job: Job):
+        """
+        Verify that _wait_for_job gives up once the deadline passes.
+
+        Args:
+            client: A Client instance.
+            mock_job: A Job instance.
+        """
+
+        pending = JobInfo(
+            status=JobStatus.PENDING,
+            message="Job is pending",
+            inputs={},
+            outputs=None,
+        )
+
+        with mock_core_api(client) as api:
+            api.expect_get(
+                f"/nodes/status/{mock_job.node_id}/{mock_job.job_id}",
+                *[pending.model_dump()] * 5,
+            )
+
+            with pytest.raises(DeadlineExceeded):
+                client._wait_for_job(
+                    mock_job,
+                    deadline=0.15,
+                    poll=FixedPoll(0.1),
+                )
+
+    def test_run_node_timeout_cancels_job(self, client: Client, mock_job: Job):
+        """
+        Verify that run_node cancels a job that doesn't finish within the
+        timeout and confirms it was cancelled.
+
+        Args:
+            client: A Client instance.
+            mock_job: A Job instance.
+        """
+
+        running = JobInfo(status=JobStatus.RUNNING, message="", inputs={})
+        cancelled = JobInfo(status=JobStatus.CANCELLED, message="", inputs={})
+        statuses = [running] * 3
+
+        def job_status(job: Job, deadline: Deadline | None = None) -> JobInfo:
+            return statuses.pop(0) if statuses else cancelled
+
+        with patch.object(client, "queue_node", return_value=mock_job), patch.object(
+            client, "job_status", side_effect=job_status
+        ), patch.object(client, "cancel_job", return_value=True) as cancel_job, patch(
+            "uncertainty_engine.client.CANCEL_CONFIRM_INTERVAL", 0.01
+        ):
+            with pytest.raises(JobTimeoutError) as error:
+                client.run_node(
+                    "Add",
+                    {"lhs": 1, "rhs": 2},
+                    poll=FixedPoll(0.05),
+                    timeout=0.12,
+                    cancel_on_timeout=True,
+                )
+
+        cancel_job.assert_called_once_with(mock_job)
+        assert error.value.job_ids == [mock_job.job_id]
+        assert error.value.cancelled == [mock_job.job_id]
+        assert isinstance(error.value, DeadlineExceeded)
+
+    def test_run_node_timeout_without_cancel(self, client: Client, mock_job: Job):
+        """
+        Verify that run_node leaves a timed-out job running unless asked to
+        cancel it.
+
+        Args:
+            client: A Client instance.
+            mock_job: A Job instance.
+        """
+
+        running = JobInfo(status=JobStatus.RUNNING, message="", inputs={})
+
+        with patch.object(client, "queue_node", return_value=mock_job), patch.object(
+            client, "job_status", return_value=running
+        ), patch.object(client, "cancel_job") as cancel_job:
+            with pytest.raises(JobTimeoutError) as error:
+                client.run_node("Add", {}, poll=FixedPoll(0.05), timeout=0.1)
+
+        cancel_job.assert_not_called()
+        assert error.value.cancelled == []
+
+    def test_wait_all_timeout_cancels_unfinished_jobs(self, client: Client):
+        """
+        Verify that wait_all cancels only the jobs still running when the
+        timeout passes.
+
+        Args:
+            client: A Client instance.
+        """
+
+        done = Job(node_id="Add", job_id="done")
+        stuck = Job(node_id="Add", job_id="stuck")
+        cancel_requested = False
+
+        def job_status(job: Job, deadline: Deadline | None = None) -> JobInfo:
+            if job == done:
+                status = JobStatus.COMPLETED
+            elif cancel_requested:
+                status = JobStatus.CANCELLED
+            else:
+                status = JobStatus.RUNNING
+            return JobInfo(status=status, message="", inputs={})
+
+        def cancel_job(job: Job) -> bool:
+            nonlocal cancel_requested
+            cancel_requested = True
+            return True
+
+        with patch.object(client, "job_status", side_effect=job_status), patch.object(
+            client, "cancel_job", side_effect=cancel_job
+        ) as cancel, patch("uncertainty_engine.client.CANCEL_CONFIRM_INTERVAL", 0.01):
+            with pytest.raises(JobTimeoutError) as error:
+                client.wait_all(
+                    [done, stuck],
+                    poll=FixedPoll(0.02),
+                    timeout=0.1,
+                    cancel_on_timeout=True,
+                )
+
+        cancel.assert_called_once_with(stuck)
+        assert error.value.job_ids == ["stuck"]
+        assert error.value.cancelled == ["stuck"]
+
+    def test_wait_all_hedges_stragglers(self, client: Client):
+        """
+        Verify that wait_all resubmits a straggler with the same inputs,
+        returns the copy that finishes first and cancels the other.
+
+        Args:
+            client: A Client instance.
+        """
+
+        jobs = [Job(node_id="Add", job_id=f"job_{i}") for i in range(6)]
+        hedge = Job(node_id="Add", job_id="hedge")
+
+        def job_status(job: Job, deadline: Deadline | None = None) -> JobInfo:
+            status = JobStatus.RUNNING if job == jobs[0] else JobStatus.COMPLETED
+            return JobInfo(status=status, message=job.job_id, inputs={"lhs": 1})
+
+        with patch.object(client, "job_status", side_effect=job_status), patch.object(
+            client, "queue_node", return_value=hedge
+        ) as queue_node, patch.object(client, "cancel_job") as cancel_job:
+            results = client.wait_all(
+                jobs,
+                poll=FixedPoll(0.01),
+                hedge=HedgePolicy(min_peers=5),
+            )
+
+        queue_node.assert_called_once_with("Add", {"lhs": 1})
+        cancel_job.assert_called_once_with(jobs[0])
+        assert results[0].message == "hedge"
+
+    def test_run_node_retries_transient_failures(self, client: Client):
+        """
+        Verify that run_node queues a node again when it fails with a
+        transient error, but not when its inputs are at fault.
+
+        Args:
+            client: A Client instance.
+        """
+
+        jobs = [Job(node_id="Add", job_id=f"job_{i}") for i in range(3)]
+        infos = [
+            JobInfo(status=JobStatus.FAILED, message="Timed out", inputs={}),
+            JobInfo(status=JobStatus.FAILED, message="Bad input", inputs={}),
+        ]
+        node = Node("Add", "0.2.0", lhs=1)
+
+        with patch.object(
+            client, "queue_node", side_effect=jobs
+        ) as queue_node, patch.object(
+            client, "_wait_for_job", side_effect=infos
+        ), patch(
+            "uncertainty_engine.client.sleep"
+        ) as sleep:
+            info = client.run_node(node, retry=JobRetryPolicy(max_attempts=3))
+
+        assert info == infos[1]
+        assert sleep.call_count == 1
+
+        # The retry is queued from the node, not the inputs the server sent.
+        assert queue_node.call_args_list == [call(node, None, deadline=None)] * 2
+
+    def test_gather_reports_attempts(self, client: Client):
+        """
+        Verify that gather requeues jobs that fail transiently and reports
+        every attempt.
+
+        Args:
+            client: A Client instance.
+        """
+
+        jobs = [Job(node_id="Add", job_id="ok"), Job(node_id="Add", job_id="flaky")]
+        retry = Job(node_id="Add", job_id="retry")
+
+        def job_status(job: Job, deadline: Deadline | None = None) -> JobInfo:
+            if job.job_id == "flaky":
+                status, message = JobStatus.FAILED, "Service unavailable"
+            else:
+                status, message = JobStatus.COMPLETED, job.job_id
+
+            return JobInfo(status=status, message=message, inputs={"lhs": 1})
+
+        with patch.object(client, "job_status", side_effect=job_status), patch.object(
+            client, "queue_node", return_value=retry
+        ) as queue_node:
+            outcomes = client.gather(
+                jobs,
+                retry=JobRetryPolicy(backoff_base=0.01),
+                poll=FixedPoll(0.01),
+            )
+
+        queue_node.assert_called_once_with("Add", {"lhs": 1})
+        assert [len(outcome.attempts) for outcome in outcomes] == [1, 2]
+        assert outcomes[1].info.message == "retry"
+        assert outcomes[1].attempts[0].info.message == "Service unavailable"
+
+    def test_cancel_jobs(self, client: Client):
+        """
+        Verify that cancel_jobs returns a result or error for each job in
+        order.
+
+        Args:
+            client: A Client instance.
+        """
+
+        jobs = [Job(node_id="Add", job_id=f"job_{i}") for i in range(3)]
+
+        def cancel_job(job: Job) -> bool:
+            if job.job_id == "job_1":
+                raise HTTPError("404 Not Found")
+            return job.job_id == "job_0"
+
+        with patch.object(client, "cancel_job", side_effect=cancel_job):
+            results = client.cancel_jobs(jobs)
+
+        assert results[0] is True
+        assert isinstance(results[1], HTTPError)
+        assert results[2] is False
+
+    def test_watch(self, client: Client, mock_job: Job):
+        """
+        Verify that watch yields a job's info only when its status or message
+        changes.
+
+        Args:
+            client: A Client instance.
+            mock_job: A Job instance.
+        """
+
+        pending = JobInfo(status=JobStatus.PENDING, message="Queued", inputs={})
+        running = JobInfo(status=JobStatus.RUNNING, message="Step 1", inputs={})
+        running_2 = JobInfo(status=JobStatus.RUNNING, message="Step 2", inputs={})
+        completed = JobInfo(status=JobStatus.COMPLETED, message="Done", inputs={})
+
+        with patch.object(
+            client,
+            "job_status",
+            side_effect=[pending, pending, running, running, running_2, completed],
+        ) as job_status:
+            updates = list(client.watch(mock_job, poll=FixedPoll(0.01)))
+
+        assert updates == [pending, running, running_2, completed]
+        assert job_status.call_count == 6
+
+    def test_watch_deadline(self, client: Client, mock_job: Job):
+        """
+        Verify that watch raises a JobTimeoutError once the deadline passes.
+
+        Args:
+            client: A Client instance.
+            mock_job: A Job instance.
+        """
+
+        running = JobInfo(status=JobStatus.RUNNING, message="", inputs={})
+
+        with patch.object(client, "job_status", return_value=running):
+            updates = client.watch(mock_job, deadline=0.1, poll=FixedPoll(0.02))
+
+            assert next(updates) == running
+            with pytest.raises(JobTimeoutError):
+                next(updates)
+
     def test_run_node(self, client: Client, mock_job: Job):
         """
         Verify that the run_node method queues a node and waits for it to complete.
@@ -298,8 +1464,16 @@ class TestClientMethods:
 
             client.run_node(node="node_a", inputs={"key": "value"})
 
-            mock_queue_node.assert_called_once_with("node_a", {"key": "value"})
-            mock_wait_for_job.assert_called_once_with(mock_job)
+            mock_queue_node.assert_called_once_with(
+                "node_a", {"key": "value"}, deadline=None
+            )
+            mock_wait_for_job.assert_called_once_with(
+                mock_job,
+                deadline=None,
+                poll=None,
+                timeout=None,
+                cancel_on_timeout=False,
+            )
 
     def test_view_tokens(self, client: Client) -> None:
         """
@@ -536,9 +1710,15 @@ class TestClientMethods:
             result = client.run_workflow(project_id=project_id, workflow_id=workflow_id)
 
             mock_queue_workflow.assert_called_once_with(
-                project_id, workflow_id, None, None
+                project_id, workflow_id, None, None, deadline=None
+            )
+            mock_wait_for_job.assert_called_once_with(
+                mock_job,
+                deadline=None,
+                poll=None,
+                timeout=None,
+                cancel_on_timeout=False,
             )
-            mock_wait_for_job.assert_called_once_with(mock_job)
             assert result.status == JobStatus.COMPLETED
             assert result.outputs == {"result": 42}
 
@@ -578,9 +1758,15 @@ class TestClientMethods:
             )
 
             mock_queue_workflow.assert_called_once_with(
-                project_id, workflow_id, override_inputs, None
+                project_id, workflow_id, override_inputs, None, deadline=None
+            )
+            mock_wait_for_job.assert_called_once_with(
+                mock_job,
+                deadline=None,
+                poll=None,
+                timeout=None,
+                cancel_on_timeout=False,
             )
-            mock_wait_for_job.assert_called_once_with(mock_job)
             assert result.status == JobStatus.COMPLETED
 
     def test_run_workflow_with_outputs(self, client: Client):
@@ -619,9 +1805,15 @@ class TestClientMethods:
             )
 
             mock_queue_workflow.assert_called_once_with(
-                project_id, workflow_id, None, override_outputs
+                project_id, workflow_id, None, override_outputs, deadline=None
+            )
+            mock_wait_for_job.assert_called_once_with(
+                mock_job,
+                deadline=None,
+                poll=None,
+                timeout=None,
+                cancel_on_timeout=False,
             )
-            mock_wait_for_job.assert_called_once_with(mock_job)
             assert result.status == JobStatus.COMPLETED
 
     def test_run_workflow_with_inputs_and_outputs(self, client: Client):
@@ -670,9 +1862,19 @@ class TestClientMethods:
             )
 
             mock_queue_workflow.assert_called_once_with(
-                project_id, workflow_id, override_inputs, override_outputs
+                project_id,
+                workflow_id,
+                override_inputs,
+                override_outputs,
+                deadline=None,
+            )
+            mock_wait_for_job.assert_called_once_with(
+                mock_job,
+                deadline=None,
+                poll=None,
+                timeout=None,
+                cancel_on_timeout=False,
             )
-            mock_wait_for_job.assert_called_once_with(mock_job)
             assert result.status == JobStatus.COMPLETED
 
     def test_queue_workflow_with_dict_inputs_deprecation(self, client: Client):
@@ -197,3 +197,15 @@ def test_is_expired_invalid_token(
     with pytest.raises(Exception) as excinfo:
         token.is_expired
     assert "Invalid token: Token did not include an expiry time" in str(excinfo.value)
+
+
+def test_expires_within(monkeypatch: MonkeyPatch, token: CognitoToken) -> None:
+    monkeypatch.setattr(
+        CognitoToken,
+        "decoded_payload",
+        {
+            "exp": int(time.time()) + 30,
+        },
+    )
+    assert token.expires_within(60) is True
+    assert token.expires_within(10) is False
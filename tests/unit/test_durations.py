@@ -0,0 +1,132 @@
+from pathlib import Path
+from unittest.mock import patch
+
+from pytest import approx, fixture
+from uncertainty_engine_types import JobInfo, JobStatus
+
+from uncertainty_engine.durations import DurationHistory, node_key, percentile
+from uncertainty_engine.job import Job
+
+TIME_TARGET = "uncertainty_engine.durations.time"
+
+
+def make_info(status: JobStatus) -> JobInfo:
+    return JobInfo(status=status, message="", inputs={})
+
+
+@fixture
+def history() -> DurationHistory:
+    return DurationHistory(max_samples=3)
+
+
+def test_node_key() -> None:
+    assert node_key("TrainModel", "0.3.0") == "TrainModel@0.3.0"
+    assert node_key("TrainModel") == "TrainModel"
+
+
+def test_percentile() -> None:
+    values = [1.0, 2.0, 3.0, 4.0, 5.0]
+
+    assert percentile(values, 0) == 1
+    assert percentile(values, 50) == 3
+    assert percentile(values, 90) == approx(4.6)
+    assert percentile(values, 100) == 5
+    assert percentile([7.0], 99) == 7
+
+
+def test_records_completed_job_duration(history: DurationHistory) -> None:
+    job = Job(node_id="Add", job_id="job_1")
+
+    with patch(TIME_TARGET, return_value=100.0):
+        history.queued(job, "Add@0.2.0")
+
+    with patch(TIME_TARGET, return_value=112.5):
+        history.finished(job, make_info(JobStatus.RUNNING))
+        history.finished(job, make_info(JobStatus.COMPLETED))
+
+    assert history.percentile("Add@0.2.0") == 12.5
+
+
+def test_completion_taken_as_midway_between_checks(
+    history: DurationHistory,
+) -> None:
+    job = Job(node_id="Add", job_id="job_1")
+
+    with patch(TIME_TARGET, return_value=100.0):
+        history.queued(job)
+
+    with patch(TIME_TARGET, return_value=110.0):
+        history.finished(job, make_info(JobStatus.RUNNING))
+
+    with patch(TIME_TARGET, return_value=130.0):
+        history.finished(job, make_info(JobStatus.COMPLETED))
+
+    assert history.percentile("Add") == 20
+
+
+def test_forgets_oldest_unfinished_jobs() -> None:
+    history = DurationHistory(max_queued=2)
+    jobs = [Job(node_id="Add", job_id=f"job_{i}") for i in range(3)]
+
+    with patch(TIME_TARGET, return_value=0.0):
+        for job in jobs:
+            history.queued(job)
+
+    with patch(TIME_TARGET, return_value=10.0):
+        for job in jobs:
+            history.finished(job, make_info(JobStatus.COMPLETED))
+
+    # The first job was forgotten, so only the other two were recorded.
+    assert list(history._samples["Add"]) == [5, 5]
+
+
+def test_ignores_failed_and_untracked_jobs(history: DurationHistory) -> None:
+    failed = Job(node_id="Add", job_id="failed")
+    history.queued(failed)
+    history.finished(failed, make_info(JobStatus.FAILED))
+
+    history.finished(Job(node_id="Add", job_id="other"), make_info(JobStatus.COMPLETED))
+
+    assert history.percentile("Add") is None
+
+
+def test_keeps_latest_samples(history: DurationHistory) -> None:
+    for duration in [100.0, 1.0, 2.0, 3.0]:
+        history.record("Add", duration)
+
+    assert history.percentile("Add", 100) == 3
+
+
+def test_remaining_and_eta(history: DurationHistory) -> None:
+    history.record("Add", 10.0)
+    history.record("TrainModel", 100.0)
+
+    add = Job(node_id="Add", job_id="add")
+    train = Job(node_id="TrainModel", job_id="train")
+    unknown = Job(node_id="Multiply", job_id="unknown")
+
+    with patch(TIME_TARGET, return_value=0.0):
+        history.queued(add)
+        history.queued(train)
+
+    with patch(TIME_TARGET, return_value=20.0):
+        assert history.remaining(add) == 0
+        assert history.remaining(train) == 80
+        assert history.eta([add, train]) == 80
+
+        history.finished(train, make_info(JobStatus.COMPLETED))
+        assert history.eta([add, train]) == 0
+
+        history.queued(unknown)
+        assert history.remaining(unknown) is None
+        assert history.eta([add, unknown]) is None
+
+
+def test_persists_durations(tmp_path: Path) -> None:
+    with DurationHistory(max_samples=2, directory=tmp_path) as history:
+        for duration in [1.0, 2.0, 3.0]:
+            history.record("Add", duration)
+
+    with DurationHistory(max_samples=2, directory=tmp_path) as history:
+        assert history.percentile("Add", 0) == 2
+        assert history.percentile("Add", 100) == 3
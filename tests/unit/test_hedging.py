@@ -0,0 +1,154 @@
+from unittest.mock import Mock
+
+from pytest import fixture
+from uncertainty_engine_types import JobInfo, JobStatus
+
+from uncertainty_engine.hedging import HedgePolicy, Hedger
+from uncertainty_engine.job import Job
+
+INPUTS = {"lhs": 1, "rhs": 2}
+
+RUNNING = JobInfo(status=JobStatus.RUNNING, message="", inputs=INPUTS)
+COMPLETED = JobInfo(status=JobStatus.COMPLETED, message="", inputs=INPUTS)
+FAILED = JobInfo(status=JobStatus.FAILED, message="", inputs=INPUTS)
+
+STRAGGLER = Job(node_id="Add", job_id="straggler")
+HEDGE = Job(node_id="Add", job_id="hedge")
+
+
+def make_hedger(batch_size: int = 10, **policy: object) -> Hedger:
+    return Hedger(
+        HedgePolicy(min_peers=2, percentile=50, **policy),
+        batch_size,
+        queue=Mock(return_value=HEDGE),
+        cancel=Mock(),
+        tokens=Mock(return_value=100),
+    )
+
+
+def finish_peers(hedger: Hedger, *durations: float) -> None:
+    for slot, duration in enumerate(durations, start=1):
+        job = Job(node_id="Add", job_id=f"peer_{slot}")
+        hedger.finished(slot, job, COMPLETED, duration)
+
+
+@fixture
+def hedger() -> Hedger:
+    return make_hedger()
+
+
+def test_waits_for_peers(hedger: Hedger) -> None:
+    finish_peers(hedger, 1.0)
+
+    assert hedger.check(0, STRAGGLER, RUNNING, 100.0) is None
+    hedger.queue.assert_not_called()
+
+
+def test_hedges_stragglers(hedger: Hedger) -> None:
+    finish_peers(hedger, 1.0, 3.0)
+
+    assert hedger.check(0, STRAGGLER, RUNNING, 2.0) is None
+    assert hedger.check(0, STRAGGLER, RUNNING, 2.5) == HEDGE
+    assert hedger.check(0, STRAGGLER, RUNNING, 10.0) is None
+
+    hedger.queue.assert_called_once_with("Add", INPUTS)
+    assert hedger.hedges == 1
+
+
+def test_cancels_loser(hedger: Hedger) -> None:
+    finish_peers(hedger, 1.0, 1.0)
+    hedger.check(0, STRAGGLER, RUNNING, 5.0)
+
+    hedger.finished(0, HEDGE, COMPLETED, 6.0)
+
+    hedger.cancel.assert_called_once_with(STRAGGLER)
+
+
+def test_cancels_hedge_when_original_wins(hedger: Hedger) -> None:
+    finish_peers(hedger, 1.0, 1.0)
+    hedger.check(0, STRAGGLER, RUNNING, 5.0)
+
+    hedger.finished(0, STRAGGLER, COMPLETED, 6.0)
+
+    hedger.cancel.assert_called_once_with(HEDGE)
+
+
+def test_drops_failed_copy_while_other_runs(hedger: Hedger) -> None:
+    finish_peers(hedger, 1.0, 1.0)
+    hedger.check(0, STRAGGLER, RUNNING, 5.0)
+
+    assert hedger.drop(0, HEDGE, FAILED) is True
+    assert hedger.drop(0, STRAGGLER, COMPLETED) is False
+
+    hedger.finished(0, STRAGGLER, COMPLETED, 6.0)
+
+    hedger.cancel.assert_not_called()
+
+
+def test_last_failed_copy_finishes_slot(hedger: Hedger) -> None:
+    finish_peers(hedger, 1.0, 1.0)
+    hedger.check(0, STRAGGLER, RUNNING, 5.0)
+
+    assert hedger.drop(0, STRAGGLER, FAILED) is True
+    assert hedger.drop(0, HEDGE, FAILED) is False
+
+    hedger.finished(0, HEDGE, FAILED, 6.0)
+
+    hedger.cancel.assert_not_called()
+
+
+def test_unhedged_failure_not_dropped(hedger: Hedger) -> None:
+    assert hedger.drop(0, STRAGGLER, FAILED) is False
+
+
+def test_limits_hedges() -> None:
+    hedger = make_hedger(batch_size=100, max_hedges=1)
+    hedger.queue.side_effect = RuntimeError("Queue failed")
+    finish_peers(hedger, 1.0, 1.0)
+
+    assert hedger.limit == 1
+    assert hedger.check(0, STRAGGLER, RUNNING, 5.0) is None
+    assert hedger.check(3, Job(node_id="Add", job_id="other"), RUNNING, 5.0) is None
+    assert hedger.queue.call_count == 1
+
+
+def test_limits_hedge_fraction() -> None:
+    hedger = make_hedger(batch_size=30, max_hedge_fraction=0.05)
+
+    assert hedger.limit == 2
+
+
+def test_stops_when_tokens_run_low() -> None:
+    hedger = make_hedger(min_tokens=500)
+    finish_peers(hedger, 1.0, 1.0)
+
+    assert hedger.check(0, STRAGGLER, RUNNING, 5.0) is None
+    assert hedger.check(3, Job(node_id="Add", job_id="other"), RUNNING, 5.0) is None
+
+    hedger.tokens.assert_called_once_with()
+    hedger.queue.assert_not_called()
+    assert hedger.hedges == 0
+
+
+def test_ignores_same_job(hedger: Hedger) -> None:
+    hedger.queue.return_value = STRAGGLER
+    finish_peers(hedger, 1.0, 1.0)
+
+    assert hedger.check(0, STRAGGLER, RUNNING, 5.0) is None
+
+
+def test_skips_workflows(hedger: Hedger) -> None:
+    finish_peers(hedger, 1.0, 1.0)
+
+    workflow = Job(node_id="Workflow", job_id="workflow")
+    assert hedger.check(0, workflow, RUNNING, 5.0) is None
+
+
+def test_close_cancels_unfinished_hedges(hedger: Hedger) -> None:
+    finish_peers(hedger, 1.0, 1.0)
+    hedger.check(0, STRAGGLER, RUNNING, 5.0)
+    hedger.cancel.side_effect = RuntimeError("Cancel failed")
+
+    hedger.close()
+
+    hedger.cancel.assert_called_once_with(HEDGE)
@@ -0,0 +1,146 @@
+from itertools import count
+from pathlib import Path
+from unittest.mock import Mock, patch
+
+from pytest import fixture
+from uncertainty_engine_types import JobInfo, JobStatus
+
+from uncertainty_engine.job import Job
+from uncertainty_engine.job_cache import CacheStats, JobInfoCache
+
+
+def make_job(job_id: str) -> Job:
+    return Job(node_id="Add", job_id=job_id)
+
+
+def make_info(status: JobStatus, outputs: dict | None = None) -> JobInfo:
+    return JobInfo(status=status, message="", inputs={}, outputs=outputs)
+
+
+@fixture
+def cache() -> JobInfoCache:
+    return JobInfoCache(max_entries=2)
+
+
+def test_caches_terminal_results(cache: JobInfoCache) -> None:
+    info = make_info(JobStatus.COMPLETED, {"ans": 3})
+    cache.put(make_job("a"), info)
+
+    assert cache.get(make_job("a")) == info
+    assert cache.stats == CacheStats(hits=1)
+
+
+def test_ignores_non_terminal_results(cache: JobInfoCache) -> None:
+    cache.put(make_job("a"), make_info(JobStatus.RUNNING))
+    cache.put(make_job("b"), make_info(JobStatus.PENDING))
+
+    assert cache.get(make_job("a")) is None
+    assert cache.get(make_job("b")) is None
+    assert len(cache) == 0
+    assert cache.stats.misses == 2
+
+
+def test_returns_copies(cache: JobInfoCache) -> None:
+    cache.put(make_job("a"), make_info(JobStatus.COMPLETED, {"ans": 3}))
+
+    cache.get(make_job("a")).outputs["ans"] = 4
+
+    assert cache.get(make_job("a")).outputs == {"ans": 3}
+
+
+def test_evicts_least_recently_used(cache: JobInfoCache) -> None:
+    cache.put(make_job("a"), make_info(JobStatus.COMPLETED))
+    cache.put(make_job("b"), make_info(JobStatus.COMPLETED))
+    cache.get(make_job("a"))
+    cache.put(make_job("c"), make_info(JobStatus.FAILED))
+
+    assert len(cache) == 2
+    assert cache.get(make_job("b")) is None
+    assert cache.get(make_job("a")) is not None
+    assert cache.get(make_job("c")) is not None
+    assert cache.stats.evictions == 1
+
+
+def test_hit_rate(cache: JobInfoCache) -> None:
+    assert cache.stats.hit_rate == 0.0
+
+    cache.put(make_job("a"), make_info(JobStatus.COMPLETED))
+    cache.get(make_job("a"))
+    cache.get(make_job("b"))
+
+    assert cache.stats.hit_rate == 0.5
+
+
+def test_disk_cache_outlives_instance(tmp_path: Path) -> None:
+    info = make_info(JobStatus.COMPLETED, {"ans": 3})
+
+    with JobInfoCache(directory=tmp_path) as cache:
+        cache.put(make_job("a"), info)
+
+    with JobInfoCache(directory=tmp_path) as cache:
+        assert cache.get(make_job("a")) == info
+        assert cache.stats == CacheStats(hits=1, disk_hits=1)
+
+        # Disk hits are kept in memory.
+        assert len(cache) == 1
+
+
+def test_disk_cache_eviction(tmp_path: Path) -> None:
+    with JobInfoCache(max_entries=1, directory=tmp_path, max_disk_entries=2) as cache:
+        for job_id in ("a", "b", "c"):
+            cache.put(make_job(job_id), make_info(JobStatus.COMPLETED))
+
+    with JobInfoCache(directory=tmp_path) as cache:
+        assert cache.get(make_job("a")) is None
+        assert cache.get(make_job("b")) is not None
+        assert cache.get(make_job("c")) is not None
+
+
+def test_memory_hits_refresh_disk_use(tmp_path: Path) -> None:
+    """
+    Verify that a result read from memory isn't evicted from disk as if it
+    were unused.
+    """
+
+    with patch("uncertainty_engine.job_cache.time", side_effect=count()):
+        with JobInfoCache(directory=tmp_path, max_disk_entries=2) as cache:
+            cache.put(make_job("a"), make_info(JobStatus.COMPLETED))
+            cache.put(make_job("b"), make_info(JobStatus.COMPLETED))
+            cache.get(make_job("a"))
+            cache.put(make_job("c"), make_info(JobStatus.COMPLETED))
+
+    with JobInfoCache(directory=tmp_path) as cache:
+        assert cache.get(make_job("a")) is not None
+        assert cache.get(make_job("b")) is None
+
+
+def test_memory_hits_not_written_until_needed(tmp_path: Path) -> None:
+    with patch("uncertainty_engine.job_cache.time", side_effect=count()):
+        with JobInfoCache(directory=tmp_path, max_disk_entries=2) as cache:
+            cache.put(make_job("a"), make_info(JobStatus.COMPLETED))
+            cache.put(make_job("b"), make_info(JobStatus.COMPLETED))
+
+            connection = cache._store._connection
+            cache._store._connection = Mock(wraps=connection)
+            for _ in range(3):
+                cache.get(make_job("a"))
+
+            cache._store._connection.execute.assert_not_called()
+            cache._store._connection = connection
+
+        # Closing wrote the uses, so "b" is the least recently used.
+        with JobInfoCache(directory=tmp_path, max_disk_entries=2) as cache:
+            cache.put(make_job("c"), make_info(JobStatus.COMPLETED))
+
+    with JobInfoCache(directory=tmp_path) as cache:
+        assert cache.get(make_job("a")) is not None
+        assert cache.get(make_job("b")) is None
+
+
+def test_clear(tmp_path: Path) -> None:
+    with JobInfoCache(directory=tmp_path) as cache:
+        cache.put(make_job("a"), make_info(JobStatus.COMPLETED))
+        cache.clear()
+
+        assert cache.get(make_job("a")) is None
+        assert cache.stats == CacheStats(misses=1)
@@ -0,0 +1,249 @@
+import threading
+from concurrent.futures import CancelledError, as_completed, wait
+from typing import Optional
+from unittest.mock import Mock
+
+from pytest import fixture, raises
+from uncertainty_engine_types import JobInfo, JobStatus
+
+from uncertainty_engine.exceptions import DeadlineExceeded
+from uncertainty_engine.job import Job
+from uncertainty_engine.job_future import JobFuture
+from uncertainty_engine.job_retry import JobRetrier, JobRetryPolicy
+from uncertainty_engine.polling import FixedPoll
+from uncertainty_engine.scheduler import JobPoller
+from uncertainty_engine.timeouts import Deadline
+
+
+def make_info(status: JobStatus, job: str = "") -> JobInfo:
+    return JobInfo(status=status, message=job, inputs={}, outputs=None)
+
+
+def make_job(job_id: str) -> Job:
+    return Job(node_id="Add", job_id=job_id)
+
+
+class FakeJobs:
+    """
+    Job statuses where job `job_id` completes after `checks[job_id]` status
+    checks.
+    """
+
+    def __init__(self, checks: dict[str, int]) -> None:
+        self.checks = checks
+        self.calls: dict[str, int] = {job_id: 0 for job_id in checks}
+        self._lock = threading.Lock()
+
+    def job_status(self, job: Job, deadline: Optional[Deadline] = None) -> JobInfo:
+        with self._lock:
+            self.calls[job.job_id] += 1
+            done = self.calls[job.job_id] >= self.checks[job.job_id]
+
+        status = JobStatus.COMPLETED if done else JobStatus.RUNNING
+        return make_info(status, job.job_id)
+
+
+@fixture
+def poller():
+    poller = JobPoller(Mock())
+    yield poller
+    poller.close()
+
+
+def test_cancel_cancels_job() -> None:
+    cancel_job = Mock(return_value=True)
+    future = JobFuture(make_job("a"), cancel_job)
+
+    assert future.cancel()
+
+    cancel_job.assert_called_once_with(future.job)
+    assert future.cancelled()
+    with raises(CancelledError):
+        future.result()
+
+
+def test_cancel_refused() -> None:
+    future = JobFuture(make_job("a"), Mock(return_value=False))
+
+    assert not future.cancel()
+    assert not future.done()
+
+
+def test_cancel_finished_job() -> None:
+    cancel_job = Mock()
+    future = JobFuture(make_job("a"), cancel_job)
+    future.set_result(make_info(JobStatus.COMPLETED))
+
+    assert not future.cancel()
+    cancel_job.assert_not_called()
+
+
+def test_poller_resolves_futures(poller: JobPoller) -> None:
+    fake = FakeJobs({"slow": 4, "fast": 1})
+    poller.job_status = fake.job_status
+
+    futures = {
+        job_id: JobFuture(make_job(job_id), Mock()) for job_id in ("slow", "fast")
+    }
+    for future in futures.values():
+        poller.watch(future.job, future, FixedPoll(0.01))
+
+    finished = [future.job.job_id for future in as_completed(futures.values(), 5)]
+
+    assert finished == ["fast", "slow"]
+    assert futures["slow"].result().message == "slow"
+    assert fake.calls == {"slow": 4, "fast": 1}
+
+
+def test_poller_uses_one_thread(poller: JobPoller) -> None:
+    """
+    Verify that many futures are tracked without a thread per job.
+    """
+
+    fake = FakeJobs({str(i): 3 for i in range(50)})
+    poller.job_status = fake.job_status
+
+    futures = [JobFuture(make_job(job_id), Mock()) for job_id in fake.checks]
+    before = threading.active_count()
+    for future in futures:
+        poller.watch(future.job, future, FixedPoll(0.01))
+
+    done, not_done = wait(futures, timeout=5)
+
+    assert not not_done
+    # The poller thread plus at most `max_concurrency` workers.
+    assert threading.active_count() - before <= 11
+
+
+def test_done_callback(poller: JobPoller) -> None:
+    poller.job_status = Mock(return_value=make_info(JobStatus.COMPLETED))
+    called = threading.Event()
+
+    future = JobFuture(make_job("a"), Mock())
+    future.add_done_callback(lambda _: called.set())
+    poller.watch(future.job, future, FixedPoll(0.01))
+
+    assert called.wait(5)
+
+
+def test_status_error_fails_future(poller: JobPoller) -> None:
+    poller.job_status = Mock(side_effect=RuntimeError("boom"))
+
+    future = JobFuture(make_job("a"), Mock())
+    poller.watch(future.job, future, FixedPoll(0.01))
+
+    with raises(RuntimeError, match="boom"):
+        future.result(timeout=5)
+
+
+def test_deadline_fails_future(poller: JobPoller) -> None:
+    poller.job_status = Mock(return_value=make_info(JobStatus.RUNNING))
+
+    future = JobFuture(make_job("a"), Mock())
+    poller.watch(future.job, future, FixedPoll(0.01), deadline=Deadline(0.1))
+
+    with raises(DeadlineExceeded):
+        future.result(timeout=5)
+
+
+def test_retries_failed_job(poller: JobPoller) -> None:
+    failed = JobInfo(status=JobStatus.FAILED, message="Timed out", inputs={"a": 1})
+    completed = make_info(JobStatus.COMPLETED)
+    poller.job_status = Mock(side_effect=[failed, completed])
+
+    retried = make_job("b")
+    queue = Mock(return_value=retried)
+    retrier = JobRetrier(JobRetryPolicy(backoff_base=0.01), queue)
+
+    future = JobFuture(make_job("a"), Mock())
+    poller.watch(future.job, future, FixedPoll(0.01), retrier=retrier)
+
+    assert future.result(timeout=5) == completed
+    assert future.job == retried
+    queue.assert_called_once_with("Add", {"a": 1})
+    assert [attempt.job.job_id for attempt in retrier.attempts(0)] == ["a", "b"]
+
+
+def test_failed_requeue_resolves_with_failure(poller: JobPoller) -> None:
+    failed = make_info(JobStatus.FAILED, "Timed out")
+    poller.job_status = Mock(return_value=failed)
+
+    queue = Mock(side_effect=RuntimeError("boom"))
+    retrier = JobRetrier(JobRetryPolicy(backoff_base=0.01), queue)
+
+    future = JobFuture(make_job("a"), Mock())
+    poller.watch(future.job, future, FixedPoll(0.01), retrier=retrier)
+
+    assert future.result(timeout=5) == failed
+    assert future.job.job_id == "a"
+
+
+def test_cancelled_future_stops_polling(poller: JobPoller) -> None:
+    poller.job_status = Mock(return_value=make_info(JobStatus.RUNNING))
+
+    future = JobFuture(make_job("a"), Mock(return_value=True))
+    poller.watch(future.job, future, FixedPoll(0.01))
+    future.cancel()
+
+    threading.Event().wait(0.1)
+    calls = poller.job_status.call_count
+    threading.Event().wait(0.1)
+
+    assert poller.job_status.call_count == calls
+
+
+def test_close_fails_future_being_checked() -> None:
+    checking = threading.Event()
+    release = threading.Event()
+
+    def job_status(job: Job, deadline: Optional[Deadline] = None) -> JobInfo:
+        checking.set()
+        release.wait(5)
+        return make_info(JobStatus.RUNNING)
+
+    poller = JobPoller(job_status)
+    future = JobFuture(make_job("a"), Mock())
+    poller.watch(future.job, future, FixedPoll(0.01))
+
+    assert checking.wait(5)
+    poller.close()
+
+    try:
+        with raises(RuntimeError, match="closed"):
+            future.result(timeout=5)
+    finally:
+        release.set()
+
+
+def test_shut_down_executor_fails_future() -> None:
+    poller = JobPoller(Mock(return_value=make_info(JobStatus.RUNNING)))
+    poller._executor.shutdown()
+
+    future = JobFuture(make_job("a"), Mock())
+    poller.watch(future.job, future, FixedPoll(0.01))
+
+    try:
+        with raises(RuntimeError, match="closed"):
+            future.result(timeout=5)
+
+        # The poller thread survives to fail later futures too.
+        other = JobFuture(make_job("b"), Mock())
+        poller.watch(other.job, other, FixedPoll(0.01))
+        with raises(RuntimeError, match="closed"):
+            other.result(timeout=5)
+    finally:
+        poller.close()
+
+
+def test_close_fails_pending_futures() -> None:
+    poller = JobPoller(Mock(return_value=make_info(JobStatus.RUNNING)))
+
+    future = JobFuture(make_job("a"), Mock())
+    poller.watch(future.job, future, FixedPoll(60))
+    poller.close()
+
+    with raises(RuntimeError):
+        future.result(timeout=5)
+
+    with raises(RuntimeError):
+        poller.watch(future.job, JobFuture(future.job, Mock()), FixedPoll(60))
@@ -0,0 +1,84 @@
+from unittest.mock import Mock, patch
+
+from pytest import mark
+from uncertainty_engine_types import JobInfo, JobStatus
+
+from uncertainty_engine.job import Job
+from uncertainty_engine.job_retry import JobAttempt, JobRetrier, JobRetryPolicy
+
+INPUTS = {"lhs": 1, "rhs": 2}
+
+JOB = Job(node_id="Add", job_id="job_1")
+
+
+def make_info(status: JobStatus, message: str = "") -> JobInfo:
+    return JobInfo(status=status, message=message, inputs=INPUTS)
+
+
+@mark.parametrize(
+    "info, expected",
+    [
+        (make_info(JobStatus.FAILED, "Worker connection reset"), True),
+        (make_info(JobStatus.FAILED, "Request TIMED OUT"), True),
+        (make_info(JobStatus.FAILED, "Input 'lhs' must be a number"), False),
+        (make_info(JobStatus.COMPLETED, "Timed out"), False),
+        (make_info(JobStatus.CANCELLED, "Timed out"), False),
+    ],
+)
+def test_should_retry(info: JobInfo, expected: bool) -> None:
+    assert JobRetryPolicy().should_retry(info, 1) is expected
+
+
+def test_should_retry_limits_attempts() -> None:
+    policy = JobRetryPolicy(max_attempts=2)
+    info = make_info(JobStatus.FAILED, "timeout")
+
+    assert policy.should_retry(info, 1)
+    assert not policy.should_retry(info, 2)
+
+
+def test_should_retry_custom_predicate() -> None:
+    policy = JobRetryPolicy(is_transient=lambda message: message == "spot")
+
+    assert policy.should_retry(make_info(JobStatus.FAILED, "spot"), 1)
+    assert not policy.should_retry(make_info(JobStatus.FAILED, "timeout"), 1)
+
+
+def test_next_delay_backs_off_exponentially() -> None:
+    policy = JobRetryPolicy(backoff_base=1, backoff_max=3)
+
+    with patch("uncertainty_engine.job_retry.uniform", side_effect=lambda a, b: b):
+        delays = [policy.next_delay(attempt) for attempt in (1, 2, 3)]
+
+    assert delays == [1, 2, 3]
+
+
+def test_retrier_records_attempts() -> None:
+    retry = Job(node_id="Add", job_id="job_2")
+    retrier = JobRetrier(JobRetryPolicy(backoff_base=0), queue=Mock(return_value=retry))
+    failed = make_info(JobStatus.FAILED, "timeout")
+    completed = make_info(JobStatus.COMPLETED)
+
+    assert retrier.check(0, JOB, failed) == 0
+    assert retrier.requeue(JOB, failed) == retry
+    assert retrier.check(0, retry, completed) is None
+
+    retrier.queue.assert_called_once_with("Add", INPUTS)
+    assert retrier.attempts(0) == [
+        JobAttempt(job=JOB, info=failed),
+        JobAttempt(job=retry, info=completed),
+    ]
+    assert retrier.attempts(1) == []
+
+
+def test_retrier_skips_workflows() -> None:
+    retrier = JobRetrier(JobRetryPolicy(), queue=Mock())
+    workflow = Job(node_id="Workflow", job_id="workflow")
+
+    assert retrier.check(0, workflow, make_info(JobStatus.FAILED, "timeout")) is None
+
+
+def test_retrier_requeue_failure() -> None:
+    retrier = JobRetrier(JobRetryPolicy(), queue=Mock(side_effect=RuntimeError()))
+
+    assert retrier.requeue(JOB, make_info(JobStatus.FAILED, "timeout")) is None
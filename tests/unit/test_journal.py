@@ -0,0 +1,71 @@
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from pytest import fixture
+from uncertainty_engine_types import JobStatus
+
+from uncertainty_engine.job import Job
+from uncertainty_engine.journal import JobJournal
+
+
+@fixture
+def journal(tmp_path: Path):
+    with JobJournal(tmp_path / "journals", "batch") as journal:
+        yield journal
+
+
+def test_creates_database_in_directory(tmp_path: Path) -> None:
+    with JobJournal(tmp_path / "a" / "b", "sweep") as journal:
+        assert journal.path == tmp_path / "a" / "b" / "sweep.sqlite3"
+        assert journal.path.exists()
+
+
+def test_find_recorded_job(journal: JobJournal) -> None:
+    job = Job(node_id="Add", job_id="job_1")
+    journal.record(job, "hash")
+
+    assert journal.find("hash") == job
+    assert journal.find("other") is None
+
+
+def test_find_ignores_failed_jobs(journal: JobJournal) -> None:
+    job = Job(node_id="Add", job_id="job_1")
+    journal.record(job, "hash")
+    journal.mark_finished(job, JobStatus.FAILED)
+
+    assert journal.find("hash") is None
+
+    journal.mark_finished(job, JobStatus.COMPLETED)
+
+    assert journal.find("hash") == job
+
+
+def test_unfinished(journal: JobJournal) -> None:
+    jobs = [Job(node_id="Add", job_id=f"job_{i}") for i in range(3)]
+    for i, job in enumerate(jobs):
+        journal.record(job, f"hash_{i}")
+
+    journal.mark_finished(jobs[1], JobStatus.COMPLETED)
+
+    assert journal.unfinished() == [jobs[0], jobs[2]]
+
+
+def test_survives_reopening(tmp_path: Path) -> None:
+    job = Job(node_id="Add", job_id="job_1")
+
+    with JobJournal(tmp_path) as journal:
+        journal.record(job, "hash")
+
+    with JobJournal(tmp_path) as journal:
+        assert journal.unfinished() == [job]
+        assert journal.find("hash") == job
+
+
+def test_shared_between_threads(journal: JobJournal) -> None:
+    def record(i: int) -> None:
+        journal.record(Job(node_id="Add", job_id=f"job_{i}"), f"hash_{i}")
+
+    with ThreadPoolExecutor(8) as executor:
+        list(executor.map(record, range(50)))
+
+    assert len(journal.unfinished()) == 50
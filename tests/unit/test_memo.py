@@ -0,0 +1,130 @@
+from pathlib import Path
+from unittest.mock import patch
+
+from pytest import fixture
+from uncertainty_engine_types import JobInfo, JobStatus
+
+from uncertainty_engine.job import Job
+from uncertainty_engine.job_cache import CacheStats
+from uncertainty_engine.memo import NodeMemo
+
+TIME_TARGET = "uncertainty_engine.memo.time"
+
+INPUTS = {"lhs": 1, "rhs": 2}
+
+
+def make_info(status: JobStatus) -> JobInfo:
+    return JobInfo(status=status, message="", inputs=INPUTS, outputs={"ans": 3})
+
+
+def run(memo: NodeMemo, job_id: str, inputs: dict = INPUTS) -> Job:
+    """
+    Record a completed execution of the Add node.
+    """
+
+    job = Job(node_id="Add", job_id=job_id)
+    memo.queued(job, inputs)
+    memo.finished(job, make_info(JobStatus.COMPLETED))
+    return job
+
+
+@fixture
+def memo() -> NodeMemo:
+    return NodeMemo(nodes={"Add"}, max_entries=2)
+
+
+def test_reuses_completed_result(memo: NodeMemo) -> None:
+    job = run(memo, "job_1")
+
+    assert memo.lookup("Add", {"rhs": 2, "lhs": 1}) == (
+        job,
+        make_info(JobStatus.COMPLETED),
+    )
+    assert memo.result(job) == make_info(JobStatus.COMPLETED)
+    assert memo.lookup("Add", {"lhs": 1, "rhs": 3}) is None
+    assert memo.stats == CacheStats(hits=1, misses=1)
+
+
+def test_only_memoises_allowed_nodes(memo: NodeMemo) -> None:
+    job = Job(node_id="Random", job_id="job_1")
+    memo.queued(job, INPUTS)
+    memo.finished(job, make_info(JobStatus.COMPLETED))
+
+    assert memo.lookup("Random", INPUTS) is None
+    assert len(memo) == 0
+    assert memo.stats == CacheStats()
+
+
+def test_ignores_unsuccessful_jobs(memo: NodeMemo) -> None:
+    for i, status in enumerate([JobStatus.RUNNING, JobStatus.FAILED]):
+        job = Job(node_id="Add", job_id=f"job_{i}")
+        memo.queued(job, INPUTS)
+        memo.finished(job, make_info(status))
+
+    assert memo.lookup("Add", INPUTS) is None
+
+
+def test_ttl(memo: NodeMemo) -> None:
+    memo.ttl = 60
+
+    with patch(TIME_TARGET, return_value=1000.0) as time:
+        run(memo, "job_1")
+
+        time.return_value = 1059.0
+        assert memo.lookup("Add", INPUTS) is not None
+
+        time.return_value = 1061.0
+        assert memo.lookup("Add", INPUTS) is None
+
+    assert len(memo) == 0
+
+
+def test_evicts_least_recently_used(memo: NodeMemo) -> None:
+    first = run(memo, "job_1", {"lhs": 1})
+    run(memo, "job_2", {"lhs": 2})
+    memo.lookup("Add", {"lhs": 1})
+    run(memo, "job_3", {"lhs": 3})
+
+    assert memo.lookup("Add", {"lhs": 2}) is None
+    assert memo.lookup("Add", {"lhs": 1})[0] == first
+    assert memo.stats.evictions == 1
+
+
+def test_versions_memoised_separately(memo: NodeMemo) -> None:
+    job = Job(node_id="Add", job_id="job_1")
+    memo.queued(job, INPUTS, "0.2.0")
+    memo.finished(job, make_info(JobStatus.COMPLETED))
+
+    assert memo.lookup("Add", INPUTS, "0.2.0") is not None
+    assert memo.lookup("Add", INPUTS, "0.3.0") is None
+    assert memo.lookup("Add", INPUTS) is None
+
+
+def test_forgets_oldest_unfinished_jobs() -> None:
+    memo = NodeMemo(nodes={"Add"}, max_queued=1)
+
+    first = Job(node_id="Add", job_id="job_1")
+    memo.queued(first, {"lhs": 1})
+    run(memo, "job_2", {"lhs": 2})
+    memo.finished(first, make_info(JobStatus.COMPLETED))
+
+    assert memo.lookup("Add", {"lhs": 1}) is None
+    assert memo.lookup("Add", {"lhs": 2}) is not None
+
+
+def test_persists_results(tmp_path: Path) -> None:
+    with NodeMemo(nodes={"Add"}, directory=tmp_path) as memo:
+        job = run(memo, "job_1")
+
+    with NodeMemo(nodes={"Add"}, directory=tmp_path) as memo:
+        assert memo.lookup("Add", INPUTS) == (job, make_info(JobStatus.COMPLETED))
+        assert memo.result(job) == make_info(JobStatus.COMPLETED)
+        assert memo.stats == CacheStats(hits=1, disk_hits=1)
+
+
+def test_clear(tmp_path: Path) -> None:
+    with NodeMemo(nodes={"Add"}, directory=tmp_path) as memo:
+        run(memo, "job_1")
+        memo.clear()
+
+        assert memo.lookup("Add", INPUTS) is None
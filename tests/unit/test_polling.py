@@ -0,0 +1,88 @@
+from itertools import islice
+from unittest.mock import patch
+
+from uncertainty_engine import client
+from uncertainty_engine.durations import DurationHistory
+from uncertainty_engine.job import Job
+from uncertainty_engine.polling import (
+    STATUS_WAIT_TIME,
+    ExponentialBackoffPoll,
+    FixedPoll,
+    PredictivePoll,
+)
+
+
+def test_fixed_poll() -> None:
+    assert list(islice(FixedPoll(2).delays(), 3)) == [2, 2, 2]
+
+
+def test_fixed_poll_default() -> None:
+    assert next(FixedPoll().delays()) == STATUS_WAIT_TIME
+
+
+def test_status_wait_time_importable_from_client() -> None:
+    assert client.STATUS_WAIT_TIME == STATUS_WAIT_TIME
+
+
+def test_exponential_backoff_poll() -> None:
+    poll = ExponentialBackoffPoll(initial=0.5, factor=2, max_interval=3, jitter=0)
+
+    assert list(islice(poll.delays(), 5)) == [0.5, 1, 2, 3, 3]
+
+
+def test_exponential_backoff_poll_jitter() -> None:
+    poll = ExponentialBackoffPoll(initial=1, factor=1, jitter=0.2)
+
+    for delay in islice(poll.delays(), 100):
+        assert 0.8 <= delay <= 1.2
+
+
+def test_exponential_backoff_poll_independent_delays() -> None:
+    poll = ExponentialBackoffPoll(initial=1, factor=2, jitter=0)
+    first = poll.delays()
+    next(first)
+    next(first)
+
+    assert next(poll.delays()) == 1
+
+
+def test_exponential_backoff_poll_long_job() -> None:
+    """
+    Verify that an hour-long job is polled far less often than every five
+    seconds, and that the schedule never overflows.
+    """
+
+    waited = 0.0
+    polls = 0
+    for delay in ExponentialBackoffPoll(jitter=0).delays():
+        if waited >= 3600:
+            break
+        waited += delay
+        polls += 1
+
+    assert polls < 3600 / STATUS_WAIT_TIME / 4
+
+
+def test_predictive_poll() -> None:
+    history = DurationHistory()
+    history.record("TrainModel", 60.0)
+
+    job = Job(node_id="TrainModel", job_id="job_id")
+    fallback = FixedPoll(1)
+    poll = PredictivePoll(history, fallback=fallback)
+
+    with patch("uncertainty_engine.durations.time", return_value=0.0):
+        history.queued(job)
+
+    with patch("uncertainty_engine.durations.time", return_value=15.0):
+        delays = list(islice(poll.delays_for(job), 3))
+
+    assert delays == [45, 1, 1]
+
+
+def test_predictive_poll_without_history() -> None:
+    poll = PredictivePoll(DurationHistory(), fallback=FixedPoll(2))
+    job = Job(node_id="Add", job_id="job_id")
+
+    assert list(islice(poll.delays_for(job), 2)) == [2, 2]
+    assert list(islice(poll.delays(), 2)) == [2, 2]
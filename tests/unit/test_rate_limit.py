@@ -0,0 +1,152 @@
+from typing import Iterator
+from unittest.mock import Mock, patch
+
+from pydantic import ValidationError
+from pytest import fixture, mark, raises
+
+from uncertainty_engine.exceptions import DeadlineExceeded
+from uncertainty_engine.rate_limit import (
+    EndpointClass,
+    RateLimit,
+    RateLimiter,
+    RateLimitPolicy,
+)
+from uncertainty_engine.timeouts import Deadline
+
+MONOTONIC_TARGET = "uncertainty_engine.rate_limit.monotonic"
+SLEEP_TARGET = "uncertainty_engine.rate_limit.sleep"
+
+
+@fixture
+def clock() -> Iterator[Mock]:
+    with patch(MONOTONIC_TARGET, return_value=1000.0) as monotonic:
+        yield monotonic
+
+
+@fixture
+def sleep() -> Iterator[Mock]:
+    with patch(SLEEP_TARGET) as sleep:
+        yield sleep
+
+
+@mark.parametrize(
+    "method, path, expected",
+    [
+        ("POST", "/nodes/queue", EndpointClass.QUEUE),
+        ("POST", "/workflows/projects/p/workflows/w/run", EndpointClass.QUEUE),
+        ("GET", "/nodes/status/Add/job_id", EndpointClass.STATUS),
+        ("POST", "/nodes/query", EndpointClass.STATUS),
+        ("POST", "/nodes/jobs/job_id/cancel", EndpointClass.STATUS),
+    ],
+)
+def test_endpoint_class(method: str, path: str, expected: EndpointClass) -> None:
+    assert EndpointClass.for_core_api(method, path) == expected
+
+
+def test_rate_limit_validation() -> None:
+    with raises(ValidationError):
+        RateLimit(rate=0)
+
+    with raises(ValidationError):
+        RateLimit(rate=1, burst=0)
+
+
+def test_policy_creates_limiters_for_limited_classes() -> None:
+    policy = RateLimitPolicy(queue=RateLimit(rate=5), resource=RateLimit(rate=1))
+
+    limiters = policy.create_limiters()
+
+    assert set(limiters) == {EndpointClass.QUEUE, EndpointClass.RESOURCE}
+    assert limiters[EndpointClass.QUEUE].limit == policy.queue
+    assert RateLimitPolicy().create_limiters() == {}
+
+
+def test_burst_is_not_delayed(clock: Mock, sleep: Mock) -> None:
+    limiter = RateLimiter(RateLimit(rate=2, burst=3))
+
+    for _ in range(3):
+        limiter.acquire()
+
+    sleep.assert_not_called()
+
+
+def test_blocks_once_burst_is_spent(clock: Mock, sleep: Mock) -> None:
+    limiter = RateLimiter(RateLimit(rate=2, burst=1))
+
+    limiter.acquire()
+    limiter.acquire()
+    limiter.acquire()
+
+    # Each waiting caller reserves the next token, so the waits queue up.
+    assert [c.args[0] for c in sleep.call_args_list] == [0.5, 1.0]
+
+
+def test_refills_over_time(clock: Mock, sleep: Mock) -> None:
+    limiter = RateLimiter(RateLimit(rate=2, burst=2))
+
+    limiter.acquire()
+    limiter.acquire()
+
+    clock.return_value += 0.5
+    limiter.acquire()
+
+    sleep.assert_not_called()
+
+    # The bucket never holds more than `burst` tokens.
+    clock.return_value += 60
+    limiter.acquire()
+    limiter.acquire()
+    limiter.acquire()
+
+    sleep.assert_called_once_with(0.5)
+
+
+def test_deadline(clock: Mock, sleep: Mock) -> None:
+    limiter = RateLimiter(RateLimit(rate=1, burst=1))
+    limiter.acquire()
+
+    with patch("uncertainty_engine.timeouts.monotonic", return_value=1000.0):
+        deadline = Deadline(0.5)
+
+        with raises(DeadlineExceeded):
+            limiter.acquire(deadline)
+
+    sleep.assert_not_called()
+
+    # The failed call didn't reserve a token.
+    clock.return_value += 1
+    limiter.acquire()
+    sleep.assert_not_called()
+
+
+def test_deadline_used_up_by_wait(clock: Mock, sleep: Mock) -> None:
+    limiter = RateLimiter(RateLimit(rate=1, burst=1))
+    limiter.acquire()
+
+    with patch("uncertainty_engine.timeouts.monotonic", return_value=1000.0):
+        deadline = Deadline(1)
+
+        # Waiting exactly the time left would leave none for the request.
+        with raises(DeadlineExceeded):
+            limiter.acquire(deadline)
+
+    sleep.assert_not_called()
+
+
+def test_deadline_checked_after_wait(clock: Mock, sleep: Mock) -> None:
+    limiter = RateLimiter(RateLimit(rate=1, burst=1))
+    limiter.acquire()
+
+    # The wait overran, so the deadline passed while sleeping.
+    def overrun(seconds: float) -> None:
+        deadline.expires_at = 0.0
+
+    sleep.side_effect = overrun
+
+    with patch("uncertainty_engine.timeouts.monotonic", return_value=1000.0):
+        deadline = Deadline(2)
+
+        with raises(DeadlineExceeded):
+            limiter.acquire(deadline)
+
+    sleep.assert_called_once_with(1.0)
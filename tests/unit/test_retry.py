@@ -0,0 +1,69 @@
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+from time import monotonic
+from unittest.mock import patch
+
+from pytest import approx, mark
+
+from uncertainty_engine.retry import RetryPolicy
+
+
+@mark.parametrize(
+    "status_code, expected",
+    [
+        (400, False),
+        (404, False),
+        (408, True),
+        (429, True),
+        (500, True),
+        (503, True),
+    ],
+)
+def test_is_retryable_status(status_code: int, expected: bool) -> None:
+    assert RetryPolicy().is_retryable_status(status_code) is expected
+
+
+def test_next_delay_backs_off_exponentially() -> None:
+    policy = RetryPolicy(backoff_base=1, backoff_max=100, max_attempts=10)
+
+    with patch("uncertainty_engine.retry.uniform", side_effect=lambda a, b: b):
+        delays = [policy.next_delay(attempt, monotonic()) for attempt in (1, 2, 3)]
+
+    assert delays == [1, 2, 4]
+
+
+def test_next_delay_capped_by_backoff_max() -> None:
+    policy = RetryPolicy(backoff_base=1, backoff_max=3, max_attempts=10)
+
+    with patch("uncertainty_engine.retry.uniform", side_effect=lambda a, b: b):
+        assert policy.next_delay(6, monotonic()) == 3
+
+
+def test_next_delay_none_when_attempts_spent() -> None:
+    policy = RetryPolicy(max_attempts=2)
+
+    assert policy.next_delay(2, monotonic()) is None
+
+
+def test_next_delay_none_when_elapsed_budget_spent() -> None:
+    policy = RetryPolicy(max_elapsed=10)
+
+    assert policy.next_delay(1, monotonic() - 5, retry_after=6) is None
+    assert policy.next_delay(1, monotonic() - 5, retry_after=4) == 4
+
+
+def test_parse_retry_after_seconds() -> None:
+    assert RetryPolicy.parse_retry_after("12") == 12.0
+
+
+def test_parse_retry_after_date() -> None:
+    retry_at = datetime.now(timezone.utc) + timedelta(seconds=30)
+
+    delay = RetryPolicy.parse_retry_after(format_datetime(retry_at, usegmt=True))
+
+    assert delay == approx(30, abs=2)
+
+
+@mark.parametrize("value", [None, "", "soon"])
+def test_parse_retry_after_invalid(value: str | None) -> None:
+    assert RetryPolicy.parse_retry_after(value) is None
@@ -0,0 +1,253 @@
+import time
+from threading import Lock
+from typing import Optional
+from unittest.mock import Mock
+
+from pytest import raises
+from uncertainty_engine_types import JobInfo, JobStatus
+
+from uncertainty_engine.exceptions import DeadlineExceeded
+from uncertainty_engine.hedging import HedgePolicy, Hedger
+from uncertainty_engine.job import Job
+from uncertainty_engine.job_retry import JobRetrier, JobRetryPolicy
+from uncertainty_engine.polling import FixedPoll
+from uncertainty_engine.scheduler import JobScheduler
+from uncertainty_engine.timeouts import Deadline
+
+
+def make_info(status: JobStatus, job: str = "") -> JobInfo:
+    return JobInfo(status=status, message=job, inputs={}, outputs=None)
+
+
+class FakeJobs:
+    """
+    Job statuses where job `name` completes after `checks[name]` status
+    checks.
+    """
+
+    def __init__(self, checks: dict[str, int], delay: float = 0.0) -> None:
+        self.checks = checks
+        self.delay = delay
+        self.calls: dict[str, int] = {name: 0 for name in checks}
+        self.running = 0
+        self.peak = 0
+        self._lock = Lock()
+
+    def job_status(self, job: str, deadline: Optional[Deadline] = None) -> JobInfo:
+        with self._lock:
+            self.calls[job] += 1
+            self.running += 1
+            self.peak = max(self.peak, self.running)
+
+        time.sleep(self.delay)
+
+        with self._lock:
+            self.running -= 1
+            done = self.calls[job] >= self.checks[job]
+
+        return make_info(JobStatus.COMPLETED if done else JobStatus.RUNNING, job)
+
+
+def test_yields_in_completion_order() -> None:
+    fake = FakeJobs({"slow": 4, "fast": 1, "medium": 2})
+    scheduler = JobScheduler(fake.job_status, FixedPoll(0.01))
+
+    results = list(scheduler.as_completed(["slow", "fast", "medium"]))
+
+    assert [index for index, _ in results] == [1, 2, 0]
+    assert [info.message for _, info in results] == ["fast", "medium", "slow"]
+    assert fake.calls == {"slow": 4, "fast": 1, "medium": 2}
+
+
+def test_failed_jobs_are_terminal() -> None:
+    def job_status(job: str, deadline: Optional[Deadline] = None) -> JobInfo:
+        return make_info(JobStatus.FAILED)
+
+    scheduler = JobScheduler(job_status, FixedPoll(0.01))
+
+    results = list(scheduler.as_completed(["a", "b"]))
+
+    assert sorted(index for index, _ in results) == [0, 1]
+
+
+def test_polls_jobs_concurrently() -> None:
+    """
+    Verify that a batch takes about as long as its slowest job rather than
+    the sum of all jobs.
+    """
+
+    fake = FakeJobs({str(i): 3 for i in range(20)}, delay=0.05)
+    scheduler = JobScheduler(fake.job_status, FixedPoll(0.01), max_concurrency=20)
+
+    started = time.monotonic()
+    results = list(scheduler.as_completed(list(fake.checks)))
+    elapsed = time.monotonic() - started
+
+    assert len(results) == 20
+    # Serially this would take 20 jobs x 3 checks x 0.05 s = 3 s.
+    assert elapsed < 1.0
+
+
+def test_bounded_concurrency() -> None:
+    fake = FakeJobs({str(i): 2 for i in range(12)}, delay=0.02)
+    scheduler = JobScheduler(fake.job_status, FixedPoll(0), max_concurrency=3)
+
+    list(scheduler.as_completed(list(fake.checks)))
+
+    assert fake.peak == 3
+
+
+def test_deadline_exceeded() -> None:
+    fake = FakeJobs({"never": 1000})
+    scheduler = JobScheduler(fake.job_status, FixedPoll(0.05))
+
+    with raises(DeadlineExceeded):
+        list(scheduler.as_completed(["never"], Deadline(0.2)))
+
+
+def test_status_error_fails_only_its_job() -> None:
+    jobs = [Job(node_id="Add", job_id="bad"), Job(node_id="Add", job_id="good")]
+
+    def job_status(job: Job, deadline: Optional[Deadline] = None) -> JobInfo:
+        if job.job_id == "bad":
+            raise ValueError("bad status")
+
+        return make_info(JobStatus.COMPLETED, job.job_id)
+
+    scheduler = JobScheduler(job_status, FixedPoll(0.01))
+    retrier = JobRetrier(
+        JobRetryPolicy(is_transient=lambda message: True, backoff_base=0),
+        queue=lambda node_id, inputs: Job(node_id=node_id, job_id="retry"),
+    )
+
+    results = dict(scheduler.as_completed(jobs, retrier=retrier))
+
+    assert results[1] == make_info(JobStatus.COMPLETED, "good")
+    assert results[0].status == JobStatus.FAILED
+    assert "bad status" in results[0].message
+
+    # The job may still be running, so it isn't queued again.
+    assert retrier.attempts(0) == []
+
+
+def test_status_error_checked_again() -> None:
+    job = Job(node_id="Add", job_id="flaky")
+    job_status = Mock(
+        side_effect=[RuntimeError("circuit open"), make_info(JobStatus.COMPLETED)]
+    )
+
+    scheduler = JobScheduler(job_status, FixedPoll(0.01))
+
+    assert list(scheduler.as_completed([job])) == [(0, make_info(JobStatus.COMPLETED))]
+    assert job_status.call_count == 2
+
+
+def test_status_errors_fail_job_after_max() -> None:
+    job_status = Mock(side_effect=RuntimeError("circuit open"))
+    scheduler = JobScheduler(job_status, FixedPoll(0.01), max_status_errors=3)
+
+    [(_, info)] = scheduler.as_completed([Job(node_id="Add", job_id="a")])
+
+    assert info.status == JobStatus.FAILED
+    assert job_status.call_count == 3
+
+
+def test_status_deadline_raised() -> None:
+    def job_status(job: str, deadline: Optional[Deadline] = None) -> JobInfo:
+        raise DeadlineExceeded(f"job {job}")
+
+    scheduler = JobScheduler(job_status, FixedPoll(0.01))
+
+    with raises(DeadlineExceeded):
+        list(scheduler.as_completed(["a"]))
+
+
+def test_no_jobs() -> None:
+    scheduler = JobScheduler(FakeJobs({}).job_status, FixedPoll(0.01))
+
+    assert list(scheduler.as_completed([])) == []
+
+
+def test_hedges_stragglers() -> None:
+    jobs = [Job(node_id="Add", job_id=str(i)) for i in range(5)]
+    hedge = Job(node_id="Add", job_id="hedge")
+    cancelled: list[Job] = []
+
+    def job_status(job: Job, deadline: Optional[Deadline] = None) -> JobInfo:
+        # Job 0 never finishes, but its hedge does.
+        done = job.job_id != "0"
+        return make_info(JobStatus.COMPLETED if done else JobStatus.RUNNING, job.job_id)
+
+    hedger = Hedger(
+        HedgePolicy(min_peers=4),
+        len(jobs),
+        queue=lambda node_id, inputs: hedge,
+        cancel=cancelled.append,
+        tokens=lambda: 0,
+    )
+    scheduler = JobScheduler(job_status, FixedPoll(0.01))
+
+    results = dict(scheduler.as_completed(jobs, hedger=hedger))
+
+    assert results[0].message == "hedge"
+    assert cancelled == [jobs[0]]
+    assert hedger.hedges == 1
+
+
+def test_failed_hedge_does_not_beat_running_original() -> None:
+    jobs = [Job(node_id="Add", job_id=str(i)) for i in range(5)]
+    hedge = Job(node_id="Add", job_id="hedge")
+    cancelled: list[Job] = []
+    checks = {"0": 0}
+
+    def job_status(job: Job, deadline: Optional[Deadline] = None) -> JobInfo:
+        if job == hedge:
+            return make_info(JobStatus.FAILED, "hedge")
+
+        if job.job_id != "0":
+            return make_info(JobStatus.COMPLETED, job.job_id)
+
+        # Job 0 is slow, but completes after its hedge has failed.
+        checks["0"] += 1
+        done = checks["0"] > 5
+        return make_info(JobStatus.COMPLETED if done else JobStatus.RUNNING, "0")
+
+    hedger = Hedger(
+        HedgePolicy(min_peers=4),
+        len(jobs),
+        queue=lambda node_id, inputs: hedge,
+        cancel=cancelled.append,
+        tokens=lambda: 0,
+    )
+    scheduler = JobScheduler(job_status, FixedPoll(0.01))
+
+    results = dict(scheduler.as_completed(jobs, hedger=hedger))
+
+    assert hedger.hedges == 1
+    assert results[0] == make_info(JobStatus.COMPLETED, "0")
+    assert cancelled == []
+
+
+def test_retries_failed_jobs() -> None:
+    jobs = [Job(node_id="Add", job_id="flaky"), Job(node_id="Add", job_id="bad")]
+    retry = Job(node_id="Add", job_id="retry")
+
+    def job_status(job: Job, deadline: Optional[Deadline] = None) -> JobInfo:
+        if job == retry:
+            return make_info(JobStatus.COMPLETED, job.job_id)
+
+        message = "Connection lost" if job.job_id == "flaky" else "Bad inputs"
+        return make_info(JobStatus.FAILED, message)
+
+    retrier = JobRetrier(
+        JobRetryPolicy(backoff_base=0.01),
+        queue=lambda node_id, inputs: retry,
+    )
+    scheduler = JobScheduler(job_status, FixedPoll(0.01))
+
+    results = dict(scheduler.as_completed(jobs, retrier=retrier))
+
+    assert results[0].message == "retry"
+    assert results[1].message == "Bad inputs"
+    assert [attempt.job for attempt in retrier.attempts(0)] == [jobs[0], retry]
+    assert len(retrier.attempts(1)) == 1
@@ -0,0 +1,86 @@
+from unittest.mock import patch
+
+from pytest import approx, raises
+
+from uncertainty_engine.exceptions import DeadlineExceeded
+from uncertainty_engine.timeouts import Deadline, clip_timeout
+
+MONOTONIC_TARGET = "uncertainty_engine.timeouts.monotonic"
+
+
+def test_remaining() -> None:
+    with patch(MONOTONIC_TARGET, return_value=100):
+        deadline = Deadline(10)
+
+    with patch(MONOTONIC_TARGET, return_value=104):
+        assert deadline.remaining() == approx(6)
+        assert deadline.expired is False
+
+
+def test_remaining_never_negative() -> None:
+    with patch(MONOTONIC_TARGET, return_value=100):
+        deadline = Deadline(10)
+
+    with patch(MONOTONIC_TARGET, return_value=200):
+        assert deadline.remaining() == 0
+        assert deadline.expired is True
+
+
+def test_check_raises_when_expired() -> None:
+    with raises(DeadlineExceeded) as ex:
+        Deadline(0).check("upload")
+
+    assert ex.value.operation == "upload"
+    assert isinstance(ex.value, TimeoutError)
+
+
+def test_check_passes_before_expiry() -> None:
+    Deadline(60).check()
+
+
+def test_coerce() -> None:
+    deadline = Deadline(5)
+
+    assert Deadline.coerce(None) is None
+    assert Deadline.coerce(deadline) is deadline
+    assert Deadline.coerce(5).remaining() == approx(5, abs=1)
+
+
+def test_clip_pair() -> None:
+    with patch(MONOTONIC_TARGET, return_value=100):
+        deadline = Deadline(5)
+        assert deadline.clip((10, 3)) == (5, 3)
+
+
+def test_clip_single() -> None:
+    with patch(MONOTONIC_TARGET, return_value=100):
+        deadline = Deadline(5)
+        assert deadline.clip(10) == 5
+
+
+def test_clip_timeout_without_deadline() -> None:
+    assert clip_timeout((10, 60), None) == (10, 60)
+
+
+def test_earliest() -> None:
+    with patch("uncertainty_engine.timeouts.monotonic", return_value=100.0):
+        soon = Deadline(5)
+        later = Deadline(10)
+
+    assert Deadline.earliest(later, None, soon) is soon
+    assert Deadline.earliest(None, None) is None
+    assert Deadline.earliest() is None
+
+
+def test_clip_raises_when_expired() -> None:
+    with patch(MONOTONIC_TARGET, return_value=100):
+        deadline = Deadline(5)
+
+    with patch(MONOTONIC_TARGET, return_value=105):
+        with raises(DeadlineExceeded) as ex:
+            deadline.clip((10, 3), "GET /foo")
+
+        with raises(DeadlineExceeded):
+            clip_timeout(10, deadline)
+
+    assert ex.value.operation == "GET /foo"
@@ -158,3 +158,17 @@ def test_format_api_error_invalid_json():
 
     # Verify the result - should fall back to str(e)
     assert result == f"API Error: {mock_exception.reason}\nDetails: No error message"
+
+
+def test_hash_node_inputs_ignores_key_order():
+    """
+    Test that hash_node_inputs identifies a node and its inputs regardless of
+    key order.
+    """
+
+    first = ue_utils.hash_node_inputs("Add", {"lhs": 1, "rhs": {"a": 1, "b": 2}})
+    second = ue_utils.hash_node_inputs("Add", {"rhs": {"b": 2, "a": 1}, "lhs": 1})
+
+    assert first == second
+    assert first != ue_utils.hash_node_inputs("Add", {"lhs": 1, "rhs": 3})
+    assert first != ue_utils.hash_node_inputs("Subtract", {"lhs": 1, "rhs": 2})
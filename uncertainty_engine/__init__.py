@@ -1,7 +1,9 @@
+from uncertainty_engine.async_client import AsyncClient
 from uncertainty_engine.client import Client
 from uncertainty_engine.environments import Environment
 
 __all__ = [
+    "AsyncClient",
     "Client",
     "Environment",
 ]
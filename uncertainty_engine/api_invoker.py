@@ -1,11 +1,62 @@
+import gzip
+import json
 from abc import ABC, abstractmethod
+from concurrent.futures import Future, wait
+from copy import deepcopy
+from threading import Lock
+from time import monotonic, sleep
 from typing import Any
+from uuid import uuid4
 
-from requests import request
+from requests import ConnectionError, ConnectTimeout, Session, Timeout
+from requests.adapters import HTTPAdapter
+from urllib3.exceptions import NewConnectionError
 
 from uncertainty_engine.auth_service import AuthService
+from uncertainty_engine.circuit_breaker import CircuitBreaker
+from uncertainty_engine.exceptions import DeadlineExceeded
+from uncertainty_engine.rate_limit import EndpointClass, RateLimiter
+from uncertainty_engine.retry import (
+    AUTH_STATUS_CODES,
+    REJECTED_STATUS_CODES,
+    RetryPolicy,
+)
+from uncertainty_engine.timeouts import (
+    DEFAULT_TIMEOUT,
+    Deadline,
+    TimeoutValue,
+    clip_timeout,
+)
 from uncertainty_engine.uri import join_uri
 
+DEFAULT_POOL_CONNECTIONS = 10
+"""
+Default number of per-host connection pools to keep.
+"""
+
+DEFAULT_POOL_MAXSIZE = 10
+"""
+Default maximum number of keep-alive connections to keep per host.
+"""
+
+IDEMPOTENCY_KEY_HEADER = "Idempotency-Key"
+"""
+Header that identifies retries of the same POST request. The Core API isn't
+known to honour it, so it isn't relied on to drop duplicate jobs.
+"""
+
+IDEMPOTENT_POST_PATHS = frozenset({"/nodes/query"})
+"""
+POST endpoints that only read data, so identical concurrent requests can be
+coalesced like GETs.
+"""
+
+GZIP_COMPRESS_LEVEL = 6
+"""
+gzip compression level for request bodies. Level 6 gets close to the
+smallest output at a fraction of the CPU time of level 9.
+"""
+
 
 class ApiInvoker(ABC):
     """
@@ -18,6 +69,7 @@ class ApiInvoker(ABC):
         method: str,
         path: str,
         body: Any | None = None,
+        deadline: Deadline | None = None,
     ) -> Any:
         """
         Invoke the API.
@@ -26,17 +78,19 @@ class ApiInvoker(ABC):
             method: HTTP method.
             path: API path.
             body: Optional body.
+            deadline: Optional deadline for the request and all its retries.
 
         Returns:
             API response.
         """
 
-    def get(self, path: str) -> Any:
+    def get(self, path: str, deadline: Deadline | None = None) -> Any:
         """
         Invoke a GET request.
 
         Args:
             path: API path.
+            deadline: Optional deadline for the request and all its retries.
 
         Returns:
             API response.
@@ -45,15 +99,17 @@ class ApiInvoker(ABC):
         return self._invoke(
             "GET",
             path,
+            deadline=deadline,
         )
 
-    def post(self, path: str, body: Any) -> Any:
+    def post(self, path: str, body: Any, deadline: Deadline | None = None) -> Any:
         """
         Invoke a POST request.
 
         Args:
             path: API path.
             body: Request body.
+            deadline: Optional deadline for the request and all its retries.
 
         Returns:
             API response.
@@ -63,8 +119,20 @@ class ApiInvoker(ABC):
             "POST",
             path,
             body=body,
+            deadline=deadline,
         )
 
+    def close(self) -> None:
+        """
+        Release any resources held by the invoker.
+        """
+
+    def __enter__(self) -> "ApiInvoker":
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
 
 class HttpApiInvoker(ApiInvoker):
     """
@@ -73,68 +141,450 @@ class HttpApiInvoker(ApiInvoker):
     Args:
         auth_service: Authorisation service.
         endpoint: API endpoint. Must start with a protocol (i.e. "https://").
+        pool_connections: Number of per-host connection pools to keep.
+        pool_maxsize: Maximum number of keep-alive connections to keep per
+            host.
+        pool_block: Block when all `pool_maxsize` connections to a host are
+            in use rather than opening a temporary extra connection. Set this
+            to enforce a hard per-host connection limit.
+        retry_policy: Policy for retrying transient failures. Defaults to
+            `RetryPolicy()`.
+        timeout: Timeout for each HTTP request, in seconds. Either a single
+            value or a `(connect, read)` pair.
+        gzip_threshold: Compress request bodies of at least this many bytes
+            of JSON with gzip. Defaults to `None`, which never compresses.
+            Compressed responses are always accepted and decoded.
+        coalesce: Share one network call between identical requests that are
+            in flight at the same time. Only GETs and POSTs to
+            `IDEMPOTENT_POST_PATHS` are coalesced.
+        circuit_breaker: Optional breaker that fails requests fast while the
+            API is unhealthy. Every attempt, including retries, is checked
+            against it and recorded.
+        rate_limiters: Optional rate limiters for each class of endpoint.
+            Every attempt, including retries, waits for a token from the
+            limiter for its endpoint class.
     """
 
-    def __init__(self, auth_service: AuthService, endpoint: str) -> None:
+    def __init__(
+        self,
+        auth_service: AuthService,
+        endpoint: str,
+        pool_connections: int = DEFAULT_POOL_CONNECTIONS,
+        pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
+        pool_block: bool = False,
+        retry_policy: RetryPolicy | None = None,
+        timeout: TimeoutValue = DEFAULT_TIMEOUT,
+        gzip_threshold: int | None = None,
+        coalesce: bool = True,
+        circuit_breaker: CircuitBreaker | None = None,
+        rate_limiters: dict[EndpointClass, RateLimiter] | None = None,
+    ) -> None:
         self._auth_service = auth_service
         self._endpoint = endpoint
+        self._retry_policy = retry_policy or RetryPolicy()
+        self._timeout = timeout
+        self._gzip_threshold = gzip_threshold
+        self._coalesce = coalesce
+        self.circuit_breaker = circuit_breaker
+        self._rate_limiters = rate_limiters or {}
+
+        # Requests that are in flight, keyed by `_coalesce_key`.
+        self._in_flight: dict[tuple[str, str, str], Future[Any]] = {}
+        self._in_flight_lock = Lock()
+
+        # A single session lets us reuse keep-alive connections (and their TLS
+        # handshakes) across every request to the API.
+        adapter = HTTPAdapter(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            pool_block=pool_block,
+        )
+
+        self._session = Session()
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
+
+        # `requests` already asks for compressed responses and decodes them,
+        # but we say so explicitly rather than rely on its defaults.
+        self._session.headers["Accept-Encoding"] = "gzip, deflate"
+
+    def close(self) -> None:
+        """
+        Close all pooled connections.
+        """
+
+        self._session.close()
+
+    def _next_delay(
+        self,
+        attempt: int,
+        started: float,
+        deadline: Deadline | None,
+        retry_after: float | None = None,
+    ) -> float | None:
+        """
+        Get the time to wait before retrying, if a retry is allowed.
+
+        Args:
+            attempt: Number of attempts made so far.
+            started: `time.monotonic()` reading taken before the first
+                attempt.
+            deadline: Optional deadline for the request.
+            retry_after: Delay in seconds requested by the server, if any.
+
+        Returns:
+            Seconds to wait, or `None` if the request should not be retried.
+        """
+
+        delay = self._retry_policy.next_delay(attempt, started, retry_after)
+
+        if delay is not None and deadline is not None:
+            if delay >= deadline.remaining():
+                # Waiting would take us past the deadline, so give up now.
+                return None
+
+        return delay
+
+    @staticmethod
+    def _is_connect_error(error: ConnectionError | Timeout) -> bool:
+        """
+        Check whether a request failed before a connection was made, so the
+        server can't have received it.
+
+        Args:
+            error: The error raised by `requests`.
+
+        Returns:
+            `True` if the connection couldn't be made or timed out.
+        """
+
+        if isinstance(error, ConnectTimeout):
+            return True
+
+        # `requests` wraps urllib3's error, which wraps the reason.
+        reason = error.args[0] if error.args else None
+        reason = getattr(reason, "reason", reason)
+        return isinstance(reason, NewConnectionError)
+
+    def _encode_body(self, body: Any) -> dict[str, Any]:
+        """
+        Get the `requests` keyword arguments that send a JSON body,
+        compressing it if it is large enough.
+
+        Args:
+            body: Request body.
+
+        Returns:
+            Keyword arguments for `Session.request`. Headers to add are
+            under the "headers" key.
+        """
+
+        if self._gzip_threshold is None:
+            return {"json": body}
+
+        data = json.dumps(body, allow_nan=False).encode("utf-8")
+        headers = {"Content-Type": "application/json"}
+
+        if len(data) >= self._gzip_threshold:
+            data = gzip.compress(data, compresslevel=GZIP_COMPRESS_LEVEL)
+            headers["Content-Encoding"] = "gzip"
+
+        return {"data": data, "headers": headers}
+
+    def _coalesce_key(
+        self,
+        method: str,
+        path: str,
+        body: Any | None,
+    ) -> tuple[str, str, str] | None:
+        """
+        Get the key that identifies concurrent duplicates of a request.
+
+        Args:
+            method: HTTP method.
+            path: API path.
+            body: Optional body.
+
+        Returns:
+            The key, or `None` if the request must not be coalesced.
+        """
+
+        if not self._coalesce:
+            return None
+
+        if method != "GET" and not (method == "POST" and path in IDEMPOTENT_POST_PATHS):
+            return None
+
+        return (method, path, json.dumps(body, sort_keys=True))
 
     def _invoke(
         self,
         method: str,
         path: str,
         body: Any | None = None,
+        deadline: Deadline | None = None,
     ) -> Any:
         """
         Invoke the API.
 
+        If an identical idempotent request is already in flight, wait for
+        and share its response rather than make another call.
+
+        Args:
+            method: HTTP method.
+            path: API path.
+            body: Optional body.
+            deadline: Optional deadline for the request and all its retries.
+
+        Returns:
+            API response.
+
+        Raises:
+            DeadlineExceeded: Raised if the deadline passes before a response
+                is received.
+            CircuitOpenError: Raised if the circuit breaker is open.
+            HTTPError: Raised if the API responds with an error that can't be
+                retried, or the retry budget is spent.
+        """
+
+        key = self._coalesce_key(method, path, body)
+
+        if key is None:
+            return self._send(method, path, body, deadline)
+
+        while True:
+            with self._in_flight_lock:
+                future = self._in_flight.get(key)
+                is_leader = future is None
+
+                if is_leader:
+                    future = Future()
+                    self._in_flight[key] = future
+
+            if is_leader:
+                return self._send_shared(key, future, method, path, body, deadline)
+
+            done, _ = wait(
+                [future],
+                timeout=None if deadline is None else deadline.remaining(),
+            )
+
+            if not done:
+                raise DeadlineExceeded(f"{method} {path}")
+
+            error = future.exception()
+
+            if isinstance(error, DeadlineExceeded):
+                # The call we joined ran out of time, but our own deadline
+                # may allow another attempt.
+                continue
+
+            if error is not None:
+                raise error
+
+            # Every caller gets its own copy so none can change another's.
+            return deepcopy(future.result())
+
+    def _send_shared(
+        self,
+        key: tuple[str, str, str],
+        future: Future[Any],
+        method: str,
+        path: str,
+        body: Any | None,
+        deadline: Deadline | None,
+    ) -> Any:
+        """
+        Send a request and share its outcome with every caller waiting on
+        `future`.
+
         Args:
+            key: Coalescing key of the request.
+            future: Future that waiting callers share.
             method: HTTP method.
             path: API path.
             body: Optional body.
+            deadline: Optional deadline for the request and all its retries.
 
         Returns:
             API response.
         """
 
+        try:
+            result = self._send(method, path, body, deadline)
+        except BaseException as e:
+            self._finish(key)
+            future.set_exception(e)
+            raise
+
+        self._finish(key)
+        future.set_result(result)
+        return result
+
+    def _finish(self, key: tuple[str, str, str]) -> None:
+        """
+        Stop sharing an in-flight request so later callers make a fresh
+        call.
+
+        Args:
+            key: Coalescing key of the request.
+        """
+
+        with self._in_flight_lock:
+            del self._in_flight[key]
+
+    def _send(
+        self,
+        method: str,
+        path: str,
+        body: Any | None = None,
+        deadline: Deadline | None = None,
+    ) -> Any:
+        """
+        Send a request to the API.
+
+        Transient failures are retried according to the retry policy, and
+        the authorisation token is refreshed once if the API rejects it.
+        Requests that queue jobs are only retried if they can't have reached
+        the server: after connection errors and `REJECTED_STATUS_CODES`.
+
+        Args:
+            method: HTTP method.
+            path: API path.
+            body: Optional body.
+            deadline: Optional deadline for the request and all its retries.
+
+        Returns:
+            API response.
+
+        Raises:
+            DeadlineExceeded: Raised if the deadline passes before a request
+                can be made, including while waiting for the rate limit.
+            CircuitOpenError: Raised if the circuit breaker is open.
+            HTTPError: Raised if the API responds with an error that can't be
+                retried, or the retry budget is spent.
+        """
+
         url = join_uri(self._endpoint, path)
 
+        # Refresh ahead of expiry rather than waste a round trip on a 401.
+        self._auth_service.refresh_if_expiring()
+
+        # Remember the token the request is sent with, so a rejection only
+        # refreshes it if no other thread has already.
+        token = self._auth_service.token
+
         kwargs = {
             "headers": {
-                **self._auth_service.get_auth_header(),
+                **self._auth_service.get_auth_header(token=token),
             },
         }
 
+        if method == "POST":
+            # The same key is sent with every retry of this call so an API
+            # that supports it can recognise duplicate submissions.
+            kwargs["headers"][IDEMPOTENCY_KEY_HEADER] = str(uuid4())
+
         if body:
-            kwargs["json"] = body
+            # Encode once up front so retries don't serialise and compress
+            # the body again.
+            encoded = self._encode_body(body)
+            kwargs["headers"].update(encoded.pop("headers", {}))
+            kwargs.update(encoded)
+
+        endpoint_class = EndpointClass.for_core_api(method, path)
+        rate_limiter = self._rate_limiters.get(endpoint_class)
+
+        # Nothing shows the Core API drops duplicate submissions, so a
+        # request that queues a job is only retried if it can't have reached
+        # the server. Retrying after a read timeout or 5xx could run the job
+        # twice.
+        creates_job = endpoint_class == EndpointClass.QUEUE
 
         has_refreshed_token = False
+        attempt = 0
+        started = monotonic()
 
         while True:
-            response = request(
-                method,
-                url,
-                **kwargs,  # type: ignore
-            )
+            attempt += 1
 
-            if 200 <= response.status_code < 300:
-                return response.json()
+            if deadline is not None:
+                deadline.check(f"{method} {path}")
+
+            if rate_limiter is not None:
+                rate_limiter.acquire(deadline)
 
-            if has_refreshed_token:
-                # If we've already refreshed the authorisation token then the
-                # problem is probably unrelated, so don't try again.
-                response.raise_for_status()
-                return
+            # Clip after waiting for the rate limit, which may have used up
+            # the deadline. Raises rather than send a zero timeout.
+            timeout = clip_timeout(self._timeout, deadline, f"{method} {path}")
 
-            # Re-authenticate.
-            self._auth_service.refresh()
+            if self.circuit_breaker is not None:
+                self.circuit_breaker.before_call()
 
-            # Update the authorisation header.
-            kwargs["headers"] = {
-                **kwargs["headers"],
-                **self._auth_service.get_auth_header(),
-            }
+            try:
+                response = self._session.request(
+                    method,
+                    url,
+                    timeout=timeout,
+                    **kwargs,  # type: ignore
+                )
+            except (ConnectionError, Timeout) as e:
+                if self.circuit_breaker is not None:
+                    self.circuit_breaker.record_failure()
+
+                if creates_job and not self._is_connect_error(e):
+                    raise
+
+                delay = self._next_delay(attempt, started, deadline)
+                if delay is None:
+                    raise
+
+                sleep(delay)
+                continue
+            except Exception:
+                # Settle the attempt so a half-open breaker can't be left
+                # waiting for it.
+                if self.circuit_breaker is not None:
+                    self.circuit_breaker.record_failure()
+
+                raise
+
+            status_code = response.status_code
+
+            if self.circuit_breaker is not None:
+                self.circuit_breaker.record_status(status_code)
+
+            if 200 <= status_code < 300:
+                return response.json()
 
-            # Remember that we've refreshed the token in case the next
-            # attempt fails too.
-            has_refreshed_token = True
+            if status_code in AUTH_STATUS_CODES and not has_refreshed_token:
+                # Re-authenticate.
+                token = self._auth_service.refresh(token)
+
+                # Update the authorisation header.
+                kwargs["headers"] = {
+                    **kwargs["headers"],
+                    **self._auth_service.get_auth_header(token=token),
+                }
+
+                # Remember that we've refreshed the token in case the next
+                # attempt fails too. The refresh doesn't count towards the
+                # transient retry budget.
+                has_refreshed_token = True
+                attempt -= 1
+                continue
+
+            if self._retry_policy.is_retryable_status(status_code) and (
+                not creates_job or status_code in REJECTED_STATUS_CODES
+            ):
+                retry_after = self._retry_policy.parse_retry_after(
+                    response.headers.get("Retry-After"),
+                )
+
+                delay = self._next_delay(attempt, started, deadline, retry_after)
+                if delay is not None:
+                    sleep(delay)
+                    continue
+
+            response.raise_for_status()
+            return
@@ -1,9 +1,14 @@
 from functools import wraps
 from typing import Any, Callable, TypeVar
 
+from uncertainty_engine_resource_client.api_client import ApiClient
+from uncertainty_engine_resource_client.configuration import Configuration
 from uncertainty_engine_resource_client.exceptions import UnauthorizedException
 
+from uncertainty_engine.api_providers.resource_api_client import ResourceApiClient
 from uncertainty_engine.auth_service import AuthService
+from uncertainty_engine.circuit_breaker import CircuitBreaker
+from uncertainty_engine.rate_limit import RateLimiter
 
 # Define a type variable for return values
 T = TypeVar("T")
@@ -22,11 +27,19 @@ class ApiProviderBase:
     def with_auth_refresh(cls, func: Callable[..., T]) -> Callable[..., T]:
         @wraps(func)
         def wrapper(self: ApiProviderBase, *args: Any, **kwargs: Any) -> T:
+            # Refresh ahead of expiry rather than waste a round trip on a 401.
+            if self.auth_service.refresh_if_expiring():
+                self.update_api_authentication()
+
+            # The token the call is made with, so a rejection only refreshes
+            # it if no other thread has already.
+            token = self.auth_service.token
+
             try:
                 return func(self, *args, **kwargs)
             except UnauthorizedException:
                 # Refresh token
-                self.auth_service.refresh()
+                self.auth_service.refresh(token)
                 self.update_api_authentication()
                 # Retry the operation with refreshed token
                 return func(self, *args, **kwargs)
@@ -35,6 +48,55 @@ class ApiProviderBase:
 
         return wrapper
 
+    @staticmethod
+    def create_api_client(
+        deployment: str,
+        pool_maxsize: int | None = None,
+        circuit_breaker: CircuitBreaker | None = None,
+        rate_limiter: RateLimiter | None = None,
+    ) -> ApiClient:
+        """
+        Create a Resource Service API client.
+
+        An API client owns a pool of connections, so create one per
+        deployment and share it between providers.
+
+        Args:
+            deployment: API endpoint.
+            pool_maxsize: Maximum number of connections to keep open to the
+                API. Defaults to the generated client's default.
+            circuit_breaker: Optional breaker that fails requests fast while
+                the API is unhealthy.
+            rate_limiter: Optional limiter that every request waits on.
+
+        Returns:
+            An API client.
+        """
+        configuration = Configuration(host=deployment)
+
+        if pool_maxsize is not None:
+            configuration.connection_pool_maxsize = pool_maxsize
+
+        return ResourceApiClient(
+            configuration,
+            circuit_breaker=circuit_breaker,
+            rate_limiter=rate_limiter,
+        )
+
+    @staticmethod
+    def set_default_headers(api_client: ApiClient, headers: dict[str, str]) -> None:
+        """
+        Merge headers into an API client's default headers.
+
+        The headers dictionary is replaced rather than updated in place, so
+        requests being prepared on other threads never see it change.
+
+        Args:
+            api_client: API client to update.
+            headers: Headers to add or replace.
+        """
+        api_client.default_headers = {**api_client.default_headers, **headers}
+
     def update_api_authentication(self) -> None:
         """
         All API providers that wish to use token refreshing must implement this method.
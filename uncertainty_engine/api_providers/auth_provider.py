@@ -1,6 +1,5 @@
 from uncertainty_engine_resource_client.api.auth_api import AuthApi
 from uncertainty_engine_resource_client.api_client import ApiClient
-from uncertainty_engine_resource_client.configuration import Configuration
 from uncertainty_engine_resource_client.models.token_response import TokenResponse
 
 from uncertainty_engine.api_providers import ApiProviderBase
@@ -14,12 +13,19 @@ class AuthProvider(ApiProviderBase):
     Args:
         auth_service: Authorisation service.
         deployment: API endpoint.
+        api_client: API client to share with other providers. Defaults to a
+            new client for `deployment`.
     """
 
-    def __init__(self, auth_service: AuthService, deployment: str) -> None:
+    def __init__(
+        self,
+        auth_service: AuthService,
+        deployment: str,
+        api_client: ApiClient | None = None,
+    ) -> None:
         super().__init__(deployment, auth_service)
 
-        self.client = ApiClient(configuration=Configuration(host=deployment))
+        self.client = api_client or self.create_api_client(deployment)
         self.auth_client = AuthApi(self.client)
 
         self.update_api_authentication()
@@ -30,26 +36,29 @@ class AuthProvider(ApiProviderBase):
         Gets a set of Resource Service tokens.
         """
 
-        return self.auth_client.get_tokens()
+        # The API client may be shared with other providers, so the ID token
+        # is sent only with the request that needs it.
+        headers = self.auth_service.get_auth_header(include_id=True)
+
+        return self.auth_client.get_tokens(
+            _headers={"X-ID-Token": headers["X-ID-Token"]},
+        )
 
     def update_api_authentication(self) -> None:
         """
-        Updates the client's authorisation and identity headers.
+        Updates the client's authorisation headers.
         """
 
         if not self.auth_service.token:
             return
 
-        headers = self.auth_service.get_auth_header(
-            # Resource tokens are generated by the "/auth/token"
-            # endpoint, which expects the "X-Resource-Service-Token"
-            # header to be populated with an access token rather than a
-            # resource token.
-            #
-            # We expect to hit that endpoint only when we don't have a
-            # resource token, so it's okay to populate the headers here
-            # with the best token we have available at the time.
-            include_id=True,
-        )
+        # Resource tokens are generated by the "/auth/token" endpoint, which
+        # expects the "X-Resource-Service-Token" header to be populated with
+        # an access token rather than a resource token.
+        #
+        # We expect to hit that endpoint only when we don't have a resource
+        # token, so it's okay to populate the headers here with the best
+        # token we have available at the time.
+        headers = self.auth_service.get_auth_header()
 
-        self.client.default_headers.update(headers)
+        self.set_default_headers(self.client, headers)
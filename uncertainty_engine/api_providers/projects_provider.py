@@ -3,7 +3,6 @@ from typing import Optional
 from pydantic import ValidationError
 from uncertainty_engine_resource_client.api import AccountRecordsApi, ProjectRecordsApi
 from uncertainty_engine_resource_client.api_client import ApiClient
-from uncertainty_engine_resource_client.configuration import Configuration
 from uncertainty_engine_resource_client.exceptions import ApiException
 from uncertainty_engine_resource_client.models import ProjectRecordOutput
 
@@ -22,7 +21,10 @@ class ProjectsProvider(ApiProviderBase):
     """
 
     def __init__(
-        self, auth_service: AuthService, deployment: str = DEFAULT_RESOURCE_DEPLOYMENT
+        self,
+        auth_service: AuthService,
+        deployment: str = DEFAULT_RESOURCE_DEPLOYMENT,
+        api_client: Optional[ApiClient] = None,
     ):
         """
         Create an instance of a ProjectsProvider.
@@ -31,11 +33,13 @@ class ProjectsProvider(ApiProviderBase):
             deployment: The URL of the resource service. You typically won't need
                         to change this unless instructed by support.
             auth_service: Handles your authentication.
+            api_client: An API client to share with other providers. Defaults
+                        to a new client for `deployment`.
         """
         super().__init__(deployment, auth_service)
 
         # Initialize the generated API client
-        self.client = ApiClient(configuration=Configuration(host=deployment))
+        self.client = api_client or self.create_api_client(deployment)
         # NOTE: The accounts client is currently required for GET projects endpoint
         self.accounts_client = AccountRecordsApi(self.client)
         self.projects_client = ProjectRecordsApi(self.client)
@@ -47,11 +51,9 @@ class ProjectsProvider(ApiProviderBase):
         """Update API client with current auth headers"""
         if self.auth_service.is_authenticated:
             auth_header = self.auth_service.get_auth_header()
-            self.client.default_headers.update(auth_header)
-
-            # Update the API instances with the new header
-            self.accounts_client.api_client.default_headers.update(auth_header)
-            self.projects_client.api_client.default_headers.update(auth_header)
+            # The API instances share this client, so they pick up the new
+            # headers too.
+            self.set_default_headers(self.client, auth_header)
 
     @property
     def account_id(self) -> Optional[str]:
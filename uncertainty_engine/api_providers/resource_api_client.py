@@ -0,0 +1,56 @@
+from typing import Any
+
+from uncertainty_engine_resource_client.api_client import ApiClient
+from uncertainty_engine_resource_client.configuration import Configuration
+from uncertainty_engine_resource_client.rest import RESTResponse
+
+from uncertainty_engine.circuit_breaker import CircuitBreaker
+from uncertainty_engine.rate_limit import RateLimiter
+
+
+class ResourceApiClient(ApiClient):
+    """
+    Resource Service API client that checks every request against an
+    optional rate limiter and circuit breaker.
+
+    Args:
+        configuration: Client configuration.
+        circuit_breaker: Optional breaker that fails requests fast while the
+            Resource Service is unhealthy.
+        rate_limiter: Optional limiter that every request waits on.
+    """
+
+    def __init__(
+        self,
+        configuration: Configuration,
+        circuit_breaker: CircuitBreaker | None = None,
+        rate_limiter: RateLimiter | None = None,
+    ) -> None:
+        super().__init__(configuration=configuration)
+        self.circuit_breaker = circuit_breaker
+        self.rate_limiter = rate_limiter
+
+    def call_api(self, *args: Any, **kwargs: Any) -> RESTResponse:
+        """
+        Make an HTTP request.
+
+        Raises:
+            CircuitOpenError: Raised if the circuit breaker is open.
+        """
+
+        if self.rate_limiter is not None:
+            self.rate_limiter.acquire()
+
+        if self.circuit_breaker is None:
+            return super().call_api(*args, **kwargs)
+
+        self.circuit_breaker.before_call()
+
+        try:
+            response = super().call_api(*args, **kwargs)
+        except Exception:
+            self.circuit_breaker.record_failure()
+            raise
+
+        self.circuit_breaker.record_status(response.status)
+        return response
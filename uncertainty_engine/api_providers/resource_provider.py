@@ -5,7 +5,6 @@ from typing import Any, Optional
 import requests
 from uncertainty_engine_resource_client.api import ProjectRecordsApi, ResourcesApi
 from uncertainty_engine_resource_client.api_client import ApiClient
-from uncertainty_engine_resource_client.configuration import Configuration
 from uncertainty_engine_resource_client.exceptions import ApiException
 from uncertainty_engine_resource_client.models import (
     PostResourceRecordRequest,
@@ -18,6 +17,12 @@ from uncertainty_engine_resource_client.models import (
 from uncertainty_engine.api_providers import ApiProviderBase
 from uncertainty_engine.api_providers.constants import DEFAULT_RESOURCE_DEPLOYMENT
 from uncertainty_engine.auth_service import AuthService
+from uncertainty_engine.timeouts import (
+    DEFAULT_TIMEOUT,
+    Deadline,
+    TimeoutValue,
+    clip_timeout,
+)
 from uncertainty_engine.utils import format_api_error
 
 # Set up logging
@@ -40,7 +45,11 @@ class ResourceProvider(ApiProviderBase):
     """
 
     def __init__(
-        self, auth_service: AuthService, deployment: str = DEFAULT_RESOURCE_DEPLOYMENT
+        self,
+        auth_service: AuthService,
+        deployment: str = DEFAULT_RESOURCE_DEPLOYMENT,
+        timeout: TimeoutValue = DEFAULT_TIMEOUT,
+        api_client: Optional[ApiClient] = None,
     ):
         """
         Create an instance of a ResourceProvider
@@ -49,11 +58,18 @@ class ResourceProvider(ApiProviderBase):
             auth_service: Handles your authentication.
             deployment: The URL of the resource service. You typically won't need
                         to change this unless instructed by support.
+            timeout: Timeout in seconds for each HTTP request made while
+                     transferring a resource. Either a single value or a
+                     `(connect, read)` pair.
+            api_client: An API client to share with other providers. Defaults
+                        to a new client for `deployment`.
         """
         super().__init__(deployment, auth_service)
 
+        self.timeout = timeout
+
         # Initialize the generated API client
-        self.client = ApiClient(configuration=Configuration(host=deployment))
+        self.client = api_client or self.create_api_client(deployment)
         self.projects_client = ProjectRecordsApi(self.client)
         self.resources_client = ResourcesApi(self.client)
 
@@ -66,11 +82,27 @@ class ResourceProvider(ApiProviderBase):
 
             auth_header = self.auth_service.get_auth_header()
 
-            self.client.default_headers.update(auth_header)
+            # The API instances share this client, so they pick up the new
+            # headers too.
+            self.set_default_headers(self.client, auth_header)
 
-            # Update the API instances with the new header
-            self.projects_client.api_client.default_headers.update(auth_header)
-            self.resources_client.api_client.default_headers.update(auth_header)
+    def _request_timeout(
+        self, deadline: Optional[Deadline], operation: str
+    ) -> TimeoutValue:
+        """
+        Get the timeout for the next request of a transfer.
+
+        Args:
+            deadline: Optional deadline for the whole transfer.
+            operation: Description of the transfer for the error message.
+
+        Returns:
+            The request timeout, shortened to fit within the deadline.
+
+        Raises:
+            DeadlineExceeded: If the deadline has already passed.
+        """
+        return clip_timeout(self.timeout, deadline, operation)
 
     @property
     def account_id(self) -> Optional[str]:
@@ -89,6 +121,7 @@ class ResourceProvider(ApiProviderBase):
         name: str,
         resource_type: str,
         file_path: str,
+        deadline: Optional[float | Deadline] = None,
     ) -> str:
         """
         Upload a file to your project.
@@ -101,10 +134,15 @@ class ResourceProvider(ApiProviderBase):
             name: A friendly name for this file (e.g., "2023 Sales Data")
             resource_type: The category for this file (e.g., "dataset", "model", "document")
             file_path: Where the file is on your computer
+            deadline: Optional time limit in seconds, or a `Deadline`, for the
+                      whole upload
 
         Returns:
             A resource ID that you can use later to download or update this file
 
+        Raises:
+            DeadlineExceeded: If the upload doesn't finish before the deadline
+
         Example:
             >>> resource_id = client.upload(
             ...     project_id="your-project-123",
@@ -119,6 +157,8 @@ class ResourceProvider(ApiProviderBase):
         if not self.account_id:
             raise ValueError("Authentication required before uploading resources")
 
+        deadline = Deadline.coerce(deadline)
+
         file_extension = os.path.splitext(file_path)[1].lstrip(".").lower()
 
         if resource_type == "dataset" and file_extension != "csv":
@@ -135,9 +175,10 @@ class ResourceProvider(ApiProviderBase):
         )
         request_body = PostResourceRecordRequest(resource_record=resource_record)
 
+        timeout = self._request_timeout(deadline, "resource upload")
         try:
             resource_response = self.resources_client.post_resource_record(
-                project_id, resource_type, request_body
+                project_id, resource_type, request_body, _request_timeout=timeout
             )
             resource_id = resource_response.resource_record.id
         except ApiException as e:
@@ -156,9 +197,14 @@ class ResourceProvider(ApiProviderBase):
             resource_file_extension=file_extension,
         )
 
+        timeout = self._request_timeout(deadline, "resource upload")
         try:
             version_response = self.resources_client.post_resource_version(
-                project_id, resource_type, resource_id, resource_version_record
+                project_id,
+                resource_type,
+                resource_id,
+                resource_version_record,
+                _request_timeout=timeout,
             )
             upload_url = version_response.url
             pending_id = version_response.pending_record_id
@@ -168,9 +214,10 @@ class ResourceProvider(ApiProviderBase):
             raise Exception(f"Error creating version record: {str(e)}")
 
         # Upload the file to the presigned URL
+        timeout = self._request_timeout(deadline, "resource upload")
         try:
             with open(file_path, "rb") as file:
-                response = requests.put(upload_url, data=file)
+                response = requests.put(upload_url, data=file, timeout=timeout)
 
                 if response.status_code != 200:
                     raise Exception(
@@ -181,9 +228,14 @@ class ResourceProvider(ApiProviderBase):
             raise Exception(f"Error uploading file to presigned URL: {str(e)}")
 
         # Complete the upload process
+        timeout = self._request_timeout(deadline, "resource upload")
         try:
             self.resources_client.put_upload_resource_version(
-                project_id, resource_type, resource_id, pending_id
+                project_id,
+                resource_type,
+                resource_id,
+                pending_id,
+                _request_timeout=timeout,
             )
         except ApiException as e:
             raise Exception(f"Error completing upload: {format_api_error(e)}")
@@ -199,6 +251,7 @@ class ResourceProvider(ApiProviderBase):
         resource_type: str,
         resource_id: str,
         file_path: Optional[str] = None,
+        deadline: Optional[float | Deadline] = None,
     ) -> Optional[Any]:
         """
         Download a file from your project to your computer.
@@ -214,10 +267,15 @@ class ResourceProvider(ApiProviderBase):
             resource_type: The category of the file (e.g., "dataset", "model", "document")
             resource_id: The ID of the file you want to download
             file_path: Where to upload the file on your computer
+            deadline: Optional time limit in seconds, or a `Deadline`, for the
+                      whole download
 
         Returns:
             resource - If no filepath has been provided
 
+        Raises:
+            DeadlineExceeded: If the download doesn't finish before the deadline
+
         Example:
             >>> client.download(
             ...     project_id="your-project-123",
@@ -234,10 +292,13 @@ class ResourceProvider(ApiProviderBase):
         if file_path:
             os.makedirs(os.path.dirname(os.path.abspath(file_path)), exist_ok=True)
 
+        deadline = Deadline.coerce(deadline)
+
         # Get the resource version and download URL
+        timeout = self._request_timeout(deadline, "resource download")
         try:
             resource_response = self.resources_client.get_latest_resource_version(
-                project_id, resource_type, resource_id
+                project_id, resource_type, resource_id, _request_timeout=timeout
             )
             download_url = resource_response.url
         except ApiException as e:
@@ -245,8 +306,9 @@ class ResourceProvider(ApiProviderBase):
         except Exception as e:
             raise Exception(f"Error retrieving resource: {str(e)}")
 
+        timeout = self._request_timeout(deadline, "resource download")
         try:
-            response = requests.get(download_url)
+            response = requests.get(download_url, timeout=timeout)
             response.raise_for_status()  # Raise an exception for HTTP errors
         except Exception as e:
             raise Exception(f"Error saving downloaded file: {str(e)}")
@@ -266,6 +328,7 @@ class ResourceProvider(ApiProviderBase):
         resource_type: str,
         resource_id: str,
         file_path: str,
+        deadline: Optional[float | Deadline] = None,
     ) -> None:
         """
         Upload a new version of an existing resource.
@@ -278,6 +341,11 @@ class ResourceProvider(ApiProviderBase):
             resource_type: The category of the file (e.g., "dataset", "model", "document")
             resource_id: The ID of the resource you want to update
             file_path: Where the new version is on your computer
+            deadline: Optional time limit in seconds, or a `Deadline`, for the
+                      whole update
+
+        Raises:
+            DeadlineExceeded: If the update doesn't finish before the deadline
 
         Example:
             >>> client.update(
@@ -297,11 +365,13 @@ class ResourceProvider(ApiProviderBase):
             raise FileNotFoundError(f"File not found: {file_path}")
 
         file_extension = os.path.splitext(file_path)[1].lstrip(".")
+        deadline = Deadline.coerce(deadline)
 
         # Get the resource information to create a meaningful version name
+        timeout = self._request_timeout(deadline, "resource update")
         try:
             resource = self.resources_client.get_resource_record(
-                project_id, resource_type, resource_id
+                project_id, resource_type, resource_id, _request_timeout=timeout
             )
             resource_name = resource.resource_record.name
             version_count = len(resource.resource_record.versions)
@@ -318,9 +388,14 @@ class ResourceProvider(ApiProviderBase):
             resource_file_extension=file_extension,
         )
 
+        timeout = self._request_timeout(deadline, "resource update")
         try:
             version_response = self.resources_client.post_resource_version(
-                project_id, resource_type, resource_id, resource_version_record
+                project_id,
+                resource_type,
+                resource_id,
+                resource_version_record,
+                _request_timeout=timeout,
             )
             upload_url = version_response.url
             pending_id = version_response.pending_record_id
@@ -330,9 +405,10 @@ class ResourceProvider(ApiProviderBase):
             raise Exception(f"Error creating version record: {str(e)}")
 
         # Upload the file to the presigned URL
+        timeout = self._request_timeout(deadline, "resource update")
         try:
             with open(file_path, "rb") as file:
-                response = requests.put(upload_url, data=file)
+                response = requests.put(upload_url, data=file, timeout=timeout)
 
                 if response.status_code != 200:
                     raise Exception(
@@ -343,9 +419,14 @@ class ResourceProvider(ApiProviderBase):
             raise Exception(f"Error uploading file to presigned URL: {str(e)}")
 
         # Complete the upload process
+        timeout = self._request_timeout(deadline, "resource update")
         try:
             self.resources_client.put_upload_resource_version(
-                project_id, resource_type, resource_id, pending_id
+                project_id,
+                resource_type,
+                resource_id,
+                pending_id,
+                _request_timeout=timeout,
             )
         except ApiException as e:
             raise Exception(f"Error finalizing upload: {format_api_error(e)}")
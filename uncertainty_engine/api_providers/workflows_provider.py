@@ -3,7 +3,6 @@ from typing import Optional
 from pydantic import ValidationError
 from uncertainty_engine_resource_client.api import ProjectRecordsApi, WorkflowsApi
 from uncertainty_engine_resource_client.api_client import ApiClient
-from uncertainty_engine_resource_client.configuration import Configuration
 from uncertainty_engine_resource_client.exceptions import ApiException
 from uncertainty_engine_resource_client.models import (
     PostWorkflowRecordRequest,
@@ -45,7 +44,10 @@ class WorkflowsProvider(ApiProviderBase):
     """
 
     def __init__(
-        self, auth_service: AuthService, deployment: str = DEFAULT_RESOURCE_DEPLOYMENT
+        self,
+        auth_service: AuthService,
+        deployment: str = DEFAULT_RESOURCE_DEPLOYMENT,
+        api_client: Optional[ApiClient] = None,
     ):
         """
         Create an instance of a WorkflowsProvider.
@@ -54,11 +56,13 @@ class WorkflowsProvider(ApiProviderBase):
             deployment: The URL of the resource service. You typically won't need
                         to change this unless instructed by support.
             auth_service: Handles your authentication.
+            api_client: An API client to share with other providers. Defaults
+                        to a new client for `deployment`.
         """
         super().__init__(deployment, auth_service)
 
         # Initialize the generated API client
-        self.client = ApiClient(configuration=Configuration(host=deployment))
+        self.client = api_client or self.create_api_client(deployment)
         self.projects_client = ProjectRecordsApi(self.client)
         self.workflows_client = WorkflowsApi(self.client)
 
@@ -75,11 +79,9 @@ class WorkflowsProvider(ApiProviderBase):
 
             auth_header = self.auth_service.get_auth_header()
 
-            self.client.default_headers.update(auth_header)
-
-            # Update the API instances with the new header
-            self.projects_client.api_client.default_headers.update(auth_header)
-            self.workflows_client.api_client.default_headers.update(auth_header)
+            # The API instances share this client, so they pick up the new
+            # headers too.
+            self.set_default_headers(self.client, auth_header)
 
     @property
     def account_id(self) -> Optional[str]:
@@ -0,0 +1,559 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Optional,
+    Sequence,
+    TypeVar,
+    Union,
+)
+
+from typeguard import typechecked
+from uncertainty_engine_types import (
+    JobInfo,
+    JobStatus,
+    NodeInfo,
+    NodeQuery,
+    OverrideWorkflowInput,
+    OverrideWorkflowOutput,
+)
+
+from uncertainty_engine.client import Client, Job
+from uncertainty_engine.environments import Environment
+from uncertainty_engine.exceptions import DeadlineExceeded
+from uncertainty_engine.job_retry import JobRetryPolicy
+from uncertainty_engine.nodes.base import Node
+from uncertainty_engine.polling import PollStrategy
+from uncertainty_engine.timeouts import Deadline
+
+T = TypeVar("T")
+
+DEFAULT_MAX_CONCURRENCY = 32
+"""
+Default maximum number of HTTP requests an `AsyncClient` makes at once.
+"""
+
+
+class AsyncProvider:
+    """
+    Exposes every method of an API provider as a coroutine.
+
+    Args:
+        provider: The synchronous provider to wrap.
+        run: Coroutine factory that runs a blocking call off the event loop.
+    """
+
+    def __init__(
+        self,
+        provider: Any,
+        run: Callable[..., Awaitable[Any]],
+    ) -> None:
+        self._provider = provider
+        self._run = run
+
+    def __getattr__(self, name: str) -> Any:
+        attr = getattr(self._provider, name)
+
+        if not callable(attr):
+            return attr
+
+        async def method(*args: Any, **kwargs: Any) -> Any:
+            return await self._run(attr, *args, **kwargs)
+
+        return method
+
+
+@typechecked
+class AsyncClient:
+    def __init__(
+        self,
+        env: Environment | str = "prod",
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        **client_options: Any,
+    ):
+        """
+        An asyncio client for interacting with the Uncertainty Engine.
+
+        Every method is a coroutine that never blocks the event loop. HTTP
+        requests share the connection pool, retries, deadlines and token
+        refresh of a `Client` and run on a pool of `max_concurrency` worker
+        threads. Waiting for jobs uses `asyncio.sleep`, so thousands of jobs
+        can be in flight from one process.
+
+        Args:
+            env: Environment configuration or name of a deployed environment.
+                Defaults to the main Uncertainty Engine environment.
+            max_concurrency: Maximum number of HTTP requests to make at once.
+            client_options: Additional keyword arguments for `Client`.
+
+        Example:
+            >>> async with AsyncClient() as client:
+            ...     await client.authenticate()
+            ...     add_node = Node(node_name="Add", lhs=1, rhs=2, label="add")
+            ...     jobs = [client.run_node(add_node) for _ in range(100)]
+            ...     results = await asyncio.gather(*jobs)
+        """
+
+        client_options.setdefault("pool_maxsize", max_concurrency)
+
+        self.client = Client(env=env, **client_options)
+        """
+        The synchronous client that performs each request.
+        """
+
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_concurrency,
+            thread_name_prefix="uncertainty-engine",
+        )
+
+        self.resources = AsyncProvider(self.client.resources, self._run)
+        """
+        Resource Service resource operations as coroutines.
+        """
+
+        self.projects = AsyncProvider(self.client.projects, self._run)
+        """
+        Resource Service project operations as coroutines.
+        """
+
+        self.workflows = AsyncProvider(self.client.workflows, self._run)
+        """
+        Resource Service workflow operations as coroutines.
+        """
+
+    async def __aenter__(self) -> "AsyncClient":
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """
+        Close all pooled connections and stop the worker threads.
+        """
+
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        self.client.close()
+
+    async def _run(self, func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """
+        Run a blocking call on a worker thread.
+
+        Args:
+            func: Function to call.
+            args: Positional arguments for `func`.
+            kwargs: Keyword arguments for `func`.
+
+        Returns:
+            The result of `func`.
+        """
+
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._executor,
+            partial(func, *args, **kwargs),
+        )
+
+    async def authenticate(self) -> None:
+        """
+        Authenticate the user with the Uncertainty Engine.
+        """
+        await self._run(self.client.authenticate)
+
+    async def list_nodes(self, category: Optional[str] = None) -> list:
+        """
+        List all available nodes in the specified deployment.
+
+        Args:
+            category: The category of nodes to list. If not specified, all nodes are listed.
+                Defaults to ``None``.
+
+        Returns:
+            List of available nodes. Each list item is a dictionary of information about the node.
+        """
+        return await self._run(self.client.list_nodes, category)
+
+    async def get_node_info(self, node: str, version: str | int) -> NodeInfo:
+        """
+        Obtain a `NodeInfo` object for a given node and version.
+
+        Args:
+            node: The ID of the node to get information about.
+            version: The version of the node to get information about.
+
+        Returns:
+            Information about the node as a `NodeInfo` object.
+        """
+        return await self._run(self.client.get_node_info, node, version)
+
+    async def query_nodes(self, queries: list[NodeQuery]) -> dict[str, NodeInfo]:
+        """
+        Query information for a set of nodes specified by node_id and version.
+
+        Args:
+            queries: A list of NodeQuery objects.
+
+        Returns:
+            Dictionary mapping '<node_id>@<version>' to NodeInfo objects.
+        """
+        return await self._run(self.client.query_nodes, queries)
+
+    async def queue_node(
+        self,
+        node: Union[str, Node],
+        inputs: Optional[dict[str, Any]] = None,
+        deadline: Optional[Union[float, Deadline]] = None,
+    ) -> Job:
+        """
+        Queue a node for execution.
+
+        Args:
+            node: The name of the node to execute or the node object itself.
+            inputs: The input data for the node. If the node is defined by its name,
+                this is required. Defaults to ``None``.
+            deadline: Optional time limit in seconds, or a `Deadline`, for
+                the request and all of its retries. Defaults to ``None``.
+
+        Returns:
+            A Job object representing the queued job.
+        """
+        return await self._run(
+            self.client.queue_node,
+            node,
+            inputs,
+            deadline=deadline,
+        )
+
+    async def queue_workflow(
+        self,
+        project_id: str,
+        workflow_id: str,
+        inputs: Optional[list[OverrideWorkflowInput]] = None,
+        outputs: Optional[list[OverrideWorkflowOutput]] = None,
+        deadline: Optional[Union[float, Deadline]] = None,
+    ) -> Job:
+        """
+        Queue a workflow for execution.
+
+        Args:
+            project_id: The ID of the project where the workflow is saved
+            workflow_id: The ID of the workflow you want to run
+            inputs: Optional list of inputs to override within the workflow
+            outputs: Optional list of outputs to override
+            deadline: Optional time limit in seconds, or a `Deadline`, for
+                the request and all of its retries
+
+        Returns:
+            A Job object representing the queued job.
+        """
+        return await self._run(
+            self.client.queue_workflow,
+            project_id,
+            workflow_id,
+            inputs,
+            outputs,
+            deadline=deadline,
+        )
+
+    async def job_status(
+        self,
+        job: Job,
+        deadline: Optional[Union[float, Deadline]] = None,
+    ) -> JobInfo:
+        """
+        Check the status of a job.
+
+        Args:
+            job: The job to check.
+            deadline: Optional time limit in seconds, or a `Deadline`, for
+                the request and all of its retries. Defaults to ``None``.
+
+        Returns:
+            A JobInfo object containing the response data of the job.
+        """
+        return await self._run(self.client.job_status, job, deadline=deadline)
+
+    async def cancel_job(self, job: Job) -> bool:
+        """
+        Cancel a job.
+
+        Args:
+            job: The job to cancel.
+
+        Returns:
+            True if the job was successfully cancelled.
+        """
+        return await self._run(self.client.cancel_job, job)
+
+    async def cancel_jobs(self, jobs: Sequence[Job]) -> list[Union[bool, Exception]]:
+        """
+        Cancel many jobs at once.
+
+        Args:
+            jobs: The jobs to cancel.
+
+        Returns:
+            Whether each job was cancelled, or the error raised while
+            cancelling it, in the same order as `jobs`.
+        """
+        return await asyncio.gather(
+            *[self.cancel_job(job) for job in jobs],
+            return_exceptions=True,
+        )
+
+    async def view_tokens(self) -> int:
+        """
+        View the number of tokens currently available to the user's
+        organisation.
+
+        Returns:
+            The number of tokens currently available.
+        """
+        return await self._run(self.client.view_tokens)
+
+    async def wait_for_job(
+        self,
+        job: Job,
+        deadline: Optional[Union[float, Deadline]] = None,
+        poll: Optional[PollStrategy] = None,
+        timeout: Optional[float] = None,
+        cancel_on_timeout: bool = False,
+    ) -> JobInfo:
+        """
+        Wait for a job to complete without blocking the event loop.
+
+        Args:
+            job: The job to wait for.
+            deadline: Optional time limit in seconds, or a `Deadline`, for
+                every status poll. Defaults to ``None``.
+            poll: Strategy for waiting between status checks. Defaults to the
+                client's `poll_strategy`.
+            timeout: Optional time limit in seconds for the job to finish.
+                Defaults to ``None``.
+            cancel_on_timeout: Whether to cancel the job if it doesn't finish
+                in time. Defaults to ``False``.
+
+        Returns:
+            A JobInfo object containing the response data of the job.
+
+        Raises:
+            JobTimeoutError: Raised if the job doesn't finish before the
+                deadline or timeout.
+        """
+        deadline = Deadline.earliest(
+            Deadline.coerce(deadline),
+            Deadline.coerce(timeout),
+        )
+
+        try:
+            async for response in self._poll_job(job, deadline, poll):
+                pass
+        except DeadlineExceeded as e:
+            raise await self._run(
+                self.client._timed_out,
+                [job],
+                cancel_on_timeout,
+            ) from e
+
+        return response
+
+    async def watch(
+        self,
+        job: Job,
+        deadline: Optional[Union[float, Deadline]] = None,
+        poll: Optional[PollStrategy] = None,
+    ) -> AsyncIterator[JobInfo]:
+        """
+        Follow the progress of a job without blocking the event loop.
+
+        A `JobInfo` is only yielded when the job's status or message changes.
+
+        Args:
+            job: The job to follow.
+            deadline: Optional time limit in seconds, or a `Deadline`, for
+                the job to finish. Defaults to ``None``.
+            poll: Strategy for waiting between status checks. Defaults to the
+                client's `poll_strategy`.
+
+        Returns:
+            An async iterator of the job's `JobInfo` each time it changes. The
+            last has a terminal status.
+
+        Raises:
+            JobTimeoutError: Raised if the job doesn't finish before the
+                deadline.
+
+        Example:
+            >>> job = await client.queue_node(node)
+            >>> async for info in client.watch(job):
+            ...     print(info.status, info.message)
+        """
+        deadline = Deadline.coerce(deadline)
+        last: Optional[tuple[JobStatus, Optional[str]]] = None
+
+        try:
+            async for info in self._poll_job(job, deadline, poll):
+                current = (JobStatus(info.status.value), info.message)
+                if current != last:
+                    last = current
+                    yield info
+        except DeadlineExceeded as e:
+            raise await self._run(self.client._timed_out, [job], False) from e
+
+    async def _poll_job(
+        self,
+        job: Job,
+        deadline: Optional[Deadline],
+        poll: Optional[PollStrategy],
+    ) -> AsyncIterator[JobInfo]:
+        """
+        Check the status of a job until it finishes.
+
+        Args:
+            job: The job to check.
+            deadline: Optional deadline for the job to finish.
+            poll: Strategy for waiting between status checks. Defaults to the
+                client's `poll_strategy`.
+
+        Returns:
+            An async iterator of the `JobInfo` from every status check. The
+            last has a terminal status.
+
+        Raises:
+            DeadlineExceeded: Raised if the job doesn't finish before the
+                deadline.
+        """
+        delays = (poll or self.client.poll_strategy).delays_for(job)
+
+        response = await self.job_status(job, deadline=deadline)
+        yield response
+
+        while not JobStatus(response.status.value).is_terminal():
+            wait_time = next(delays)
+            if deadline is not None:
+                wait_time = min(wait_time, deadline.remaining())
+
+            await asyncio.sleep(wait_time)
+
+            if deadline is not None:
+                deadline.check(f"job {job.job_id}")
+
+            response = await self.job_status(job, deadline=deadline)
+            yield response
+
+    async def run_node(
+        self,
+        node: Union[str, Node],
+        inputs: Optional[dict[str, Any]] = None,
+        deadline: Optional[Union[float, Deadline]] = None,
+        poll: Optional[PollStrategy] = None,
+        timeout: Optional[float] = None,
+        cancel_on_timeout: bool = False,
+        retry: Optional[JobRetryPolicy] = None,
+    ) -> JobInfo:
+        """
+        Queue a node and wait for it to complete.
+
+        Args:
+            node: The name of the node to execute or the node object itself.
+            inputs: The input data for the node. If the node is defined by its name,
+                this is required. Defaults to ``None``.
+            deadline: Optional time limit in seconds, or a `Deadline`, covering
+                queueing, every status poll and all retries. Defaults to ``None``.
+            poll: Strategy for waiting between status checks. Defaults to the
+                client's `poll_strategy`.
+            timeout: Optional time limit in seconds for the job to finish once
+                it has been queued. Defaults to ``None``.
+            cancel_on_timeout: Whether to cancel the job if it doesn't finish
+                in time. Defaults to ``False``.
+            retry: Optional policy for queueing the node again if it fails
+                with a transient error. `timeout` applies to each attempt.
+                Defaults to ``None``, which never retries.
+
+        Returns:
+            A JobInfo object containing the response data of the job's last
+            attempt.
+        """
+        deadline = Deadline.coerce(deadline)
+        job = await self.queue_node(node, inputs, deadline=deadline)
+        info = await self.wait_for_job(
+            job,
+            deadline=deadline,
+            poll=poll,
+            timeout=timeout,
+            cancel_on_timeout=cancel_on_timeout,
+        )
+
+        attempt = 1
+        while retry is not None and retry.should_retry(info, attempt):
+            delay = retry.next_delay(attempt)
+            if deadline is not None:
+                delay = min(delay, deadline.remaining())
+
+            await asyncio.sleep(delay)
+
+            # Queued as it was first, so every attempt has the same version
+            # and the same memo and duration keys.
+            job = await self.queue_node(node, inputs, deadline=deadline)
+            attempt += 1
+
+            info = await self.wait_for_job(
+                job,
+                deadline=deadline,
+                poll=poll,
+                timeout=timeout,
+                cancel_on_timeout=cancel_on_timeout,
+            )
+
+        return info
+
+    async def run_workflow(
+        self,
+        project_id: str,
+        workflow_id: str,
+        inputs: Optional[list[OverrideWorkflowInput]] = None,
+        outputs: Optional[list[OverrideWorkflowOutput]] = None,
+        deadline: Optional[Union[float, Deadline]] = None,
+        poll: Optional[PollStrategy] = None,
+        timeout: Optional[float] = None,
+        cancel_on_timeout: bool = False,
+    ) -> JobInfo:
+        """
+        Queue a workflow and wait for it to complete.
+
+        Args:
+            project_id: The ID of the project where the workflow is saved
+            workflow_id: The ID of the workflow you want to run
+            inputs: Optional list of inputs to override within the workflow
+            outputs: Optional list of outputs to override
+            deadline: Optional time limit in seconds, or a `Deadline`, covering
+                queueing, every status poll and all retries
+            poll: Strategy for waiting between status checks. Defaults to the
+                client's `poll_strategy`.
+            timeout: Optional time limit in seconds for the workflow to finish
+                once it has been queued
+            cancel_on_timeout: Whether to cancel the workflow if it doesn't
+                finish in time
+
+        Returns:
+            A JobInfo object containing the response data of the job.
+        """
+        deadline = Deadline.coerce(deadline)
+        job = await self.queue_workflow(
+            project_id,
+            workflow_id,
+            inputs,
+            outputs,
+            deadline=deadline,
+        )
+        return await self.wait_for_job(
+            job,
+            deadline=deadline,
+            poll=poll,
+            timeout=timeout,
+            cancel_on_timeout=cancel_on_timeout,
+        )
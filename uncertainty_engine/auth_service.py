@@ -1,7 +1,9 @@
 import json
+import logging
 import os
 from pathlib import Path
-from typing import Optional
+from threading import RLock, get_ident
+from typing import Callable, Optional
 from warnings import warn
 
 import jwt
@@ -32,27 +34,47 @@ All the keys that are expected to exist in the authorisation cache file.
 
 AUTH_FILE_NAME = ".ue_auth"
 
+DEFAULT_REFRESH_SKEW = 60.0
+"""
+Default number of seconds before expiry at which a token is proactively
+refreshed.
+"""
+
+logger = logging.getLogger(__name__)
+
 
 class AuthService:
     """
     Manages API authorisation, including authentication, tokens and HTTP
     headers.
 
+    An instance is safe to share between threads.
+
     Args:
         authenticator: Cognito authenticator.
         get_resource_token: Callback to request a Resource Service API
             token.
+        refresh_skew: Number of seconds before the access token expires at
+            which it is refreshed ahead of use.
     """
 
     def __init__(
         self,
         authenticator: CognitoAuthenticator,
         get_resource_token: GetResourceToken,
+        refresh_skew: float = DEFAULT_REFRESH_SKEW,
     ) -> None:
         self._get_resource_token = get_resource_token
         self.account_id: Optional[str] = None
         self.token: Optional[CognitoToken] = None
         self.authenticator = authenticator
+        self.refresh_skew = refresh_skew
+
+        # Guards the tokens and the authorisation cache file. Re-entrant
+        # because authenticating fetches a resource token, which may itself
+        # refresh.
+        self._lock = RLock()
+        self._refresh_listeners: list[Callable[[], None]] = []
 
         self.resource_token: str | None = None
         """
@@ -94,18 +116,21 @@ class AuthService:
                 "Username and password must be provided or set in environment variables UE_USERNAME and UE_PASSWORD"
             )
 
-        self.token = self.authenticator.authenticate(username, password)
+        with self._lock:
+            self.token = self.authenticator.authenticate(username, password)
 
-        # Get a new resource token only if we didn't load one already
-        # from the cache.
-        self.resource_token = self.resource_token or self._get_resource_token()
+            # Get a new resource token only if we didn't load one already
+            # from the cache.
+            self.resource_token = self.resource_token or self._get_resource_token()
 
-        # Get the account ID from the resource token if it is not
-        # already set.
-        self.account_id = self.account_id or self._get_account_id(self.resource_token)
+            # Get the account ID from the resource token if it is not
+            # already set.
+            self.account_id = self.account_id or self._get_account_id(
+                self.resource_token
+            )
 
-        # Save tokens to AUTH_FILE_NAME in the user's home directory
-        self._save_to_file()
+            # Save tokens to AUTH_FILE_NAME in the user's home directory
+            self._save_to_file()
 
     @property
     def is_authenticated(self) -> bool:
@@ -129,32 +154,45 @@ class AuthService:
 
     def clear(self) -> None:
         """Clear authentication state"""
-        self.token = None
-        auth_file = self.auth_file_path
-        if auth_file.exists():
-            auth_file.unlink()
+        with self._lock:
+            self.token = None
+            auth_file = self.auth_file_path
+            if auth_file.exists():
+                auth_file.unlink()
 
     def _save_to_file(self) -> None:
         """Save authentication details to a file"""
 
-        if not self.is_authenticated:
-            raise Exception(
-                "Must be authenticated before saving authentication details."
+        with self._lock:
+            token = self.token
+
+            if not self.is_authenticated:
+                raise Exception(
+                    "Must be authenticated before saving authentication details."
+                )
+
+            auth_data = {
+                AUTH_CACHE_ID_TOKEN: token.id_token,
+                AUTH_CACHE_RESOURCE_TOKEN: self.resource_token,
+                "account_id": self.account_id,
+                "access_token": token.access_token,
+                "refresh_token": token.refresh_token,
+            }
+
+            # Write to a temporary file and move it into place so that other
+            # clients never read a half-written file.
+            auth_file = self.auth_file_path
+            temp_file = auth_file.with_name(
+                f"{AUTH_FILE_NAME}.{os.getpid()}.{get_ident()}.tmp"
             )
 
-        auth_data = {
-            AUTH_CACHE_ID_TOKEN: self.token.id_token,
-            AUTH_CACHE_RESOURCE_TOKEN: self.resource_token,
-            "account_id": self.account_id,
-            "access_token": self.token.access_token,
-            "refresh_token": self.token.refresh_token,
-        }
+            with open(temp_file, "w") as f:
+                json.dump(auth_data, f)
 
-        with open(self.auth_file_path, "w") as f:
-            json.dump(auth_data, f)
+            # Set file permissions (owner read/write only - 0600)
+            os.chmod(temp_file, 0o600)
 
-        # Set file permissions (owner read/write only - 0600)
-        os.chmod(self.auth_file_path, 0o600)
+            temp_file.replace(auth_file)
 
     @staticmethod
     def _get_account_id(resource_token: str) -> str:
@@ -182,29 +220,125 @@ class AuthService:
         except KeyError:
             raise ValueError("Unable to find 'account_id' in decoded token.")
 
-    def refresh(self) -> CognitoToken:
+    def add_refresh_listener(self, listener: Callable[[], None]) -> None:
+        """
+        Register a callback to run whenever the tokens are refreshed.
+
+        Args:
+            listener: Callback that takes no arguments.
+        """
+        self._refresh_listeners.append(listener)
+
+    def refresh(self, stale_token: Optional[CognitoToken] = None) -> CognitoToken:
         """
         Refresh the access token
 
+        Concurrent callers share a single refresh: callers that wait while
+        another thread refreshes the token receive that thread's result.
+
+        Args:
+            stale_token: The token that the API rejected. If another thread
+                has already replaced it, the new token is returned without
+                refreshing again. Defaults to the current token, which is
+                always refreshed.
+
         Returns
             A Cognito Token containing the user's new access token.
 
         """
-        if not self.token or not self.token.refresh_token:
-            raise ValueError("No refresh token available. Please authenticate first.")
+        return self._refresh(stale_token or self.token, clear_on_failure=True)
+
+    def refresh_if_expiring(self) -> bool:
+        """
+        Refresh the access token if it expires within `refresh_skew`
+        seconds.
+
+        If the refresh fails while the current token is still valid, the
+        current token is kept and the failure is logged.
+
+        Returns:
+            ``True`` if the token was refreshed.
+        """
+        token = self.token
+
+        if token is None or not self._expires_soon(token):
+            return False
+
         try:
-            self.token = self.authenticator.refresh_tokens(
-                self.token.refresh_token,
-            )
-            self._save_to_file()
-            return self.token
-        except Exception as e:
-            self.clear()
-            raise ValueError(f"Failed to refresh token: {str(e)}")
+            self._refresh(token, clear_on_failure=token.is_expired)
+        except ValueError:
+            if token.is_expired:
+                raise
+
+            logger.warning("Proactive token refresh failed", exc_info=True)
+            return False
+
+        return True
+
+    def _expires_soon(self, token: CognitoToken) -> bool:
+        """
+        Check if a token expires within `refresh_skew` seconds.
+
+        Tokens without a readable expiry time are never considered to be
+        expiring; the API will reject them if they are invalid.
+
+        Args:
+            token: Token to check.
+
+        Returns:
+            ``True`` if the token should be refreshed.
+        """
+        try:
+            return token.expires_within(self.refresh_skew)
+        except (jwt.PyJWTError, KeyError):
+            return False
+
+    def _refresh(
+        self,
+        stale_token: Optional[CognitoToken],
+        clear_on_failure: bool,
+    ) -> CognitoToken:
+        """
+        Refresh the access token unless another thread already replaced
+        `stale_token`.
+
+        Args:
+            stale_token: The token the caller wants to replace.
+            clear_on_failure: Clear the authentication state if the refresh
+                fails.
+
+        Returns:
+            A Cognito Token containing the user's new access token.
+        """
+        with self._lock:
+            if self.token is not None and self.token is not stale_token:
+                # Another thread refreshed the token while we were waiting.
+                return self.token
+
+            if not self.token or not self.token.refresh_token:
+                raise ValueError(
+                    "No refresh token available. Please authenticate first."
+                )
+            try:
+                self.token = self.authenticator.refresh_tokens(
+                    self.token.refresh_token,
+                )
+                self._save_to_file()
+                token = self.token
+            except Exception as e:
+                if clear_on_failure:
+                    self.clear()
+                raise ValueError(f"Failed to refresh token: {str(e)}")
+
+        for listener in self._refresh_listeners:
+            listener()
+
+        return token
 
     def get_auth_header(
         self,
         include_id: bool = False,
+        token: Optional[CognitoToken] = None,
     ) -> dict[str, str]:
         """
         Gets the authorisation and identity headers to include in an API request.
@@ -214,20 +348,27 @@ class AuthService:
 
         Args:
             include_id: Include an ID token as the "X-ID-Token" header.
+            token: The token to authorise with. Defaults to the current
+                token. Pass the token that was read for a request so that it
+                can later be passed to `refresh` if the API rejects it.
 
         Returns:
             HTTP request headers.
         """
-        if not self.token:
+        # Read the token once so a concurrent refresh can't mix tokens from
+        # different sets into one request.
+        token = token or self.token
+
+        if not token:
             raise ValueError("Not authenticated")
 
         headers = {
-            "Authorization": f"Bearer {self.token.access_token}",
-            "X-Resource-Service-Token": self.resource_token or self.token.access_token,
+            "Authorization": f"Bearer {token.access_token}",
+            "X-Resource-Service-Token": self.resource_token or token.access_token,
         }
 
         if include_id:
-            headers["X-ID-Token"] = self.token.id_token
+            headers["X-ID-Token"] = token.id_token
 
         return headers
 
@@ -0,0 +1,311 @@
+from threading import Condition
+from time import monotonic
+from typing import Callable, Optional
+
+from pydantic import BaseModel, Field
+
+from uncertainty_engine.exceptions import TokenBudgetExceeded
+from uncertainty_engine.timeouts import Deadline
+
+
+class TokenBudgetPolicy(BaseModel):
+    """
+    Limits on the tokens a batch of jobs may use.
+
+    Example:
+        >>> policy = TokenBudgetPolicy(max_spend=5000, min_balance=1000)
+    """
+
+    max_spend: Optional[int] = Field(default=None, ge=0)
+    """
+    Most tokens the batch may spend, or `None` for no limit. Jobs that are
+    projected to take the batch over this aren't queued.
+    """
+
+    min_balance: int = Field(default=0, ge=0)
+    """
+    Queueing pauses while the organisation has fewer tokens than this.
+    """
+
+    cost_per_job: Optional[float] = Field(default=None, gt=0)
+    """
+    Expected tokens spent by each job. Defaults to ``None``, which estimates
+    it from the batch's spend so far.
+    """
+
+    sample_interval: float = Field(default=30.0, gt=0)
+    """
+    Seconds between checks of the organisation's token balance.
+    """
+
+    max_pause: Optional[float] = Field(default=None, ge=0)
+    """
+    Seconds to stay paused for a low balance before giving up on the rest of
+    the batch, or `None` to wait indefinitely.
+    """
+
+
+class BatchSpend(BaseModel):
+    """
+    Tokens used by a batch of jobs.
+    """
+
+    start_balance: int
+    """
+    The organisation's token balance when the batch started.
+    """
+
+    balance: int
+    """
+    The organisation's token balance when last checked.
+    """
+
+    submitted: int
+    """
+    Number of jobs allowed to be queued.
+    """
+
+    refused: int
+    """
+    Number of jobs not queued because of the budget.
+    """
+
+    paused: float
+    """
+    Seconds spent waiting for the balance to recover.
+    """
+
+    @property
+    def spent(self) -> int:
+        """
+        Tokens spent since the batch started. Includes tokens spent by
+        anything else in the organisation over the same time.
+        """
+
+        return max(0, self.start_balance - self.balance)
+
+
+class TokenBudget:
+    """
+    Paces the queueing of one batch of jobs by the organisation's token
+    balance.
+
+    The balance is checked at most every `sample_interval` seconds, and
+    threads that need it at the same time share one check. While it's below
+    `min_balance`, queueing pauses until it recovers. Once the batch's
+    spend, or the spend projected from queueing another job, would exceed
+    `max_spend`, no more jobs are queued. An instance is safe to share
+    between threads.
+
+    Args:
+        policy: The batch's limits.
+        view_tokens: Callback that gets the organisation's token balance.
+
+    Example:
+        >>> budget = client.token_budget(TokenBudgetPolicy(max_spend=5000))
+        >>> jobs = client.queue_nodes(nodes, budget=budget)
+        >>> budget.report().spent
+        4200
+    """
+
+    def __init__(
+        self,
+        policy: TokenBudgetPolicy,
+        view_tokens: Callable[[], int],
+    ) -> None:
+        self.policy = policy
+        self.view_tokens = view_tokens
+
+        self._start_balance: Optional[int] = None
+        self._balance = 0
+        self._sampled_at: Optional[float] = None
+
+        self._submitted = 0
+        self._refused = 0
+        self._paused = 0.0
+
+        # When the current pause for a low balance began, if paused.
+        self._paused_since: Optional[float] = None
+
+        # Why no more jobs may be queued, once the budget is spent.
+        self._exhausted: Optional[str] = None
+
+        # Whether a thread is checking the balance. The condition's lock is
+        # released while it does, and waiting threads are notified when the
+        # check finishes.
+        self._sampling = False
+        self._condition = Condition()
+
+    def acquire(self, deadline: Optional[Deadline] = None) -> None:
+        """
+        Wait until the budget allows another job to be queued.
+
+        Args:
+            deadline: Optional deadline for the wait.
+
+        Raises:
+            TokenBudgetExceeded: Raised if the budget doesn't allow any more
+                jobs.
+            DeadlineExceeded: Raised if the balance is still too low at the
+                deadline.
+        """
+
+        with self._condition:
+            while True:
+                if self._exhausted is not None:
+                    self._refused += 1
+                    raise TokenBudgetExceeded(self._exhausted)
+
+                self._sample()
+
+                now = monotonic()
+
+                self._exhausted = self._over_budget()
+                if self._exhausted is not None:
+                    self._end_pause(now)
+                    continue
+
+                if self._balance >= self.policy.min_balance:
+                    self._end_pause(now)
+                    self._submitted += 1
+                    return
+
+                if self._paused_since is None:
+                    self._paused_since = now
+
+                # Wait until the balance is next due to be checked.
+                wait = self.policy.sample_interval
+                if self._sampled_at is not None:
+                    wait = max(0.0, self._sampled_at + wait - now)
+
+                max_pause = self.policy.max_pause
+                if max_pause is not None:
+                    if now - self._paused_since >= max_pause:
+                        self._exhausted = (
+                            f"the token balance stayed below "
+                            f"{self.policy.min_balance} for {max_pause:g} seconds"
+                        )
+                        self._end_pause(now)
+                        continue
+
+                    wait = min(wait, self._paused_since + max_pause - now)
+
+                if deadline is not None:
+                    deadline.check("waiting for the token balance")
+                    wait = min(wait, deadline.remaining())
+
+                # Waiting releases the lock, so other threads can report the
+                # spend or share the next balance check meanwhile.
+                self._condition.wait(wait)
+
+    def report(self) -> BatchSpend:
+        """
+        Check the token balance and report the batch's spend.
+
+        Returns:
+            The tokens used by the batch so far.
+        """
+
+        with self._condition:
+            self._sample(force=True)
+
+            start_balance = self._start_balance
+            if start_balance is None:
+                start_balance = self._balance
+
+            paused = self._paused
+            if self._paused_since is not None:
+                paused += monotonic() - self._paused_since
+
+            return BatchSpend(
+                start_balance=start_balance,
+                balance=self._balance,
+                submitted=self._submitted,
+                refused=self._refused,
+                paused=paused,
+            )
+
+    def _sample(self, force: bool = False) -> None:
+        """
+        Check the token balance if it hasn't been checked recently, or wait
+        for the check another thread is making. Must be called with the
+        condition held, which is released while the balance is fetched.
+
+        Args:
+            force: Whether to check the balance however recently it was
+                checked.
+        """
+
+        if self._sampling:
+            while self._sampling:
+                self._condition.wait()
+
+            return
+
+        now = monotonic()
+        if (
+            not force
+            and self._sampled_at is not None
+            and now - self._sampled_at < self.policy.sample_interval
+        ):
+            return
+
+        self._sampling = True
+        self._condition.release()
+
+        try:
+            balance = int(self.view_tokens())
+        finally:
+            self._condition.acquire()
+            self._sampling = False
+            self._condition.notify_all()
+
+        self._balance = balance
+        self._sampled_at = now
+
+        if self._start_balance is None:
+            self._start_balance = self._balance
+
+    def _end_pause(self, now: float) -> None:
+        """
+        Add the current pause for a low balance, if any, to the time spent
+        paused. Must be called with the condition held.
+
+        Args:
+            now: `time.monotonic()` reading taken when the pause ended.
+        """
+
+        if self._paused_since is not None:
+            self._paused += now - self._paused_since
+            self._paused_since = None
+
+    def _over_budget(self) -> Optional[str]:
+        """
+        Check whether queueing another job would exceed `max_spend`. Must be
+        called with the condition held.
+
+        Returns:
+            Why the budget is spent, or `None` if another job may be queued.
+        """
+
+        max_spend = self.policy.max_spend
+        if max_spend is None or self._start_balance is None:
+            return None
+
+        spent = max(0, self._start_balance - self._balance)
+        if spent >= max_spend:
+            return f"the batch has spent {spent} of its {max_spend} token budget"
+
+        cost = self.policy.cost_per_job
+        if cost is None and self._submitted and spent:
+            cost = spent / self._submitted
+
+        # Jobs that have been queued may not have been charged yet, so
+        # project from the number queued as well as the spend so far.
+        if cost is not None and max(spent, self._submitted * cost) + cost > max_spend:
+            return (
+                f"another job is projected to exceed the batch's {max_spend} "
+                f"token budget"
+            )
+
+        return None
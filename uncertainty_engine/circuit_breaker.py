@@ -0,0 +1,229 @@
+from enum import Enum
+from threading import Lock
+from time import monotonic
+
+from pydantic import BaseModel
+
+from uncertainty_engine.exceptions import CircuitOpenError
+from uncertainty_engine.retry import TRANSIENT_STATUS_CODES
+
+FAILURE_STATUS_CODES = TRANSIENT_STATUS_CODES - {408, 429}
+"""
+HTTP status codes that count against a circuit breaker by default.
+
+Throttling (429) and request timeouts (408) mean the server is up but busy.
+They are paced by the retry policy and rate limiter, so they don't open the
+breaker for every other caller.
+"""
+
+
+class CircuitState(str, Enum):
+    """
+    State of a circuit breaker.
+    """
+
+    CLOSED = "closed"
+    """
+    Requests are sent as normal.
+    """
+
+    OPEN = "open"
+    """
+    Requests are rejected without being sent.
+    """
+
+    HALF_OPEN = "half_open"
+    """
+    A limited number of trial requests are sent to test for recovery.
+    """
+
+
+class CircuitBreakerPolicy(BaseModel):
+    """
+    Controls when an API's circuit breaker opens and how it recovers.
+
+    Example:
+        >>> client = Client(
+        ...     circuit_breaker_policy=CircuitBreakerPolicy(failure_threshold=10),
+        ... )
+    """
+
+    enabled: bool = True
+    """
+    Whether the breaker ever opens.
+    """
+
+    failure_threshold: int = 5
+    """
+    Number of consecutive failed attempts that opens the breaker.
+    """
+
+    recovery_timeout: float = 30.0
+    """
+    Seconds the breaker stays open before letting trial requests through.
+    """
+
+    half_open_max_calls: int = 1
+    """
+    Number of trial requests allowed at once while half-open.
+    """
+
+    failure_statuses: frozenset[int] = FAILURE_STATUS_CODES
+    """
+    HTTP status codes that count as failures.
+    """
+
+
+class CircuitBreaker:
+    """
+    Stops requests to a failing API so that callers fail fast rather than
+    add load while it recovers.
+
+    The breaker opens after `failure_threshold` consecutive failures. After
+    `recovery_timeout` seconds it half-opens and lets trial requests through.
+    A successful trial closes it again and a failed one reopens it.
+
+    An instance is safe to share between threads.
+
+    Args:
+        endpoint: The API endpoint the breaker protects.
+        policy: Breaker thresholds. Defaults to `CircuitBreakerPolicy()`.
+
+    Example:
+        >>> client.circuit_breakers["core_api"].state
+        <CircuitState.CLOSED: 'closed'>
+    """
+
+    def __init__(
+        self,
+        endpoint: str,
+        policy: CircuitBreakerPolicy | None = None,
+    ) -> None:
+        self.endpoint = endpoint
+        self.policy = policy or CircuitBreakerPolicy()
+
+        self._lock = Lock()
+        self._state = CircuitState.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._trials = 0
+
+    @property
+    def state(self) -> CircuitState:
+        """
+        Current state of the breaker.
+        """
+
+        with self._lock:
+            return self._current_state()
+
+    @property
+    def failure_count(self) -> int:
+        """
+        Number of consecutive failures recorded.
+        """
+
+        return self._failures
+
+    def _current_state(self) -> CircuitState:
+        """
+        Get the current state, half-opening the breaker if it has been open
+        for long enough. Must be called with the lock held.
+        """
+
+        if (
+            self._state == CircuitState.OPEN
+            and monotonic() - self._opened_at >= self.policy.recovery_timeout
+        ):
+            self._state = CircuitState.HALF_OPEN
+            self._trials = 0
+
+        return self._state
+
+    def _open(self) -> None:
+        """
+        Open the breaker. Must be called with the lock held.
+        """
+
+        self._state = CircuitState.OPEN
+        self._opened_at = monotonic()
+
+    def before_call(self) -> None:
+        """
+        Check that a request may be sent. Call this before every attempt and
+        record its outcome afterwards.
+
+        Raises:
+            CircuitOpenError: Raised if the breaker is open, or half-open
+                with all of its trial requests in flight.
+        """
+
+        if not self.policy.enabled:
+            return
+
+        with self._lock:
+            state = self._current_state()
+
+            if state == CircuitState.CLOSED:
+                return
+
+            if (
+                state == CircuitState.HALF_OPEN
+                and self._trials < self.policy.half_open_max_calls
+            ):
+                self._trials += 1
+                return
+
+            retry_in = max(
+                0.0,
+                self._opened_at + self.policy.recovery_timeout - monotonic(),
+            )
+
+        raise CircuitOpenError(self.endpoint, retry_in)
+
+    def record_success(self) -> None:
+        """
+        Record a request that reached a healthy API.
+        """
+
+        with self._lock:
+            state = self._current_state()
+
+            if state == CircuitState.OPEN:
+                # A slow request sent before the breaker opened doesn't
+                # prove that the API has recovered.
+                return
+
+            self._state = CircuitState.CLOSED
+            self._failures = 0
+
+    def record_failure(self) -> None:
+        """
+        Record a request that failed because the API is unhealthy.
+        """
+
+        with self._lock:
+            state = self._current_state()
+
+            if state == CircuitState.OPEN:
+                return
+
+            self._failures += 1
+
+            if state == CircuitState.HALF_OPEN or (
+                self.policy.enabled and self._failures >= self.policy.failure_threshold
+            ):
+                self._open()
+
+    def record_status(self, status_code: int) -> None:
+        """
+        Record the outcome of a request from its response status.
+
+        Args:
+            status_code: HTTP status code.
+        """
+
+        if status_code in self.policy.failure_statuses:
+            self.record_failure()
+        else:
+            self.record_success()
@@ -1,9 +1,22 @@
+import logging
 import warnings
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from itertools import islice
 from os import environ
+from threading import Lock
 from time import sleep
-from typing import Any, Optional, Union
+from typing import (
+    Any,
+    Callable,
+    Iterable,
+    Iterator,
+    Optional,
+    Sequence,
+    TypeVar,
+    Union,
+)
 
-from pydantic import BaseModel
 from requests import HTTPError
 from typeguard import typechecked
 from uncertainty_engine_types import (
@@ -17,7 +30,12 @@ from uncertainty_engine_types import (
     RunWorkflowRequest,
 )
 
-from uncertainty_engine.api_invoker import ApiInvoker, HttpApiInvoker
+from uncertainty_engine.api_invoker import (
+    DEFAULT_POOL_CONNECTIONS,
+    DEFAULT_POOL_MAXSIZE,
+    ApiInvoker,
+    HttpApiInvoker,
+)
 from uncertainty_engine.api_providers import (
     ApiProviderBase,
     AuthProvider,
@@ -25,24 +43,57 @@ from uncertainty_engine.api_providers import (
     ResourceProvider,
     WorkflowsProvider,
 )
-from uncertainty_engine.auth_service import AuthService
+from uncertainty_engine.auth_service import DEFAULT_REFRESH_SKEW, AuthService
+from uncertainty_engine.budget import TokenBudget, TokenBudgetPolicy
+from uncertainty_engine.circuit_breaker import CircuitBreaker, CircuitBreakerPolicy
 from uncertainty_engine.cognito_authenticator import CognitoAuthenticator
+from uncertainty_engine.durations import DurationHistory, node_key
 from uncertainty_engine.environments import Environment
-from uncertainty_engine.exceptions import IncompleteCredentials
+from uncertainty_engine.exceptions import (
+    DeadlineExceeded,
+    IncompleteCredentials,
+    JobTimeoutError,
+    TokenBudgetExceeded,
+)
+from uncertainty_engine.hedging import HedgePolicy, Hedger
+from uncertainty_engine.job import Job
+from uncertainty_engine.job_cache import JobInfoCache
+from uncertainty_engine.job_future import JobFuture
+from uncertainty_engine.job_retry import JobOutcome, JobRetrier, JobRetryPolicy
+from uncertainty_engine.journal import JobJournal
+from uncertainty_engine.memo import NodeMemo
 from uncertainty_engine.nodes.base import Node
-from uncertainty_engine.utils import handle_input_deprecation
+from uncertainty_engine.polling import (  # noqa: F401
+    STATUS_WAIT_TIME,  # Re-exported for code that imports it from here.
+    ExponentialBackoffPoll,
+    FixedPoll,
+    PollStrategy,
+)
+from uncertainty_engine.rate_limit import EndpointClass, RateLimitPolicy
+from uncertainty_engine.retry import RetryPolicy
+from uncertainty_engine.scheduler import (
+    DEFAULT_POLL_CONCURRENCY,
+    DEFAULT_SUBMIT_CONCURRENCY,
+    JobPoller,
+    JobScheduler,
+)
+from uncertainty_engine.timeouts import DEFAULT_TIMEOUT, Deadline, TimeoutValue
+from uncertainty_engine.utils import handle_input_deprecation, hash_node_inputs
 
-STATUS_WAIT_TIME = 5  # An interval of 5 seconds to wait between status checks while waiting for a job to complete
+T = TypeVar("T")
+R = TypeVar("R")
 
+logger = logging.getLogger(__name__)
 
-# TODO: Move this to the uncertainty_engine_types package.
-class Job(BaseModel):
-    """
-    Represents a job in the Uncertainty Engine.
-    """
+CANCEL_CONFIRM_TIMEOUT = 30.0
+"""
+Seconds to wait for timed-out jobs to be confirmed as cancelled.
+"""
 
-    node_id: str
-    job_id: str
+CANCEL_CONFIRM_INTERVAL = 1.0
+"""
+Seconds between status checks while confirming that jobs were cancelled.
+"""
 
 
 @typechecked
@@ -50,19 +101,78 @@ class Client:
     def __init__(
         self,
         env: Environment | str = "prod",
+        pool_connections: int = DEFAULT_POOL_CONNECTIONS,
+        pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
+        retry_policy: RetryPolicy | None = None,
+        timeout: TimeoutValue = DEFAULT_TIMEOUT,
+        token_refresh_skew: float = DEFAULT_REFRESH_SKEW,
+        gzip_threshold: Optional[int] = None,
+        circuit_breaker_policy: Optional[CircuitBreakerPolicy] = None,
+        poll_strategy: Optional[PollStrategy] = None,
+        rate_limit_policy: Optional[RateLimitPolicy] = None,
+        journal: Optional[JobJournal] = None,
+        job_cache: Optional[JobInfoCache] = None,
+        memo: Optional[NodeMemo] = None,
+        durations: Optional[DurationHistory] = None,
     ):
         """
         A client for interacting with the Uncertainty Engine.
 
+        The client keeps a pool of keep-alive connections open to the Core
+        API. Call `close()` when you are finished with it, or use it as a
+        context manager.
+
+        A single client is safe to share between threads, for example in a
+        `ThreadPoolExecutor`. Size `pool_maxsize` to the number of threads.
+
         Args:
             env: Environment configuration or name of a deployed environment.
                 Defaults to the main Uncertainty Engine environment.
+            pool_connections: Number of per-host connection pools to keep.
+            pool_maxsize: Maximum number of keep-alive connections to keep
+                to each of the Core API and the Resource Service. Raise this
+                when sharing the client across many threads.
+            retry_policy: Policy for retrying transient Core API failures.
+                Defaults to `RetryPolicy()`.
+            timeout: Timeout for each HTTP request, in seconds. Either a
+                single value or a `(connect, read)` pair.
+            token_refresh_skew: Number of seconds before the access token
+                expires at which it is refreshed ahead of use.
+            gzip_threshold: Compress Core API request bodies of at least
+                this many bytes with gzip. Large workflows and inline
+                datasets compress well. Defaults to ``None``, which never
+                compresses.
+            circuit_breaker_policy: When to stop sending requests to an
+                unhealthy API so that calls fail fast with
+                `CircuitOpenError`. The Core API and Resource Service each
+                have their own breaker. Defaults to
+                `CircuitBreakerPolicy()`.
+            poll_strategy: How long to wait between status checks while
+                waiting for a job. Defaults to `ExponentialBackoffPoll()`.
+            rate_limit_policy: Request rates to stay under for job
+                submissions, other Core API requests and Resource Service
+                requests. Requests over the rate block until they're
+                allowed. Defaults to ``None``, which doesn't limit requests.
+            journal: Optional journal to record queued nodes in, so a batch
+                can be resumed with `resume` if the process dies. While a
+                journal is set, nodes whose inputs are already recorded are
+                not queued again.
+            job_cache: Optional cache of finished jobs' results. While a
+                cache is set, `job_status` only makes a request for jobs
+                that haven't been seen to finish.
+            memo: Optional memo of completed node executions. While a memo
+                is set, nodes it allows that already completed with the same
+                inputs aren't queued again.
+            durations: Optional history of how long nodes take to complete.
+                While a history is set, the duration of every completed job
+                queued by the client is recorded in it. Use it with
+                `PredictivePoll` to poll jobs near their expected completion.
 
         Example:
-            >>> client = Client()
-            >>> client.authenticate()
-            >>> add_node = Node(node_name="Add", lhs=1, rhs=2, label="add")
-            >>> client.queue_node(add_node)
+            >>> with Client() as client:
+            ...     client.authenticate()
+            ...     add_node = Node(node_name="Add", lhs=1, rhs=2, label="add")
+            ...     client.queue_node(add_node)
             "<job-id>"
         """
 
@@ -71,6 +181,31 @@ class Client:
         Uncertainty Engine environment.
         """
 
+        self.poll_strategy = poll_strategy or ExponentialBackoffPoll()
+        """
+        Default strategy for waiting between job status checks.
+        """
+
+        self.journal = journal
+        """
+        Journal that queued nodes are recorded in, if any.
+        """
+
+        self.job_cache = job_cache
+        """
+        Cache of finished jobs' results, if any.
+        """
+
+        self.memo = memo
+        """
+        Memo of completed node executions, if any.
+        """
+
+        self.durations = durations
+        """
+        History of how long nodes take to complete, if any.
+        """
+
         authenticator = CognitoAuthenticator(
             self.env.region,
             self.env.cognito_user_pool_client_id,
@@ -79,19 +214,55 @@ class Client:
         self.auth_service = AuthService(
             authenticator,
             self._get_resource_token,
+            refresh_skew=token_refresh_skew,
         )
 
+        self.circuit_breakers = {
+            "core_api": CircuitBreaker(self.env.core_api, circuit_breaker_policy),
+            "resource_api": CircuitBreaker(
+                self.env.resource_api,
+                circuit_breaker_policy,
+            ),
+        }
+        """
+        Circuit breakers for each API, keyed by `Environment` field name.
+        Read their `state` to monitor API health.
+        """
+
+        self.rate_limiters = (rate_limit_policy or RateLimitPolicy()).create_limiters()
+        """
+        Rate limiters for each limited class of endpoint, shared by every
+        thread and provider using the client.
+        """
+
         self.core_api: ApiInvoker = HttpApiInvoker(
             self.auth_service,
             self.env.core_api,
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            retry_policy=retry_policy,
+            timeout=timeout,
+            gzip_threshold=gzip_threshold,
+            circuit_breaker=self.circuit_breakers["core_api"],
+            rate_limiters=self.rate_limiters,
         )
         """
         Core API interaction.
         """
 
+        # Every Resource Service provider shares one API client, and so one
+        # connection pool and one set of headers.
+        self._resource_api_client = ApiProviderBase.create_api_client(
+            self.env.resource_api,
+            pool_maxsize=pool_maxsize,
+            circuit_breaker=self.circuit_breakers["resource_api"],
+            rate_limiter=self.rate_limiters.get(EndpointClass.RESOURCE),
+        )
+
         self.auth = AuthProvider(
             self.auth_service,
             self.env.resource_api,
+            api_client=self._resource_api_client,
         )
         """
         Resource Service Authorisation API client.
@@ -100,16 +271,24 @@ class Client:
         self.projects = ProjectsProvider(
             self.auth_service,
             self.env.resource_api,
+            api_client=self._resource_api_client,
         )
         self.resources = ResourceProvider(
             self.auth_service,
             self.env.resource_api,
+            timeout=timeout,
+            api_client=self._resource_api_client,
         )
         self.workflows = WorkflowsProvider(
             self.auth_service,
             self.env.resource_api,
+            api_client=self._resource_api_client,
         )
 
+        self._poller: Optional[JobPoller] = None
+        self._poller_lock = Lock()
+
+        self._providers_lock = Lock()
         self._providers: list[ApiProviderBase] = [
             self.auth,
             self.projects,
@@ -117,6 +296,35 @@ class Client:
             self.workflows,
         ]
 
+        # Keep every provider's headers current however the token is refreshed.
+        self.auth_service.add_refresh_listener(self._update_all_providers)
+
+    def __enter__(self) -> "Client":
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """
+        Close all pooled connections held by the client and stop polling
+        job futures.
+
+        Example:
+            >>> client = Client()
+            >>> client.authenticate()
+            >>> client.list_nodes()
+            >>> client.close()
+        """
+        with self._poller_lock:
+            poller, self._poller = self._poller, None
+
+        if poller is not None:
+            poller.close()
+
+        self.core_api.close()
+        self._resource_api_client.rest_client.pool_manager.clear()
+
     def _get_resource_token(self) -> str:
         """Get a Resource Service API token."""
         self.auth.update_api_authentication()
@@ -124,8 +332,9 @@ class Client:
 
     def _update_all_providers(self) -> None:
         """Update authentication for all API providers."""
-        for provider in self._providers:
-            provider.update_api_authentication()
+        with self._providers_lock:
+            for provider in self._providers:
+                provider.update_api_authentication()
 
     def authenticate(
         self,
@@ -260,6 +469,8 @@ class Client:
         node: Union[str, Node],
         inputs: Optional[dict[str, Any]] = None,
         input: Optional[dict[str, Any]] = None,
+        deadline: Optional[Union[float, Deadline]] = None,
+        budget: Optional[TokenBudget] = None,
     ) -> Job:
         """
         Queue a node for execution.
@@ -270,29 +481,170 @@ class Client:
                 this is required. Defaults to ``None``.
             input: **DEPRECATED** The input data for the node. Use `inputs` instead.
                 Will be removed in a future version.
+            deadline: Optional time limit in seconds, or a `Deadline`, for
+                the request and all of its retries. Defaults to ``None``.
+            budget: Optional token budget from `token_budget` to wait for
+                before the node is queued. Not used when the memo or journal
+                already holds a job for these inputs. Defaults to ``None``.
 
         Returns:
-            A Job object representing the queued job.
+            A Job object representing the queued job. If the client's memo
+            or journal already holds a job for these inputs, that job is
+            returned and the node isn't queued again.
+
+        Raises:
+            TokenBudgetExceeded: Raised if the budget doesn't allow the node.
         """
         # TODO: Remove once `input` is removed and make `inputs` required
         final_inputs = handle_input_deprecation(input, inputs)
 
+        version = None
         if isinstance(node, Node):
+            version = node.version
             node, final_inputs = node()
         elif isinstance(node, str) and final_inputs is None:
             raise ValueError(
                 "Input data/parameters are required when specifying a node by name."
             )
 
+        if self.memo is not None:
+            memoised = self.memo.lookup(node, final_inputs, version)
+            if memoised is not None:
+                return memoised[0]
+
+        journal = self.journal
+        if journal is not None:
+            inputs_hash = hash_node_inputs(node, final_inputs)
+            queued = journal.find(inputs_hash)
+            if queued is not None:
+                return queued
+
+        if budget is not None:
+            budget.acquire(Deadline.coerce(deadline))
+
         job_id = self.core_api.post(
             "/nodes/queue",
             {
                 "node_id": node,
                 "inputs": final_inputs,
             },
+            deadline=Deadline.coerce(deadline),
+        )
+
+        job = Job(node_id=node, job_id=job_id)
+
+        if journal is not None:
+            journal.record(job, inputs_hash)
+
+        if self.memo is not None:
+            self.memo.queued(job, final_inputs, version)
+
+        if self.durations is not None:
+            self.durations.queued(job, node_key(node, version))
+
+        return job
+
+    def queue_nodes(
+        self,
+        nodes: Sequence[Union[Node, tuple[str, dict[str, Any]]]],
+        max_in_flight: int = DEFAULT_SUBMIT_CONCURRENCY,
+        deadline: Optional[Union[float, Deadline]] = None,
+        budget: Optional[TokenBudget] = None,
+    ) -> list[Union[Job, Exception]]:
+        """
+        Queue many nodes for execution at once.
+
+        Nodes are queued concurrently over the client's connection pool
+        rather than one round trip at a time. A node that fails to queue
+        doesn't stop the others.
+
+        Args:
+            nodes: The nodes to execute, as node objects or `(name, inputs)`
+                pairs.
+            max_in_flight: Maximum number of queue requests to make at once.
+            deadline: Optional time limit in seconds, or a `Deadline`, for
+                every request and all of their retries. Defaults to ``None``.
+            budget: Optional token budget from `token_budget` to pace
+                queueing by. Nodes the budget doesn't allow aren't queued.
+                Defaults to ``None``.
+
+        Returns:
+            A Job object for each node that was queued, or the error raised
+            while queueing it, in the same order as `nodes`. Nodes the
+            budget didn't allow have a `TokenBudgetExceeded` error.
+
+        Example:
+            >>> nodes = [Node(node_name="Add", version="0.2.0", lhs=i, rhs=1) for i in range(100)]
+            >>> jobs = client.queue_nodes(nodes, max_in_flight=20)
+            >>> failed = [job for job in jobs if isinstance(job, Exception)]
+        """
+        deadline = Deadline.coerce(deadline)
+        return self._map_concurrently(
+            lambda node: self._queue_spec(node, deadline, budget),
+            nodes,
+            max_in_flight,
         )
 
-        return Job(node_id=node, job_id=job_id)
+    @staticmethod
+    def _map_concurrently(
+        func: Callable[[T], R],
+        items: Sequence[T],
+        max_in_flight: int,
+    ) -> list[Union[R, Exception]]:
+        """
+        Call a function on every item at once, collecting errors rather than
+        raising them.
+
+        Args:
+            func: Function to call.
+            items: Items to call `func` on.
+            max_in_flight: Maximum number of calls to make at once.
+
+        Returns:
+            The result of each call, or the error it raised, in the same
+            order as `items`.
+        """
+        if not items:
+            return []
+
+        def call(item: T) -> Union[R, Exception]:
+            try:
+                return func(item)
+            except Exception as e:
+                return e
+
+        with ThreadPoolExecutor(
+            max_workers=max(1, min(max_in_flight, len(items))),
+            thread_name_prefix="uncertainty-engine-batch",
+        ) as executor:
+            return list(executor.map(call, items))
+
+    def _queue_spec(
+        self,
+        node: Union[Node, tuple[str, dict[str, Any]]],
+        deadline: Optional[Deadline],
+        budget: Optional[TokenBudget] = None,
+    ) -> Job:
+        """
+        Queue a node given as a node object or a `(name, inputs)` pair.
+
+        Args:
+            node: The node to execute.
+            deadline: Optional deadline for the request and all of its
+                retries.
+            budget: Optional token budget to wait for before queueing.
+
+        Returns:
+            A Job object representing the queued job.
+
+        Raises:
+            TokenBudgetExceeded: Raised if the budget doesn't allow the node.
+        """
+        if isinstance(node, Node):
+            return self.queue_node(node, deadline=deadline, budget=budget)
+
+        name, inputs = node
+        return self.queue_node(name, inputs, deadline=deadline, budget=budget)
 
     def queue_workflow(
         self,
@@ -304,6 +656,7 @@ class Client:
         outputs: Optional[
             Union[list[OverrideWorkflowOutput], list[dict[str, Any]]]
         ] = None,
+        deadline: Optional[Union[float, Deadline]] = None,
     ) -> Job:
         """
         Queue a workflow for execution
@@ -313,6 +666,8 @@ class Client:
             workflow_id: The ID of the workflow you want to run
             inputs: Optional list of inputs to override within the workflow
             outputs: Optional list of outputs to override. If passed previous outputs are overridden
+            deadline: Optional time limit in seconds, or a `Deadline`, for
+                the request and all of its retries
 
         Returns:
             A Job object representing the queued job.
@@ -397,14 +752,27 @@ class Client:
         job_id = self.core_api.post(
             f"/workflows/projects/{project_id}/workflows/{workflow_id}/run",
             payload.model_dump(),
+            deadline=Deadline.coerce(deadline),
         )
-        return Job(node_id="Workflow", job_id=job_id)
+        job = Job(node_id="Workflow", job_id=job_id)
+
+        # Workflows differ in runtime as much as nodes do, so each workflow
+        # has its own history.
+        if self.durations is not None:
+            self.durations.queued(job, node_key(job.node_id, workflow_id))
+
+        return job
 
     def run_node(
         self,
         node: Union[str, Node],
         inputs: Optional[dict[str, Any]] = None,
         input: Optional[dict[str, Any]] = None,
+        deadline: Optional[Union[float, Deadline]] = None,
+        poll: Optional[PollStrategy] = None,
+        timeout: Optional[float] = None,
+        cancel_on_timeout: bool = False,
+        retry: Optional[JobRetryPolicy] = None,
     ) -> JobInfo:
         """
         Run a node synchronously.
@@ -415,15 +783,64 @@ class Client:
                 this is required. Defaults to ``None``.
             input: **DEPRECATED** The input data for the node. Use `inputs` instead.
                 Will be removed in a future version.
+            deadline: Optional time limit in seconds, or a `Deadline`, covering
+                queueing, every status poll and all retries. Defaults to ``None``.
+            poll: Strategy for waiting between status checks. Defaults to the
+                client's `poll_strategy`.
+            timeout: Optional time limit in seconds for the job to finish once
+                it has been queued. Defaults to ``None``.
+            cancel_on_timeout: Whether to cancel the job if it doesn't finish
+                in time, so it stops using tokens. Defaults to ``False``.
+            retry: Optional policy for queueing the node again if it fails
+                with a transient error. `timeout` applies to each attempt.
+                Defaults to ``None``, which never retries.
 
         Returns:
-            A JobInfo object containing the response data of the job.
+            A JobInfo object containing the response data of the job's last
+            attempt.
+
+        Raises:
+            JobTimeoutError: Raised if the job doesn't finish before the
+                deadline or timeout.
+            DeadlineExceeded: Raised if the node can't be queued before the
+                deadline.
         """
         # TODO: Remove once `input` is removed and make `inputs` required
         final_inputs = handle_input_deprecation(input, inputs)
 
-        job_id = self.queue_node(node, final_inputs)
-        return self._wait_for_job(job_id)
+        deadline = Deadline.coerce(deadline)
+        job = self.queue_node(node, final_inputs, deadline=deadline)
+
+        info = self._wait_for_job(
+            job,
+            deadline=deadline,
+            poll=poll,
+            timeout=timeout,
+            cancel_on_timeout=cancel_on_timeout,
+        )
+
+        attempt = 1
+        while retry is not None and retry.should_retry(info, attempt):
+            delay = retry.next_delay(attempt)
+            if deadline is not None:
+                delay = min(delay, deadline.remaining())
+
+            sleep(delay)
+
+            # Queued as it was first, so every attempt has the same version
+            # and the same memo and duration keys.
+            job = self.queue_node(node, final_inputs, deadline=deadline)
+            attempt += 1
+
+            info = self._wait_for_job(
+                job,
+                deadline=deadline,
+                poll=poll,
+                timeout=timeout,
+                cancel_on_timeout=cancel_on_timeout,
+            )
+
+        return info
 
     def run_workflow(
         self,
@@ -435,6 +852,10 @@ class Client:
         outputs: Optional[
             Union[list[OverrideWorkflowOutput], list[dict[str, Any]]]
         ] = None,
+        deadline: Optional[Union[float, Deadline]] = None,
+        poll: Optional[PollStrategy] = None,
+        timeout: Optional[float] = None,
+        cancel_on_timeout: bool = False,
     ) -> JobInfo:
         """
         Run a workflow synchronously.
@@ -444,10 +865,24 @@ class Client:
             workflow_id: The ID of the workflow you want to run
             inputs: Optional list of inputs to override within the workflow
             outputs: Optional list of outputs to override. If passed previous outputs are overridden
+            deadline: Optional time limit in seconds, or a `Deadline`, covering
+                queueing, every status poll and all retries
+            poll: Strategy for waiting between status checks. Defaults to the
+                client's `poll_strategy`.
+            timeout: Optional time limit in seconds for the workflow to finish
+                once it has been queued
+            cancel_on_timeout: Whether to cancel the workflow if it doesn't
+                finish in time, so it stops using tokens
 
         Returns:
             A JobInfo object containing the response data of the job.
 
+        Raises:
+            JobTimeoutError: Raised if the workflow doesn't finish before the
+                deadline or timeout.
+            DeadlineExceeded: Raised if the workflow can't be queued before
+                the deadline.
+
         Example:
             >>> # Basic workflow execution
             >>> job_info = client.run_workflow(
@@ -483,22 +918,40 @@ class Client:
             ...     outputs=override_outputs
             ... )
         """
+        deadline = Deadline.coerce(deadline)
+
         # catch deprecation warning from `queue_workflow`
         with warnings.catch_warnings():
             warnings.simplefilter("always")
-            job = self.queue_workflow(project_id, workflow_id, inputs, outputs)
+            job = self.queue_workflow(
+                project_id, workflow_id, inputs, outputs, deadline=deadline
+            )
 
-        return self._wait_for_job(job)
+        return self._wait_for_job(
+            job,
+            deadline=deadline,
+            poll=poll,
+            timeout=timeout,
+            cancel_on_timeout=cancel_on_timeout,
+        )
 
-    def job_status(self, job: Job) -> JobInfo:
+    def job_status(
+        self,
+        job: Job,
+        deadline: Optional[Union[float, Deadline]] = None,
+    ) -> JobInfo:
         """
         Check the status of a job.
 
         Args:
             job: The job to check.
+            deadline: Optional time limit in seconds, or a `Deadline`, for
+                the request and all of its retries. Defaults to ``None``.
 
         Returns:
-            A JobInfo object containing the response data of the job.
+            A JobInfo object containing the response data of the job. Served
+            from the client's `memo` or `job_cache` without a request if the
+            job has already been seen to finish.
             Example:
                 JobInfo(
                 status=<JobStatus.COMPLETED: 'completed'>,
@@ -507,8 +960,705 @@ class Client:
                 outputs={'ans': 3.0}
                 )
         """
-        response_data = self.core_api.get(f"/nodes/status/{job.node_id}/{job.job_id}")
-        return JobInfo(**response_data)
+        # Jobs handed back by the memo are waited on like any other, so
+        # every way of waiting gets their result without a request.
+        if self.memo is not None:
+            memoised = self.memo.result(job)
+            if memoised is not None:
+                return memoised
+
+        if self.job_cache is not None:
+            cached = self.job_cache.get(job)
+            if cached is not None:
+                return cached
+
+        response_data = self.core_api.get(
+            f"/nodes/status/{job.node_id}/{job.job_id}",
+            deadline=Deadline.coerce(deadline),
+        )
+        info = JobInfo(**response_data)
+
+        if self.journal is not None:
+            status = JobStatus(info.status.value)
+            if status.is_terminal():
+                self.journal.mark_finished(job, status)
+
+        if self.job_cache is not None:
+            self.job_cache.put(job, info)
+
+        if self.memo is not None:
+            self.memo.finished(job, info)
+
+        if self.durations is not None:
+            self.durations.finished(job, info)
+
+        return info
+
+    def as_completed(
+        self,
+        jobs: Sequence[Job],
+        deadline: Optional[Union[float, Deadline]] = None,
+        poll: Optional[PollStrategy] = None,
+        max_concurrency: int = DEFAULT_POLL_CONCURRENCY,
+        timeout: Optional[float] = None,
+        cancel_on_timeout: bool = False,
+        hedge: Optional[HedgePolicy] = None,
+        retry: Optional[JobRetryPolicy] = None,
+    ) -> Iterator[tuple[Job, JobInfo]]:
+        """
+        Wait for many jobs at once, yielding each as it finishes.
+
+        All jobs are polled by one loop, each on its own backoff schedule,
+        so a batch takes as long as its slowest job rather than the sum of
+        every job's polling.
+
+        Args:
+            jobs: The jobs to wait for.
+            deadline: Optional time limit in seconds, or a `Deadline`, for
+                every job to finish. Defaults to ``None``.
+            poll: Strategy for waiting between status checks of each job.
+                Defaults to the client's `poll_strategy`.
+            max_concurrency: Maximum number of status checks to make at
+                once.
+            timeout: Optional time limit in seconds for every job to finish.
+                Defaults to ``None``.
+            cancel_on_timeout: Whether to cancel the jobs that haven't
+                finished when time runs out. Defaults to ``False``.
+            hedge: Optional policy for resubmitting jobs that take much
+                longer than the rest of the batch. A hedged job's result is
+                whichever of its copies completes first. Defaults to
+                ``None``, which never resubmits jobs.
+            retry: Optional policy for queueing jobs again when they fail
+                with a transient error. A retried job's result is its last
+                attempt. Defaults to ``None``, which never retries.
+
+        Returns:
+            An iterator of `(job, info)` pairs in the order that jobs reach a
+            terminal status. A job whose status checks keep failing is
+            reported as failed rather than stopping the rest of the batch.
+
+        Raises:
+            JobTimeoutError: Raised if any job is still running at the
+                deadline or timeout.
+
+        Example:
+            >>> jobs = [client.queue_node(node) for node in nodes]
+            >>> for job, info in client.as_completed(jobs):
+            ...     print(job.job_id, info.status)
+        """
+        jobs = list(jobs)
+
+        for index, info in self._wait_indexed(
+            jobs,
+            deadline,
+            poll,
+            max_concurrency,
+            timeout,
+            cancel_on_timeout,
+            hedge,
+            self._retrier(retry),
+        ):
+            yield jobs[index], info
+
+    def wait_all(
+        self,
+        jobs: Sequence[Job],
+        deadline: Optional[Union[float, Deadline]] = None,
+        poll: Optional[PollStrategy] = None,
+        max_concurrency: int = DEFAULT_POLL_CONCURRENCY,
+        timeout: Optional[float] = None,
+        cancel_on_timeout: bool = False,
+        hedge: Optional[HedgePolicy] = None,
+        retry: Optional[JobRetryPolicy] = None,
+    ) -> list[JobInfo]:
+        """
+        Wait for many jobs at once.
+
+        Args:
+            jobs: The jobs to wait for.
+            deadline: Optional time limit in seconds, or a `Deadline`, for
+                every job to finish. Defaults to ``None``.
+            poll: Strategy for waiting between status checks of each job.
+                Defaults to the client's `poll_strategy`.
+            max_concurrency: Maximum number of status checks to make at
+                once.
+            timeout: Optional time limit in seconds for every job to finish.
+                Defaults to ``None``.
+            cancel_on_timeout: Whether to cancel the jobs that haven't
+                finished when time runs out. Defaults to ``False``.
+            hedge: Optional policy for resubmitting jobs that take much
+                longer than the rest of the batch. A hedged job's result is
+                whichever of its copies completes first. Defaults to
+                ``None``, which never resubmits jobs.
+            retry: Optional policy for queueing jobs again when they fail
+                with a transient error. A retried job's result is its last
+                attempt. Defaults to ``None``, which never retries.
+
+        Returns:
+            A JobInfo object for each job, in the same order as `jobs`. A job
+            whose status checks keep failing is reported as failed rather
+            than stopping the rest of the batch.
+
+        Raises:
+            JobTimeoutError: Raised if any job is still running at the
+                deadline or timeout.
+
+        Example:
+            >>> jobs = [client.queue_node(node) for node in nodes]
+            >>> results = client.wait_all(jobs, timeout=600, cancel_on_timeout=True)
+        """
+        jobs = list(jobs)
+        results: list[Optional[JobInfo]] = [None] * len(jobs)
+
+        for index, info in self._wait_indexed(
+            jobs,
+            deadline,
+            poll,
+            max_concurrency,
+            timeout,
+            cancel_on_timeout,
+            hedge,
+            self._retrier(retry),
+        ):
+            results[index] = info
+
+        return results  # type: ignore[return-value]
+
+    def gather(
+        self,
+        jobs: Sequence[Job],
+        retry: Optional[JobRetryPolicy] = None,
+        deadline: Optional[Union[float, Deadline]] = None,
+        poll: Optional[PollStrategy] = None,
+        max_concurrency: int = DEFAULT_POLL_CONCURRENCY,
+        timeout: Optional[float] = None,
+        cancel_on_timeout: bool = False,
+        hedge: Optional[HedgePolicy] = None,
+    ) -> list[JobOutcome]:
+        """
+        Wait for many jobs at once, retrying those that fail with transient
+        errors, and report every attempt at each job.
+
+        Args:
+            jobs: The jobs to wait for.
+            retry: Optional policy for queueing jobs again when they fail
+                with a transient error. Defaults to ``JobRetryPolicy()``.
+            deadline: Optional time limit in seconds, or a `Deadline`, for
+                every job to finish. Defaults to ``None``.
+            poll: Strategy for waiting between status checks of each job.
+                Defaults to the client's `poll_strategy`.
+            max_concurrency: Maximum number of status checks to make at
+                once.
+            timeout: Optional time limit in seconds for every job to finish.
+                Defaults to ``None``.
+            cancel_on_timeout: Whether to cancel the jobs that haven't
+                finished when time runs out. Defaults to ``False``.
+            hedge: Optional policy for resubmitting jobs that take much
+                longer than the rest of the batch. Defaults to ``None``.
+
+        Returns:
+            A `JobOutcome` for each job, in the same order as `jobs`.
+
+        Raises:
+            JobTimeoutError: Raised if any job is still running at the
+                deadline or timeout.
+
+        Example:
+            >>> jobs = [client.queue_node(node) for node in nodes]
+            >>> outcomes = client.gather(jobs, retry=JobRetryPolicy(max_attempts=5))
+            >>> retried = [o for o in outcomes if len(o.attempts) > 1]
+        """
+        jobs = list(jobs)
+        retrier = JobRetrier(retry or JobRetryPolicy(), queue=self.queue_node)
+        outcomes: list[Optional[JobOutcome]] = [None] * len(jobs)
+
+        for index, info in self._wait_indexed(
+            jobs,
+            deadline,
+            poll,
+            max_concurrency,
+            timeout,
+            cancel_on_timeout,
+            hedge,
+            retrier,
+        ):
+            outcomes[index] = JobOutcome(info=info, attempts=retrier.attempts(index))
+
+        return outcomes  # type: ignore[return-value]
+
+    def _wait_indexed(
+        self,
+        jobs: list[Job],
+        deadline: Optional[Union[float, Deadline]],
+        poll: Optional[PollStrategy],
+        max_concurrency: int,
+        timeout: Optional[float],
+        cancel_on_timeout: bool,
+        hedge: Optional[HedgePolicy] = None,
+        retrier: Optional[JobRetrier] = None,
+    ) -> Iterator[tuple[int, JobInfo]]:
+        """
+        Wait for many jobs at once, yielding the index of each as it
+        finishes.
+
+        Args:
+            jobs: The jobs to wait for.
+            deadline: Optional time limit in seconds, or a `Deadline`, for
+                every job to finish.
+            poll: Strategy for waiting between status checks of each job.
+            max_concurrency: Maximum number of status checks to make at
+                once.
+            timeout: Optional time limit in seconds for every job to finish.
+            cancel_on_timeout: Whether to cancel the jobs that haven't
+                finished when time runs out.
+            hedge: Optional policy for resubmitting stragglers.
+            retrier: Optional retrier for queueing failed jobs again.
+
+        Returns:
+            An iterator of `(index, info)` pairs, where `index` is the
+            position of the job in `jobs`.
+
+        Raises:
+            JobTimeoutError: Raised if any job is still running at the
+                deadline or timeout.
+        """
+        scheduler = JobScheduler(
+            self.job_status,
+            poll or self.poll_strategy,
+            max_concurrency=max_concurrency,
+        )
+        deadline = Deadline.earliest(
+            Deadline.coerce(deadline),
+            Deadline.coerce(timeout),
+        )
+
+        hedger = None
+        if hedge is not None:
+            hedger = Hedger(
+                hedge,
+                len(jobs),
+                queue=self.queue_node,
+                cancel=self.cancel_job,
+                tokens=self.view_tokens,
+            )
+
+        finished: set[int] = set()
+
+        try:
+            for index, info in scheduler.as_completed(jobs, deadline, hedger, retrier):
+                finished.add(index)
+                yield index, info
+        except DeadlineExceeded as e:
+            unfinished = [job for i, job in enumerate(jobs) if i not in finished]
+            raise self._timed_out(unfinished, cancel_on_timeout) from e
+
+    def _retrier(self, policy: Optional[JobRetryPolicy]) -> Optional[JobRetrier]:
+        """
+        Create a retrier for one batch of jobs.
+
+        Args:
+            policy: When to retry, if at all.
+
+        Returns:
+            The retrier, or `None` if jobs shouldn't be retried.
+        """
+        if policy is None:
+            return None
+
+        return JobRetrier(policy, queue=self.queue_node)
+
+    def _timed_out(self, jobs: list[Job], cancel: bool) -> JobTimeoutError:
+        """
+        Handle jobs that didn't finish in time, cancelling them if asked.
+
+        Cancellation is confirmed by waiting up to `CANCEL_CONFIRM_TIMEOUT`
+        seconds for each job to report that it was cancelled.
+
+        Args:
+            jobs: The jobs that didn't finish.
+            cancel: Whether to cancel the jobs.
+
+        Returns:
+            The error to raise, listing the jobs confirmed as cancelled.
+        """
+        job_ids = [job.job_id for job in jobs]
+
+        if not cancel:
+            return JobTimeoutError(job_ids)
+
+        requested = [
+            job for job, result in zip(jobs, self.cancel_jobs(jobs)) if result is True
+        ]
+        cancelled: list[str] = []
+
+        try:
+            for job, info in self.as_completed(
+                requested,
+                deadline=CANCEL_CONFIRM_TIMEOUT,
+                poll=FixedPoll(CANCEL_CONFIRM_INTERVAL),
+            ):
+                if JobStatus(info.status.value) == JobStatus.CANCELLED:
+                    cancelled.append(job.job_id)
+        except Exception:
+            # Confirmation is best effort. The jobs still timed out, so report
+            # that rather than whatever went wrong while checking on them.
+            pass
+
+        return JobTimeoutError(job_ids, cancelled)
+
+    def submit_node(
+        self,
+        node: Union[str, Node],
+        inputs: Optional[dict[str, Any]] = None,
+        deadline: Optional[Union[float, Deadline]] = None,
+        poll: Optional[PollStrategy] = None,
+        retry: Optional[JobRetryPolicy] = None,
+    ) -> JobFuture:
+        """
+        Queue a node and return a future for its result.
+
+        Args:
+            node: The name of the node to execute or the node object itself.
+            inputs: The input data for the node. If the node is defined by its name,
+                this is required. Defaults to ``None``.
+            deadline: Optional time limit in seconds, or a `Deadline`, covering
+                queueing, every status poll and all retries. Defaults to ``None``.
+            poll: Strategy for waiting between status checks. Defaults to the
+                client's `poll_strategy`.
+            retry: Optional policy for queueing the node again if it fails
+                with a transient error. Defaults to ``None``, which never
+                retries.
+
+        Returns:
+            A `JobFuture` that resolves to the `JobInfo` of the job's last
+            attempt.
+
+        Example:
+            >>> futures = [client.submit_node(node) for node in nodes]
+            >>> for future in concurrent.futures.as_completed(futures):
+            ...     print(future.job.job_id, future.result().outputs)
+        """
+        deadline = Deadline.coerce(deadline)
+        job = self.queue_node(node, inputs, deadline=deadline)
+        return self.job_future(job, deadline=deadline, poll=poll, retry=retry)
+
+    def submit_workflow(
+        self,
+        project_id: str,
+        workflow_id: str,
+        inputs: Optional[
+            Union[list[OverrideWorkflowInput], list[dict[str, Any]]]
+        ] = None,
+        outputs: Optional[
+            Union[list[OverrideWorkflowOutput], list[dict[str, Any]]]
+        ] = None,
+        deadline: Optional[Union[float, Deadline]] = None,
+        poll: Optional[PollStrategy] = None,
+    ) -> JobFuture:
+        """
+        Queue a workflow and return a future for its result.
+
+        Workflow jobs don't say which workflow they ran, so unlike
+        `submit_node` they can't be retried.
+
+        Args:
+            project_id: The ID of the project where the workflow is saved
+            workflow_id: The ID of the workflow you want to run
+            inputs: Optional list of inputs to override within the workflow
+            outputs: Optional list of outputs to override
+            deadline: Optional time limit in seconds, or a `Deadline`, covering
+                queueing and every status poll
+            poll: Strategy for waiting between status checks. Defaults to the
+                client's `poll_strategy`.
+
+        Returns:
+            A `JobFuture` that resolves to the workflow's `JobInfo`.
+        """
+        deadline = Deadline.coerce(deadline)
+
+        # catch deprecation warning from `queue_workflow`
+        with warnings.catch_warnings():
+            warnings.simplefilter("always")
+            job = self.queue_workflow(
+                project_id, workflow_id, inputs, outputs, deadline=deadline
+            )
+
+        return self.job_future(job, deadline=deadline, poll=poll)
+
+    def job_future(
+        self,
+        job: Job,
+        deadline: Optional[Union[float, Deadline]] = None,
+        poll: Optional[PollStrategy] = None,
+        retry: Optional[JobRetryPolicy] = None,
+    ) -> JobFuture:
+        """
+        Get a future for the result of a queued job.
+
+        Every future is driven by one background poller shared by the
+        client, so waiting on many jobs doesn't need a thread per job.
+
+        Args:
+            job: The job to track.
+            deadline: Optional time limit in seconds, or a `Deadline`, for
+                the job to finish. The future fails with `DeadlineExceeded`
+                if it passes. Defaults to ``None``.
+            poll: Strategy for waiting between status checks. Defaults to the
+                client's `poll_strategy`.
+            retry: Optional policy for queueing the job again if it fails
+                with a transient error. The future's `job` is updated to each
+                new attempt. Defaults to ``None``, which never retries.
+
+        Returns:
+            A `JobFuture` that resolves to the `JobInfo` of the job's last
+            attempt. Cancelling the future cancels the job.
+
+        Example:
+            >>> job = client.queue_node(add_node)
+            >>> future = client.job_future(job)
+            >>> future.result(timeout=60)
+        """
+        with self._poller_lock:
+            if self._poller is None:
+                self._poller = JobPoller(self.job_status)
+            poller = self._poller
+
+        future = JobFuture(job, self.cancel_job)
+        poller.watch(
+            job,
+            future,
+            poll or self.poll_strategy,
+            deadline=Deadline.coerce(deadline),
+            retrier=self._retrier(retry),
+        )
+        return future
+
+    def map(
+        self,
+        node_factory: Callable[[Any], Union[Node, tuple[str, dict[str, Any]]]],
+        inputs: Iterable[Any],
+        max_in_flight: int = DEFAULT_SUBMIT_CONCURRENCY,
+        ordered: bool = False,
+        deadline: Optional[Union[float, Deadline]] = None,
+        poll: Optional[PollStrategy] = None,
+        budget: Optional[TokenBudget] = None,
+        retry: Optional[JobRetryPolicy] = None,
+    ) -> Iterator[JobInfo]:
+        """
+        Run a node for every item of an iterable, yielding results as jobs
+        finish.
+
+        Items are pulled lazily and no more than `max_in_flight` jobs are
+        queued at once. A new job is only queued when a result is taken, so
+        memory use and load on the Uncertainty Engine stay bounded however
+        long `inputs` is. Jobs still running when the iterator is closed
+        early are cancelled.
+
+        Args:
+            node_factory: Callback that builds the node to run for an item,
+                as a node object or a `(name, inputs)` pair.
+            inputs: The items to run nodes for. May be a generator.
+            max_in_flight: Maximum number of jobs to have queued at once.
+            ordered: Whether to yield results in the same order as
+                `inputs`. Otherwise results are yielded as jobs finish.
+                Defaults to ``False``.
+            deadline: Optional time limit in seconds, or a `Deadline`, for
+                every job to be queued and finish. Defaults to ``None``.
+            poll: Strategy for waiting between status checks of each job.
+                Defaults to the client's `poll_strategy`.
+            budget: Optional token budget from `token_budget` to pace
+                queueing by. Retries aren't paced by it. Defaults to ``None``.
+            retry: Optional policy for queueing jobs again when they fail
+                with a transient error. A retried job's result is its last
+                attempt, and it keeps its place while it's retried. Defaults
+                to ``None``, which never retries.
+
+        Returns:
+            An iterator of JobInfo objects, one for each item.
+
+        Raises:
+            ValueError: Raised if `max_in_flight` is less than 1.
+            DeadlineExceeded: Raised if a job is still running at the
+                deadline.
+            TokenBudgetExceeded: Raised once the jobs already queued have
+                finished if the budget doesn't allow any more.
+
+        Example:
+            >>> def make_node(row):
+            ...     return Node(node_name="Add", version="0.2.0", lhs=row[0], rhs=row[1])
+            >>> rows = csv.reader(open("huge.csv"))
+            >>> for info in client.map(make_node, rows, max_in_flight=50):
+            ...     print(info.outputs)
+        """
+        # Checked here rather than in the generator so the error is raised
+        # by the call itself.
+        if max_in_flight < 1:
+            raise ValueError(f"max_in_flight must be at least 1, not {max_in_flight}.")
+
+        return self._map(
+            node_factory,
+            inputs,
+            max_in_flight,
+            ordered,
+            Deadline.coerce(deadline),
+            poll,
+            budget,
+            retry,
+        )
+
+    def _map(
+        self,
+        node_factory: Callable[[Any], Union[Node, tuple[str, dict[str, Any]]]],
+        inputs: Iterable[Any],
+        max_in_flight: int,
+        ordered: bool,
+        deadline: Optional[Deadline],
+        poll: Optional[PollStrategy],
+        budget: Optional[TokenBudget],
+        retry: Optional[JobRetryPolicy],
+    ) -> Iterator[JobInfo]:
+        """
+        Run a node for every item of an iterable. See `map`.
+
+        Args:
+            node_factory: Callback that builds the node to run for an item.
+            inputs: The items to run nodes for.
+            max_in_flight: Maximum number of jobs to have queued at once.
+            ordered: Whether to yield results in the same order as `inputs`.
+            deadline: Optional deadline for every job to be queued and
+                finish.
+            poll: Strategy for waiting between status checks of each job.
+            budget: Optional token budget to pace queueing by.
+            retry: Optional policy for queueing failed jobs again.
+
+        Returns:
+            An iterator of JobInfo objects, one for each item.
+        """
+        items = iter(inputs)
+        in_flight: deque[JobFuture] = deque()
+        exhausted: Optional[TokenBudgetExceeded] = None
+
+        try:
+            while True:
+                if exhausted is None:
+                    try:
+                        for item in islice(items, max_in_flight - len(in_flight)):
+                            job = self._queue_spec(node_factory(item), deadline, budget)
+                            in_flight.append(
+                                self.job_future(job, deadline, poll, retry)
+                            )
+                    except TokenBudgetExceeded as e:
+                        # Let the jobs the budget allowed finish first.
+                        exhausted = e
+
+                if not in_flight:
+                    if exhausted is not None:
+                        raise exhausted
+
+                    return
+
+                if ordered:
+                    yield in_flight.popleft().result()
+                    continue
+
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    in_flight.remove(future)
+
+                for future in done:
+                    yield future.result()
+        finally:
+            # Try every job, so one failed cancel doesn't leave the rest
+            # running or hide the error that stopped the iteration.
+            for future in in_flight:
+                try:
+                    future.cancel()
+                except Exception:
+                    logger.warning(
+                        "Failed to cancel job %s", future.job.job_id, exc_info=True
+                    )
+
+    def resume(
+        self,
+        journal: JobJournal,
+        deadline: Optional[Union[float, Deadline]] = None,
+        poll: Optional[PollStrategy] = None,
+    ) -> list[JobFuture]:
+        """
+        Resume a batch recorded in a journal.
+
+        The journal becomes the client's journal, so queueing the batch's
+        nodes again only submits those that were never queued.
+
+        Args:
+            journal: The journal the batch was recorded in.
+            deadline: Optional time limit in seconds, or a `Deadline`, for
+                every unfinished job to finish. Defaults to ``None``.
+            poll: Strategy for waiting between status checks. Defaults to the
+                client's `poll_strategy`.
+
+        Returns:
+            A `JobFuture` for each job that hadn't been seen to finish, in
+            the order they were submitted.
+
+        Example:
+            >>> journal = JobJournal("journals", "sweep")
+            >>> futures = client.resume(journal)
+            >>> # Only inputs that were never queued are submitted.
+            >>> jobs = [client.queue_node(node) for node in nodes]
+        """
+        self.journal = journal
+
+        deadline = Deadline.coerce(deadline)
+        return [
+            self.job_future(job, deadline=deadline, poll=poll)
+            for job in journal.unfinished()
+        ]
+
+    def watch(
+        self,
+        job: Job,
+        deadline: Optional[Union[float, Deadline]] = None,
+        poll: Optional[PollStrategy] = None,
+    ) -> Iterator[JobInfo]:
+        """
+        Follow the progress of a job.
+
+        The job is polled like `run_node` waits for it, but a `JobInfo` is
+        only yielded when the job's status or message changes, so unchanged
+        responses are skipped.
+
+        Args:
+            job: The job to follow.
+            deadline: Optional time limit in seconds, or a `Deadline`, for
+                the job to finish. Defaults to ``None``.
+            poll: Strategy for waiting between status checks. Defaults to the
+                client's `poll_strategy`.
+
+        Returns:
+            An iterator of the job's `JobInfo` each time it changes. The last
+            has a terminal status.
+
+        Raises:
+            JobTimeoutError: Raised if the job doesn't finish before the
+                deadline.
+
+        Example:
+            >>> job = client.queue_node(node)
+            >>> for info in client.watch(job):
+            ...     print(info.status, info.message)
+        """
+        deadline = Deadline.coerce(deadline)
+        last: Optional[tuple[JobStatus, Optional[str]]] = None
+
+        try:
+            for info in self._poll_job(job, deadline, poll):
+                current = (JobStatus(info.status.value), info.message)
+                if current != last:
+                    last = current
+                    yield info
+        except DeadlineExceeded as e:
+            raise self._timed_out([job], False) from e
 
     def cancel_job(self, job: Job) -> bool:
         """
@@ -528,6 +1678,50 @@ class Client:
         response = self.core_api.post(f"/nodes/jobs/{job.job_id}/cancel", {})
         return response
 
+    def cancel_jobs(
+        self,
+        jobs: Sequence[Job],
+        max_in_flight: int = DEFAULT_SUBMIT_CONCURRENCY,
+    ) -> list[Union[bool, Exception]]:
+        """
+        Cancel many jobs at once.
+
+        Args:
+            jobs: The jobs to cancel.
+            max_in_flight: Maximum number of cancel requests to make at once.
+
+        Returns:
+            Whether each job was cancelled, or the error raised while
+            cancelling it, in the same order as `jobs`.
+
+        Example:
+            >>> jobs = [client.queue_node(node) for node in nodes]
+            >>> client.cancel_jobs(jobs)
+            [True, True, True]
+        """
+        return self._map_concurrently(self.cancel_job, jobs, max_in_flight)
+
+    def token_budget(self, policy: Optional[TokenBudgetPolicy] = None) -> TokenBudget:
+        """
+        Create a token budget for a batch of jobs, to pass to `queue_nodes`
+        or `map`.
+
+        Args:
+            policy: The batch's limits. Defaults to `TokenBudgetPolicy()`,
+                which only tracks spend.
+
+        Returns:
+            A new budget that checks this client's token balance.
+
+        Example:
+            >>> budget = client.token_budget(
+            ...     TokenBudgetPolicy(max_spend=5000, min_balance=1000)
+            ... )
+            >>> jobs = client.queue_nodes(nodes, budget=budget)
+            >>> print(f"Spent {budget.report().spent} tokens")
+        """
+        return TokenBudget(policy or TokenBudgetPolicy(), self.view_tokens)
+
     def view_tokens(self) -> int:
         """
         View the number of tokens currently available to the user's
@@ -590,21 +1784,85 @@ class Client:
                 ) from e
             raise
 
-    def _wait_for_job(self, job: Job) -> JobInfo:
+    def _wait_for_job(
+        self,
+        job: Job,
+        deadline: Optional[Union[float, Deadline]] = None,
+        poll: Optional[PollStrategy] = None,
+        timeout: Optional[float] = None,
+        cancel_on_timeout: bool = False,
+    ) -> JobInfo:
         """
         Wait for a job to complete.
 
         Args:
             job: The job to wait for.
+            deadline: Optional time limit in seconds, or a `Deadline`, for
+                every status poll. Defaults to ``None``.
+            poll: Strategy for waiting between status checks. Defaults to the
+                client's `poll_strategy`.
+            timeout: Optional time limit in seconds for the job to finish.
+                Defaults to ``None``.
+            cancel_on_timeout: Whether to cancel the job if it doesn't finish
+                in time. Defaults to ``False``.
 
         Returns:
             A JobInfo object containing the response data of the job.
+
+        Raises:
+            JobTimeoutError: Raised if the job doesn't finish before the
+                deadline or timeout.
         """
-        response = self.job_status(job)
-        status = JobStatus(response.status.value)
-        while not status.is_terminal():
-            sleep(STATUS_WAIT_TIME)
-            response = self.job_status(job)
-            status = JobStatus(response.status.value)
+        deadline = Deadline.earliest(
+            Deadline.coerce(deadline),
+            Deadline.coerce(timeout),
+        )
+
+        try:
+            for response in self._poll_job(job, deadline, poll):
+                pass
+        except DeadlineExceeded as e:
+            raise self._timed_out([job], cancel_on_timeout) from e
 
         return response
+
+    def _poll_job(
+        self,
+        job: Job,
+        deadline: Optional[Deadline],
+        poll: Optional[PollStrategy],
+    ) -> Iterator[JobInfo]:
+        """
+        Check the status of a job until it finishes.
+
+        Args:
+            job: The job to check.
+            deadline: Optional deadline for the job to finish.
+            poll: Strategy for waiting between status checks. Defaults to the
+                client's `poll_strategy`.
+
+        Returns:
+            An iterator of the `JobInfo` from every status check. The last
+            has a terminal status.
+
+        Raises:
+            DeadlineExceeded: Raised if the job doesn't finish before the
+                deadline.
+        """
+        delays = (poll or self.poll_strategy).delays_for(job)
+
+        response = self.job_status(job, deadline=deadline)
+        yield response
+
+        while not JobStatus(response.status.value).is_terminal():
+            wait_time = next(delays)
+            if deadline is not None:
+                wait_time = min(wait_time, deadline.remaining())
+
+            sleep(wait_time)
+
+            if deadline is not None:
+                deadline.check(f"job {job.job_id}")
+
+            response = self.job_status(job, deadline=deadline)
+            yield response
@@ -1,4 +1,4 @@
-from datetime import datetime
+from datetime import datetime, timedelta
 from typing import Any, Dict
 
 import boto3
@@ -63,12 +63,24 @@ class CognitoToken:
     @property
     def is_expired(self) -> bool:
         """Check if token is expired"""
+        return self.expires_within(0)
+
+    def expires_within(self, seconds: float) -> bool:
+        """
+        Check if the token expires within a number of seconds from now.
+
+        Args:
+            seconds: Number of seconds from now.
+
+        Returns:
+            ``True`` if the token will have expired by then.
+        """
         try:
             exp = self.decoded_payload["exp"]
         except KeyError:
             raise KeyError("Invalid token: Token did not include an expiry time")
         exp_datetime = datetime.fromtimestamp(exp)
-        return datetime.now() > exp_datetime
+        return datetime.now() + timedelta(seconds=seconds) > exp_datetime
 
 
 class CognitoAuthenticator:
@@ -0,0 +1,337 @@
+import sqlite3
+from collections import OrderedDict, deque
+from math import ceil, floor
+from pathlib import Path
+from threading import Lock
+from time import time
+from typing import Any, Iterable, Optional
+
+from uncertainty_engine_types import JobInfo, JobStatus
+
+from uncertainty_engine.job import Job
+
+DEFAULT_MAX_SAMPLES = 200
+"""
+Default number of durations a `DurationHistory` keeps for each node.
+"""
+
+DEFAULT_MAX_QUEUED = 10_000
+"""
+Default number of unfinished jobs a `DurationHistory` tracks.
+"""
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS durations (
+    node_key TEXT NOT NULL,
+    duration REAL NOT NULL,
+    finished_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS durations_node_key ON durations (node_key, finished_at);
+"""
+
+
+def node_key(node_id: str, version: Optional[str | int] = None) -> str:
+    """
+    Get the key that durations of a node are recorded under.
+
+    Args:
+        node_id: The ID of the node.
+        version: The version of the node, if known.
+
+    Returns:
+        `node_id@version`, or just `node_id` if the version isn't known.
+    """
+
+    return node_id if version is None else f"{node_id}@{version}"
+
+
+def percentile(values: list[float], q: float) -> float:
+    """
+    Get a percentile of some values, interpolating between the closest two.
+
+    Args:
+        values: The values, sorted in ascending order. Must not be empty.
+        q: The percentile, from 0 to 100.
+
+    Returns:
+        The percentile.
+    """
+
+    position = (len(values) - 1) * q / 100
+    lower = values[floor(position)]
+    upper = values[ceil(position)]
+    return lower + (upper - lower) * (position - floor(position))
+
+
+class DurationHistory:
+    """
+    Records how long jobs take from being queued to completing, so the
+    client can predict when similar jobs will finish.
+
+    Durations are kept per node and version, since nodes like `TrainModel`
+    and `Add` differ in runtime by orders of magnitude. Only the latest
+    `max_samples` durations of each node are kept, and only jobs that
+    completed are recorded. An instance is safe to share between threads.
+
+    A job is only seen to complete when its status is checked, some time
+    after it actually completed. Each job is taken to have completed midway
+    between the last check that found it running and the first that found
+    it complete, so durations aren't skewed by how often jobs are polled.
+
+    Args:
+        max_samples: Maximum number of durations to keep for each node.
+        directory: Optional directory to keep durations in, so they're used
+            across processes. Created if it doesn't exist.
+        max_queued: Maximum number of unfinished jobs to track. The oldest
+            are forgotten beyond this, for example jobs whose status is
+            never checked.
+
+    Example:
+        >>> history = DurationHistory(directory="~/.uncertainty-engine/history")
+        >>> client = Client(durations=history, poll_strategy=PredictivePoll(history))
+        >>> jobs = [client.queue_node(node) for node in nodes]
+        >>> history.eta(jobs)
+        42.0
+    """
+
+    def __init__(
+        self,
+        max_samples: int = DEFAULT_MAX_SAMPLES,
+        directory: str | Path | None = None,
+        max_queued: int = DEFAULT_MAX_QUEUED,
+    ) -> None:
+        self.max_samples = max_samples
+        self.max_queued = max_queued
+
+        self._samples: dict[str, deque[float]] = {}
+        self._lock = Lock()
+
+        # Jobs that haven't finished yet, keyed by job ID, with their key,
+        # when they were queued and when they were last seen running. Oldest
+        # first.
+        self._queued: OrderedDict[str, tuple[str, float, float]] = OrderedDict()
+
+        self._connection: sqlite3.Connection | None = None
+        if directory is not None:
+            directory = Path(directory).expanduser()
+            directory.mkdir(parents=True, exist_ok=True)
+
+            self._connection = sqlite3.connect(
+                directory / "durations.sqlite3",
+                check_same_thread=False,
+            )
+            self._connection.executescript(_SCHEMA)
+
+            rows = self._connection.execute(
+                "SELECT node_key, duration FROM durations ORDER BY finished_at"
+            )
+            for key, duration in rows:
+                self._samples_for(key).append(duration)
+
+    def __enter__(self) -> "DurationHistory":
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """
+        Close the on-disk store, if any.
+        """
+
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+    def queued(self, job: Job, key: Optional[str] = None) -> None:
+        """
+        Note that a job has been queued, so its duration can be recorded
+        when it completes.
+
+        Args:
+            job: The queued job.
+            key: The key to record the job's duration under. Defaults to the
+                job's node ID.
+        """
+
+        now = time()
+
+        with self._lock:
+            self._queued[job.job_id] = (key or node_key(job.node_id), now, now)
+            self._queued.move_to_end(job.job_id)
+
+            while len(self._queued) > self.max_queued:
+                self._queued.popitem(last=False)
+
+    def finished(self, job: Job, info: JobInfo) -> None:
+        """
+        Note a status check of a job, and record its duration if it
+        completed.
+
+        Args:
+            job: The job.
+            info: The job's `JobInfo`. Jobs that failed or were cancelled
+                are forgotten without recording a duration.
+        """
+
+        status = JobStatus(info.status.value)
+        now = time()
+
+        with self._lock:
+            queued = self._queued.get(job.job_id)
+            if queued is None:
+                return
+
+            key, queued_at, _ = queued
+
+            if not status.is_terminal():
+                self._queued[job.job_id] = (key, queued_at, now)
+                return
+
+            _, _, last_running = self._queued.pop(job.job_id)
+            if status != JobStatus.COMPLETED:
+                return
+
+            # The job completed at some point since it was last seen running.
+            self._add(key, (last_running + now) / 2 - queued_at)
+
+    def record(self, key: str, duration: float) -> None:
+        """
+        Record the duration of a job run outside this history, for example
+        to seed it from logs.
+
+        Args:
+            key: The node's key from `node_key`.
+            duration: Seconds from being queued to completing.
+        """
+
+        with self._lock:
+            self._add(key, duration)
+
+    def percentile(self, key: str, q: float = 50) -> Optional[float]:
+        """
+        Estimate how long a node takes to complete.
+
+        Args:
+            key: The node's key from `node_key`.
+            q: The percentile to estimate, from 0 to 100. Defaults to the
+                median.
+
+        Returns:
+            The estimated seconds from being queued to completing, or `None`
+            if no durations of the node have been recorded.
+        """
+
+        with self._lock:
+            samples = self._samples.get(key)
+            if not samples:
+                return None
+
+            return percentile(sorted(samples), q)
+
+    def remaining(self, job: Job, q: float = 50) -> Optional[float]:
+        """
+        Estimate how long a queued job has left.
+
+        Args:
+            job: The job. Must have been queued through the client using
+                this history.
+            q: The percentile of the node's durations to estimate with.
+                Defaults to the median.
+
+        Returns:
+            The estimated seconds until the job completes, which is `0` if it
+            has already overrun the estimate, or `None` if there's no
+            estimate.
+        """
+
+        with self._lock:
+            queued = self._queued.get(job.job_id)
+
+        if queued is None:
+            return None
+
+        key, queued_at, _ = queued
+        expected = self.percentile(key, q)
+        if expected is None:
+            return None
+
+        return max(0.0, expected - (time() - queued_at))
+
+    def eta(self, jobs: Iterable[Job], q: float = 50) -> Optional[float]:
+        """
+        Estimate how long a batch of queued jobs has left.
+
+        Args:
+            jobs: The jobs in the batch.
+            q: The percentile of each node's durations to estimate with.
+                Defaults to the median.
+
+        Returns:
+            The estimated seconds until every unfinished job completes, or
+            `None` if any unfinished job has no estimate. Jobs that have
+            finished, or weren't queued by a client using this history, are
+            ignored.
+        """
+
+        eta = 0.0
+        for job in jobs:
+            with self._lock:
+                if job.job_id not in self._queued:
+                    continue
+
+            remaining = self.remaining(job, q)
+            if remaining is None:
+                return None
+
+            eta = max(eta, remaining)
+
+        return eta
+
+    def _samples_for(self, key: str) -> deque[float]:
+        """
+        Get the durations of a node, creating an empty history if needed.
+        Must be called with the lock held, or before the history is shared.
+
+        Args:
+            key: The node's key.
+
+        Returns:
+            The node's durations, oldest first.
+        """
+
+        samples = self._samples.get(key)
+        if samples is None:
+            samples = self._samples[key] = deque(maxlen=self.max_samples)
+
+        return samples
+
+    def _add(self, key: str, duration: float) -> None:
+        """
+        Record a duration in memory and on disk, dropping the oldest
+        durations of the node beyond `max_samples`. Must be called with the
+        lock held.
+
+        Args:
+            key: The node's key.
+            duration: Seconds from being queued to completing.
+        """
+
+        self._samples_for(key).append(duration)
+
+        if self._connection is None:
+            return
+
+        with self._connection:
+            self._connection.execute(
+                "INSERT INTO durations (node_key, duration, finished_at)"
+                " VALUES (?, ?, ?)",
+                (key, duration, time()),
+            )
+            self._connection.execute(
+                "DELETE FROM durations WHERE node_key = ? AND rowid NOT IN ("
+                " SELECT rowid FROM durations WHERE node_key = ?"
+                " ORDER BY finished_at DESC LIMIT ?)",
+                (key, key, self.max_samples),
+            )
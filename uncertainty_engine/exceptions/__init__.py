@@ -1,6 +1,10 @@
+from uncertainty_engine.exceptions.circuit_open_error import CircuitOpenError
+from uncertainty_engine.exceptions.deadline_exceeded import DeadlineExceeded
 from uncertainty_engine.exceptions.graph_validation_error import GraphValidationError
 from uncertainty_engine.exceptions.incomplete_credentials import IncompleteCredentials
+from uncertainty_engine.exceptions.job_timeout_error import JobTimeoutError
 from uncertainty_engine.exceptions.node_validation_error import NodeValidationError
+from uncertainty_engine.exceptions.token_budget_exceeded import TokenBudgetExceeded
 from uncertainty_engine.exceptions.workflow_validation_error import (
     NodeErrorInfo,
     NodeHandleErrorInfo,
@@ -9,9 +13,13 @@ from uncertainty_engine.exceptions.workflow_validation_error import (
 )
 
 __all__ = [
+    "CircuitOpenError",
+    "DeadlineExceeded",
     "IncompleteCredentials",
+    "JobTimeoutError",
     "GraphValidationError",
     "NodeValidationError",
+    "TokenBudgetExceeded",
     "WorkflowValidationError",
     "NodeErrorInfo",
     "NodeHandleErrorInfo",
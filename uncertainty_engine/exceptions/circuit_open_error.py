@@ -0,0 +1,16 @@
+class CircuitOpenError(Exception):
+    """
+    Raised instead of calling an API whose circuit breaker is open.
+
+    Args:
+        endpoint: The API endpoint that is failing.
+        retry_in: Seconds until the breaker lets a trial request through.
+    """
+
+    def __init__(self, endpoint: str, retry_in: float) -> None:
+        self.endpoint = endpoint
+        self.retry_in = retry_in
+        super().__init__(
+            f"{endpoint} is failing, so requests to it are being rejected "
+            f"without being sent. Try again in {retry_in:.1f} seconds."
+        )
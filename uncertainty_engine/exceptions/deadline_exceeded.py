@@ -0,0 +1,11 @@
+class DeadlineExceeded(TimeoutError):
+    """
+    Raised when an operation doesn't finish before its deadline.
+
+    Args:
+        operation: Description of the operation that ran out of time.
+    """
+
+    def __init__(self, operation: str) -> None:
+        self.operation = operation
+        super().__init__(f"Deadline exceeded before {operation} finished.")
@@ -0,0 +1,28 @@
+from typing import Sequence
+
+from uncertainty_engine.exceptions.deadline_exceeded import DeadlineExceeded
+
+
+class JobTimeoutError(DeadlineExceeded):
+    """
+    Raised when jobs don't finish before their deadline.
+
+    Args:
+        job_ids: IDs of the jobs that hadn't finished.
+        cancelled: IDs of the jobs that were confirmed to be cancelled.
+    """
+
+    def __init__(self, job_ids: Sequence[str], cancelled: Sequence[str] = ()) -> None:
+        self.job_ids = list(job_ids)
+        self.cancelled = list(cancelled)
+
+        noun = "job" if len(self.job_ids) == 1 else "jobs"
+        super().__init__(f"{noun} {', '.join(self.job_ids)}")
+
+    def __str__(self) -> str:
+        message = super().__str__()
+
+        if self.cancelled:
+            message += f" Cancelled {', '.join(self.cancelled)}."
+
+        return message
@@ -0,0 +1,12 @@
+class TokenBudgetExceeded(Exception):
+    """
+    Raised instead of queueing a job that the batch's token budget doesn't
+    allow.
+
+    Args:
+        reason: Why the job wasn't queued.
+    """
+
+    def __init__(self, reason: str) -> None:
+        self.reason = reason
+        super().__init__(f"Job not queued: {reason}.")
@@ -0,0 +1,249 @@
+import logging
+from math import ceil
+from threading import Lock
+from typing import Any, Callable, Optional
+
+from pydantic import BaseModel, Field
+from uncertainty_engine_types import JobInfo, JobStatus
+
+from uncertainty_engine.durations import percentile
+from uncertainty_engine.job import Job
+
+logger = logging.getLogger(__name__)
+
+
+class HedgePolicy(BaseModel):
+    """
+    When to resubmit jobs that are taking much longer than the rest of
+    their batch.
+
+    A job is hedged once it has been running for longer than `percentile`
+    of the durations of its peers that completed. The same inputs are
+    queued again, whichever copy completes first is used and the other is
+    cancelled. A copy that fails is dropped while the other is still
+    running. Every hedge spends tokens, so the number of hedges in a batch
+    is capped.
+    """
+
+    percentile: float = Field(default=90, ge=0, le=100)
+    """
+    Percentile of peers' durations a job must exceed to be hedged.
+    """
+
+    min_peers: int = Field(default=5, ge=1)
+    """
+    Number of peers that must have completed before any job is hedged.
+    """
+
+    max_hedge_fraction: float = Field(default=0.05, gt=0, le=1)
+    """
+    Greatest fraction of a batch that may be hedged, rounded up.
+    """
+
+    max_hedges: Optional[int] = Field(default=None, ge=0)
+    """
+    Greatest number of jobs in a batch that may be hedged, or `None` to rely
+    on `max_hedge_fraction` alone.
+    """
+
+    min_tokens: Optional[int] = Field(default=None, ge=0)
+    """
+    Stop hedging once the organisation has fewer tokens than this, or
+    `None` to not check the balance.
+    """
+
+
+class Hedger:
+    """
+    Hedges the stragglers of one batch of jobs.
+
+    Each job in the batch occupies a slot. A slot finishes with whichever of
+    its jobs completes first, or with the last of them to fail.
+
+    Args:
+        policy: When to hedge.
+        batch_size: Number of jobs in the batch.
+        queue: Callback that queues a node, called as
+            `queue(node_id, inputs)`.
+        cancel: Callback that cancels a job.
+        tokens: Callback that gets the organisation's token balance. Only
+            called if the policy sets `min_tokens`.
+    """
+
+    def __init__(
+        self,
+        policy: HedgePolicy,
+        batch_size: int,
+        queue: Callable[[str, dict[str, Any]], Job],
+        cancel: Callable[[Job], Any],
+        tokens: Callable[[], int],
+    ) -> None:
+        self.policy = policy
+        self.queue = queue
+        self.cancel = cancel
+        self.tokens = tokens
+
+        self.limit = ceil(batch_size * policy.max_hedge_fraction)
+        if policy.max_hedges is not None:
+            self.limit = min(self.limit, policy.max_hedges)
+
+        self.hedges = 0
+        """
+        Number of jobs hedged so far, including any that couldn't be
+        resubmitted.
+        """
+
+        self._peers: list[float] = []
+
+        # Slots that have been hedged, with their original job, including
+        # slots whose job couldn't be resubmitted.
+        self._hedged: dict[int, Job] = {}
+
+        # Copies of each hedged slot's job that haven't finished, keyed by
+        # job ID.
+        self._running: dict[int, dict[str, Job]] = {}
+
+        self._finished: set[int] = set()
+        self._lock = Lock()
+
+    def check(
+        self, slot: int, job: Job, info: JobInfo, elapsed: float
+    ) -> Optional[Job]:
+        """
+        Hedge a job that hasn't finished if it's a straggler.
+
+        Args:
+            slot: The job's slot.
+            job: The job.
+            info: The job's latest `JobInfo`, whose inputs are resubmitted.
+            elapsed: Seconds since the batch started.
+
+        Returns:
+            The resubmitted job, or `None` if the job wasn't hedged.
+        """
+
+        # Workflow jobs don't say which workflow they ran, so they can't be
+        # resubmitted.
+        if job.node_id == "Workflow":
+            return None
+
+        with self._lock:
+            if (
+                slot in self._hedged
+                or slot in self._finished
+                or self.hedges >= self.limit
+                or len(self._peers) < self.policy.min_peers
+                or elapsed <= percentile(sorted(self._peers), self.policy.percentile)
+            ):
+                return None
+
+            # Count the hedge before trying it, so a slot that can't be
+            # hedged isn't tried again and failures can't exceed the limit.
+            self._hedged[slot] = job
+            self.hedges += 1
+
+        try:
+            if self.policy.min_tokens is not None:
+                if self.tokens() < self.policy.min_tokens:
+                    with self._lock:
+                        self.hedges -= 1
+                        self.limit = self.hedges
+                    return None
+
+            hedge = self.queue(job.node_id, info.inputs)
+        except Exception:
+            logger.warning("Failed to hedge job %s", job.job_id, exc_info=True)
+            return None
+
+        # A journal or memo may hand back the job that's already running.
+        if hedge.job_id == job.job_id:
+            return None
+
+        with self._lock:
+            self._running[slot] = {job.job_id: job, hedge.job_id: hedge}
+
+        return hedge
+
+    def drop(self, slot: int, job: Job, info: JobInfo) -> bool:
+        """
+        Drop a copy of a slot's job that finished without completing, if
+        another copy is still running.
+
+        Args:
+            slot: The slot.
+            job: The copy that finished.
+            info: The copy's `JobInfo`.
+
+        Returns:
+            `True` if the copy was dropped and the slot should wait for its
+            other copy, or `False` if the slot finishes with this copy.
+        """
+
+        if JobStatus(info.status.value) == JobStatus.COMPLETED:
+            return False
+
+        with self._lock:
+            running = self._running.get(slot, {})
+            running.pop(job.job_id, None)
+            if not running:
+                return False
+
+        logger.info(
+            "Dropped copy %s of a hedged job, which ended %s",
+            job.job_id,
+            info.status.value,
+        )
+        return True
+
+    def finished(self, slot: int, job: Job, info: JobInfo, elapsed: float) -> None:
+        """
+        Record that a slot finished and cancel any copy that lost.
+
+        Args:
+            slot: The slot.
+            job: The job the slot finished with.
+            info: The job's `JobInfo`.
+            elapsed: Seconds since the batch started.
+        """
+
+        with self._lock:
+            self._finished.add(slot)
+
+            if JobStatus(info.status.value) == JobStatus.COMPLETED:
+                self._peers.append(elapsed)
+
+            running = self._running.pop(slot, {})
+
+        for job_id, copy in running.items():
+            if job_id != job.job_id:
+                self._cancel(copy)
+
+    def close(self) -> None:
+        """
+        Cancel the hedges of slots that didn't finish, for example because
+        the batch timed out.
+        """
+
+        with self._lock:
+            hedges = [
+                copy
+                for slot, running in self._running.items()
+                for job_id, copy in running.items()
+                if slot not in self._finished and job_id != self._hedged[slot].job_id
+            ]
+
+        for hedge in hedges:
+            self._cancel(hedge)
+
+    def _cancel(self, job: Job) -> None:
+        """
+        Cancel a job, logging rather than raising any error.
+
+        Args:
+            job: The job to cancel.
+        """
+
+        try:
+            self.cancel(job)
+        except Exception:
+            logger.warning("Failed to cancel job %s", job.job_id, exc_info=True)
@@ -0,0 +1,11 @@
+from pydantic import BaseModel
+
+
+# TODO: Move this to the uncertainty_engine_types package.
+class Job(BaseModel):
+    """
+    Represents a job in the Uncertainty Engine.
+    """
+
+    node_id: str
+    job_id: str
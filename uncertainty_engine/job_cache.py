@@ -0,0 +1,451 @@
+import sqlite3
+from collections import OrderedDict
+from pathlib import Path
+from threading import Lock
+from time import time
+from typing import Any, Callable, Generic, TypeVar
+
+from pydantic import BaseModel
+from uncertainty_engine_types import JobInfo, JobStatus
+
+from uncertainty_engine.job import Job
+
+DEFAULT_MAX_ENTRIES = 256
+"""
+Default number of results a `JobInfoCache` keeps in memory.
+"""
+
+DEFAULT_MAX_DISK_ENTRIES = 10_000
+"""
+Default number of results a `JobInfoCache` keeps on disk.
+"""
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS {table} (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL,
+    used_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS {table}_used_at ON {table} (used_at);
+"""
+
+M = TypeVar("M", bound=BaseModel)
+
+
+class CacheStats(BaseModel):
+    """
+    Counts of how a cache has been used.
+    """
+
+    hits: int = 0
+    """
+    Lookups answered from memory or disk.
+    """
+
+    disk_hits: int = 0
+    """
+    Lookups answered from disk. Included in `hits`.
+    """
+
+    misses: int = 0
+    """
+    Lookups that weren't in the cache.
+    """
+
+    evictions: int = 0
+    """
+    Results dropped from memory to make room for newer ones.
+    """
+
+    @property
+    def hit_rate(self) -> float:
+        """
+        Fraction of lookups answered from the cache.
+        """
+
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class LruStore(Generic[M]):
+    """
+    A least recently used store of models in memory and, optionally, in an
+    SQLite table on disk.
+
+    Values read from disk are kept in memory too. Reads from memory are
+    written to disk as the value's last use before anything is evicted from
+    disk and when the store is closed, so values that are only ever read
+    from memory aren't evicted as if they were unused, without a write for
+    every read. Not safe to share between threads, so callers must hold
+    their own lock.
+
+    Args:
+        model: The type of the values.
+        table: Name of the table to keep values in on disk.
+        max_entries: Maximum number of values to keep in memory.
+        directory: Optional directory to keep values in on disk. Created if
+            it doesn't exist.
+        max_disk_entries: Maximum number of values to keep on disk.
+        on_remove: Optional callback for values that leave memory, whether
+            evicted or removed, called as `on_remove(key, value)`.
+    """
+
+    def __init__(
+        self,
+        model: type[M],
+        table: str,
+        max_entries: int,
+        directory: str | Path | None = None,
+        max_disk_entries: int = DEFAULT_MAX_DISK_ENTRIES,
+        on_remove: Callable[[str, M], None] | None = None,
+    ) -> None:
+        self.model = model
+        self.table = table
+        self.max_entries = max_entries
+        self.max_disk_entries = max_disk_entries
+        self.on_remove = on_remove
+
+        self.stats = CacheStats()
+        """
+        How the store has been used.
+        """
+
+        self._entries: OrderedDict[str, M] = OrderedDict()
+
+        # Last uses of values read from memory that haven't been written to
+        # disk yet, keyed by key.
+        self._used: dict[str, float] = {}
+
+        self._connection: sqlite3.Connection | None = None
+        if directory is not None:
+            directory = Path(directory).expanduser()
+            directory.mkdir(parents=True, exist_ok=True)
+
+            self._connection = sqlite3.connect(
+                directory / f"{table}.sqlite3",
+                check_same_thread=False,
+            )
+            self._connection.executescript(_SCHEMA.format(table=table))
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def close(self) -> None:
+        """
+        Close the on-disk store, if any.
+        """
+
+        if self._connection is not None:
+            self._flush()
+            self._connection.close()
+            self._connection = None
+
+    def get(self, key: str, valid: Callable[[M], bool] | None = None) -> M | None:
+        """
+        Get a value from memory or disk.
+
+        Args:
+            key: The value's key.
+            valid: Optional check of whether a value may still be used.
+                Values that fail it are removed and counted as misses.
+
+        Returns:
+            The value, or `None` if it isn't stored or isn't valid.
+        """
+
+        value = self._entries.get(key)
+        from_disk = value is None
+        if from_disk:
+            value = self._load(key)
+        else:
+            self._touch(key)
+
+        if value is not None and valid is not None and not valid(value):
+            self.pop(key)
+            value = None
+
+        if value is None:
+            self.stats.misses += 1
+            return None
+
+        self.stats.hits += 1
+        if from_disk:
+            self.stats.disk_hits += 1
+
+        self._remember(key, value)
+        return value
+
+    def peek(self, key: str) -> M | None:
+        """
+        Get a value from memory without counting it as a use.
+
+        Args:
+            key: The value's key.
+
+        Returns:
+            The value, or `None` if it isn't in memory.
+        """
+
+        return self._entries.get(key)
+
+    def put(self, key: str, value: M) -> None:
+        """
+        Store a value in memory and on disk.
+
+        Args:
+            key: The value's key.
+            value: The value.
+        """
+
+        self._remember(key, value)
+        self._store(key, value)
+
+    def pop(self, key: str) -> None:
+        """
+        Remove a value from memory and disk.
+
+        Args:
+            key: The value's key.
+        """
+
+        self._used.pop(key, None)
+
+        value = self._entries.pop(key, None)
+        if value is not None and self.on_remove is not None:
+            self.on_remove(key, value)
+
+        if self._connection is not None:
+            with self._connection:
+                self._connection.execute(
+                    f"DELETE FROM {self.table} WHERE key = ?",
+                    (key,),
+                )
+
+    def clear(self) -> None:
+        """
+        Remove every value from memory and disk and reset the stats.
+        """
+
+        self._entries.clear()
+        self._used.clear()
+        self.stats = CacheStats()
+
+        if self._connection is not None:
+            with self._connection:
+                self._connection.execute(f"DELETE FROM {self.table}")
+
+    def _remember(self, key: str, value: M) -> None:
+        """
+        Keep a value in memory, evicting the least recently used values
+        beyond `max_entries`.
+
+        Args:
+            key: The value's key.
+            value: The value.
+        """
+
+        self._entries[key] = value
+        self._entries.move_to_end(key)
+
+        while len(self._entries) > self.max_entries:
+            evicted_key, evicted = self._entries.popitem(last=False)
+            self.stats.evictions += 1
+
+            if self.on_remove is not None:
+                self.on_remove(evicted_key, evicted)
+
+    def _touch(self, key: str) -> None:
+        """
+        Note that a value held in memory has been used, so it isn't evicted
+        from disk before values that haven't. Written to disk by `_flush`.
+
+        Args:
+            key: The value's key.
+        """
+
+        if self._connection is not None:
+            self._used[key] = time()
+
+    def _flush(self) -> None:
+        """
+        Write the last uses of values read from memory to disk.
+        """
+
+        if self._connection is None or not self._used:
+            return
+
+        with self._connection:
+            self._connection.executemany(
+                f"UPDATE {self.table} SET used_at = ? WHERE key = ?",
+                [(used_at, key) for key, used_at in self._used.items()],
+            )
+
+        self._used.clear()
+
+    def _load(self, key: str) -> M | None:
+        """
+        Read a value from disk.
+
+        Args:
+            key: The value's key.
+
+        Returns:
+            The value, or `None` if it isn't on disk.
+        """
+
+        if self._connection is None:
+            return None
+
+        row = self._connection.execute(
+            f"SELECT value FROM {self.table} WHERE key = ?",
+            (key,),
+        ).fetchone()
+
+        if row is None:
+            return None
+
+        with self._connection:
+            self._connection.execute(
+                f"UPDATE {self.table} SET used_at = ? WHERE key = ?",
+                (time(), key),
+            )
+
+        return self.model.model_validate_json(row[0])
+
+    def _store(self, key: str, value: M) -> None:
+        """
+        Write a value to disk, evicting the least recently used values
+        beyond `max_disk_entries`.
+
+        Args:
+            key: The value's key.
+            value: The value.
+        """
+
+        if self._connection is None:
+            return
+
+        # Eviction below goes by last use, so it must see every use.
+        self._used.pop(key, None)
+        self._flush()
+
+        with self._connection:
+            self._connection.execute(
+                f"INSERT OR REPLACE INTO {self.table} (key, value, used_at)"
+                " VALUES (?, ?, ?)",
+                (key, value.model_dump_json(), time()),
+            )
+            self._connection.execute(
+                f"DELETE FROM {self.table} WHERE key IN ("
+                f" SELECT key FROM {self.table} ORDER BY used_at DESC"
+                " LIMIT -1 OFFSET ?)",
+                (self.max_disk_entries,),
+            )
+
+
+class JobInfoCache:
+    """
+    Keeps the results of finished jobs so they aren't fetched again.
+
+    A job's `JobInfo` never changes once it reaches a terminal status, so
+    it can be reused indefinitely. Results of jobs that are still running
+    are never cached. The least recently used results are evicted once the
+    cache is full. An instance is safe to share between threads.
+
+    Args:
+        max_entries: Maximum number of results to keep in memory.
+        directory: Optional directory to also keep results in on disk, so
+            they outlive the process. Created if it doesn't exist.
+        max_disk_entries: Maximum number of results to keep on disk.
+
+    Example:
+        >>> cache = JobInfoCache(directory="~/.uncertainty-engine/cache")
+        >>> client = Client(job_cache=cache)
+        >>> client.job_status(job)
+        >>> client.job_status(job)  # No request once the job has finished.
+        >>> cache.stats.hit_rate
+        0.5
+    """
+
+    def __init__(
+        self,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        directory: str | Path | None = None,
+        max_disk_entries: int = DEFAULT_MAX_DISK_ENTRIES,
+    ) -> None:
+        self._store = LruStore(
+            JobInfo,
+            "job_info",
+            max_entries,
+            directory,
+            max_disk_entries,
+        )
+        self._lock = Lock()
+
+    def __enter__(self) -> "JobInfoCache":
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._store)
+
+    @property
+    def stats(self) -> CacheStats:
+        """
+        A snapshot of how the cache has been used.
+        """
+
+        with self._lock:
+            return self._store.stats.model_copy()
+
+    def close(self) -> None:
+        """
+        Close the on-disk store, if any.
+        """
+
+        with self._lock:
+            self._store.close()
+
+    def get(self, job: Job) -> JobInfo | None:
+        """
+        Get the cached result of a job.
+
+        Args:
+            job: The job to look up.
+
+        Returns:
+            A copy of the job's `JobInfo`, or `None` if it isn't cached.
+        """
+
+        with self._lock:
+            info = self._store.get(job.job_id)
+            return None if info is None else info.model_copy(deep=True)
+
+    def put(self, job: Job, info: JobInfo) -> None:
+        """
+        Cache the result of a job if it has finished.
+
+        Args:
+            job: The job the result is for.
+            info: The job's latest `JobInfo`. Ignored unless its status is
+                terminal.
+        """
+
+        if not JobStatus(info.status.value).is_terminal():
+            return
+
+        info = info.model_copy(deep=True)
+
+        with self._lock:
+            self._store.put(job.job_id, info)
+
+    def clear(self) -> None:
+        """
+        Remove every result from memory and disk and reset the stats.
+        """
+
+        with self._lock:
+            self._store.clear()
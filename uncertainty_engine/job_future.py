@@ -0,0 +1,48 @@
+from concurrent.futures import Future
+from typing import Callable
+
+from uncertainty_engine_types import JobInfo
+
+from uncertainty_engine.job import Job
+
+
+class JobFuture(Future[JobInfo]):
+    """
+    A `concurrent.futures.Future` that resolves to the `JobInfo` of a job
+    once it reaches a terminal status.
+
+    Job futures work with `concurrent.futures.wait` and
+    `concurrent.futures.as_completed`. They are driven by the client's
+    background poller, so waiting on many of them ties up no extra threads.
+
+    Args:
+        job: The job this future tracks.
+        cancel_job: Callback that cancels the job on the Uncertainty Engine.
+
+    Example:
+        >>> future = client.submit_node(add_node)
+        >>> future.add_done_callback(lambda f: print(f.result().outputs))
+        >>> future.result(timeout=60)
+    """
+
+    def __init__(self, job: Job, cancel_job: Callable[[Job], bool]) -> None:
+        super().__init__()
+        self.job = job
+        self._cancel_job = cancel_job
+
+    def cancel(self) -> bool:
+        """
+        Cancel the job on the Uncertainty Engine.
+
+        Returns:
+            ``True`` if the job was cancelled, or ``False`` if it had already
+            finished or couldn't be cancelled.
+        """
+
+        if self.done():
+            return self.cancelled()
+
+        if not self._cancel_job(self.job):
+            return False
+
+        return super().cancel()
@@ -0,0 +1,227 @@
+import logging
+from random import uniform
+from threading import Lock
+from typing import Any, Callable, Optional
+
+from pydantic import BaseModel, Field
+from uncertainty_engine_types import JobInfo, JobStatus
+
+from uncertainty_engine.job import Job
+
+logger = logging.getLogger(__name__)
+
+TRANSIENT_JOB_ERRORS = (
+    "timed out",
+    "timeout",
+    "connection",
+    "temporarily unavailable",
+    "service unavailable",
+    "throttl",
+    "rate exceeded",
+    "too many requests",
+    "internal error",
+    "insufficient capacity",
+)
+"""
+Phrases in a failed job's message that indicate a transient infrastructure
+error rather than a problem with its inputs. Matched case-insensitively.
+"""
+
+
+class JobRetryPolicy(BaseModel):
+    """
+    Controls how failed jobs are queued again.
+
+    Only jobs that failed with a transient infrastructure error are
+    retried, since a job that failed because of its inputs will fail again.
+    Retries back off exponentially with full jitter.
+
+    Example:
+        >>> policy = JobRetryPolicy(
+        ...     max_attempts=5,
+        ...     is_transient=lambda message: "spot instance" in message,
+        ... )
+        >>> client.run_node(train_node, retry=policy)
+    """
+
+    max_attempts: int = Field(default=3, ge=1)
+    """
+    Maximum number of times to run each job, including the first.
+    """
+
+    backoff_base: float = 5.0
+    """
+    Backoff ceiling in seconds before the first retry. Doubles per retry.
+    """
+
+    backoff_max: float = 300.0
+    """
+    Largest backoff ceiling in seconds between two attempts.
+    """
+
+    transient_errors: tuple[str, ...] = TRANSIENT_JOB_ERRORS
+    """
+    Phrases in a failed job's message that mark the failure as transient.
+    """
+
+    is_transient: Optional[Callable[[str], bool]] = None
+    """
+    Optional predicate on a failed job's message that decides whether the
+    failure is transient. Replaces `transient_errors` when set.
+    """
+
+    def should_retry(self, info: JobInfo, attempt: int) -> bool:
+        """
+        Check whether a finished job should be queued again.
+
+        Args:
+            info: The job's final `JobInfo`.
+            attempt: Number of attempts made so far.
+
+        Returns:
+            `True` if the job failed with a transient error and attempts
+            remain.
+        """
+
+        if JobStatus(info.status.value) != JobStatus.FAILED:
+            return False
+
+        if attempt >= self.max_attempts:
+            return False
+
+        message = info.message or ""
+
+        if self.is_transient is not None:
+            return self.is_transient(message)
+
+        message = message.lower()
+        return any(error in message for error in self.transient_errors)
+
+    def next_delay(self, attempt: int) -> float:
+        """
+        Get the time to wait before queueing a job again.
+
+        Args:
+            attempt: Number of attempts made so far.
+
+        Returns:
+            Seconds to wait.
+        """
+
+        ceiling = min(self.backoff_max, self.backoff_base * 2 ** (attempt - 1))
+        return uniform(0, ceiling)
+
+
+class JobAttempt(BaseModel):
+    """
+    One run of a job.
+    """
+
+    job: Job
+    """
+    The job that ran.
+    """
+
+    info: JobInfo
+    """
+    The job's final `JobInfo`.
+    """
+
+
+class JobOutcome(BaseModel):
+    """
+    The result of a job and every attempt at running it.
+    """
+
+    info: JobInfo
+    """
+    The final `JobInfo` of the last attempt.
+    """
+
+    attempts: list[JobAttempt]
+    """
+    Every attempt, oldest first. Has one item unless the job was retried.
+    """
+
+
+class JobRetrier:
+    """
+    Queues failed jobs of one batch again.
+
+    Each job in the batch occupies a slot, and the attempts made for each
+    slot are recorded.
+
+    Args:
+        policy: When to retry.
+        queue: Callback that queues a node, called as
+            `queue(node_id, inputs)`.
+    """
+
+    def __init__(
+        self,
+        policy: JobRetryPolicy,
+        queue: Callable[[str, dict[str, Any]], Job],
+    ) -> None:
+        self.policy = policy
+        self.queue = queue
+
+        self._attempts: dict[int, list[JobAttempt]] = {}
+        self._lock = Lock()
+
+    def attempts(self, slot: int) -> list[JobAttempt]:
+        """
+        Get the attempts made for a slot.
+
+        Args:
+            slot: The slot.
+
+        Returns:
+            Every finished attempt, oldest first.
+        """
+
+        with self._lock:
+            return list(self._attempts.get(slot, []))
+
+    def check(self, slot: int, job: Job, info: JobInfo) -> Optional[float]:
+        """
+        Record a finished attempt and decide whether to retry it.
+
+        Args:
+            slot: The job's slot.
+            job: The job that finished.
+            info: The job's final `JobInfo`.
+
+        Returns:
+            Seconds to wait before queueing the job again, or `None` if it
+            shouldn't be retried.
+        """
+
+        with self._lock:
+            attempts = self._attempts.setdefault(slot, [])
+            attempts.append(JobAttempt(job=job, info=info))
+            attempt = len(attempts)
+
+        # Workflow jobs don't say which workflow they ran, so they can't be
+        # queued again.
+        if job.node_id == "Workflow" or not self.policy.should_retry(info, attempt):
+            return None
+
+        return self.policy.next_delay(attempt)
+
+    def requeue(self, job: Job, info: JobInfo) -> Optional[Job]:
+        """
+        Queue a failed job again with the same inputs.
+
+        Args:
+            job: The job that failed.
+            info: The job's final `JobInfo`.
+
+        Returns:
+            The new job, or `None` if it couldn't be queued.
+        """
+
+        try:
+            return self.queue(job.node_id, info.inputs)
+        except Exception:
+            logger.warning("Failed to retry job %s", job.job_id, exc_info=True)
+            return None
@@ -0,0 +1,157 @@
+import sqlite3
+from pathlib import Path
+from threading import Lock
+from time import time
+from typing import Any
+
+from uncertainty_engine_types import JobStatus
+
+from uncertainty_engine.job import Job
+
+RETRYABLE_STATUSES = frozenset({JobStatus.CANCELLED, JobStatus.FAILED})
+"""
+Final statuses of jobs whose inputs are submitted again rather than reused.
+"""
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    job_id TEXT PRIMARY KEY,
+    node_id TEXT NOT NULL,
+    inputs_hash TEXT NOT NULL,
+    submitted_at REAL NOT NULL,
+    status TEXT
+);
+CREATE INDEX IF NOT EXISTS jobs_inputs_hash ON jobs (inputs_hash);
+"""
+
+
+class JobJournal:
+    """
+    A durable record of queued jobs, so a batch run can pick up where it
+    left off after the process that started it dies.
+
+    Each queued node is recorded with its job ID, a hash of its inputs, the
+    time it was submitted and, once known, its final status. The journal is
+    a SQLite database, and one instance is safe to share between threads.
+
+    Args:
+        directory: Directory to keep the journal in. Created if it doesn't
+            exist.
+        name: Name of the journal. Use a different name for each batch that
+            should be resumed separately.
+
+    Example:
+        >>> journal = JobJournal("~/.uncertainty-engine/journals", "sweep")
+        >>> client = Client(journal=journal)
+        >>> jobs = [client.queue_node(node) for node in nodes]
+        >>> # After a crash, in a new process:
+        >>> futures = client.resume(journal)
+        >>> results = [future.result() for future in futures]
+    """
+
+    def __init__(self, directory: str | Path, name: str = "jobs") -> None:
+        directory = Path(directory).expanduser()
+        directory.mkdir(parents=True, exist_ok=True)
+
+        self.path = directory / f"{name}.sqlite3"
+        """
+        Path of the journal's database file.
+        """
+
+        self._lock = Lock()
+        self._connection = sqlite3.connect(self.path, check_same_thread=False)
+        self._connection.executescript(_SCHEMA)
+
+    def __enter__(self) -> "JobJournal":
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """
+        Close the journal's database.
+        """
+
+        with self._lock:
+            self._connection.close()
+
+    def record(self, job: Job, inputs_hash: str) -> None:
+        """
+        Record a queued job.
+
+        Args:
+            job: The queued job.
+            inputs_hash: Hash of the job's node and inputs from
+                `hash_node_inputs`.
+        """
+
+        with self._lock, self._connection:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO jobs"
+                " (job_id, node_id, inputs_hash, submitted_at)"
+                " VALUES (?, ?, ?, ?)",
+                (job.job_id, job.node_id, inputs_hash, time()),
+            )
+
+    def find(self, inputs_hash: str) -> Job | None:
+        """
+        Find the latest job queued with the given inputs.
+
+        Jobs that failed or were cancelled are ignored so that their inputs
+        are submitted again.
+
+        Args:
+            inputs_hash: Hash of a node and its inputs from
+                `hash_node_inputs`.
+
+        Returns:
+            The job, or `None` if these inputs should be queued.
+        """
+
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT node_id, job_id, status FROM jobs WHERE inputs_hash = ?"
+                " ORDER BY submitted_at DESC LIMIT 1",
+                (inputs_hash,),
+            ).fetchone()
+
+        if row is None:
+            return None
+
+        node_id, job_id, status = row
+        if status is not None and JobStatus(status) in RETRYABLE_STATUSES:
+            return None
+
+        return Job(node_id=node_id, job_id=job_id)
+
+    def mark_finished(self, job: Job, status: JobStatus) -> None:
+        """
+        Record the final status of a job.
+
+        Args:
+            job: The job that finished.
+            status: The job's terminal status.
+        """
+
+        with self._lock, self._connection:
+            self._connection.execute(
+                "UPDATE jobs SET status = ? WHERE job_id = ?",
+                (status.value, job.job_id),
+            )
+
+    def unfinished(self) -> list[Job]:
+        """
+        Get every recorded job that hasn't been seen to finish.
+
+        Returns:
+            The jobs, in the order they were submitted.
+        """
+
+        with self._lock:
+            rows = self._connection.execute(
+                "SELECT node_id, job_id FROM jobs WHERE status IS NULL"
+                " ORDER BY submitted_at",
+            ).fetchall()
+
+        return [Job(node_id=node_id, job_id=job_id) for node_id, job_id in rows]
@@ -0,0 +1,283 @@
+from collections import OrderedDict
+from pathlib import Path
+from threading import Lock
+from time import time
+from typing import Any, Collection
+
+from pydantic import BaseModel
+from uncertainty_engine_types import JobInfo, JobStatus
+
+from uncertainty_engine.durations import node_key
+from uncertainty_engine.job import Job
+from uncertainty_engine.job_cache import CacheStats, LruStore
+from uncertainty_engine.utils import hash_node_inputs
+
+DEFAULT_MAX_ENTRIES = 1024
+"""
+Default number of results a `NodeMemo` keeps.
+"""
+
+DEFAULT_MAX_QUEUED = 10_000
+"""
+Default number of unfinished jobs a `NodeMemo` tracks.
+"""
+
+
+class _MemoEntry(BaseModel):
+    """
+    A completed node execution.
+    """
+
+    job: Job
+    info: JobInfo
+    created_at: float
+
+
+class NodeMemo:
+    """
+    Reuses the results of node executions that have already completed with
+    the same inputs.
+
+    A node is identified by a hash of its ID, version and canonicalised
+    inputs, so nodes whose inputs differ only in key order share a result.
+    Only nodes in `nodes` are memoised, since reusing a result is only safe
+    for nodes that always give the same outputs for the same inputs. Only
+    completed jobs are remembered. An instance is safe to share between
+    threads.
+
+    Args:
+        nodes: IDs of the deterministic nodes to memoise.
+        ttl: Seconds a result may be reused for. Defaults to ``None``, which
+            reuses results until they're evicted.
+        max_entries: Maximum number of results to keep. The least recently
+            used results are evicted first.
+        directory: Optional directory to keep results in, so they're reused
+            across processes. Created if it doesn't exist.
+        max_queued: Maximum number of unfinished jobs to track. The oldest
+            are forgotten beyond this, for example jobs whose status is
+            never checked.
+
+    Example:
+        >>> memo = NodeMemo(nodes={"Add", "Multiply"}, ttl=86400)
+        >>> client = Client(memo=memo)
+        >>> client.run_node(add_node)
+        >>> client.run_node(add_node)  # Not queued again.
+    """
+
+    def __init__(
+        self,
+        nodes: Collection[str],
+        ttl: float | None = None,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        directory: str | Path | None = None,
+        max_queued: int = DEFAULT_MAX_QUEUED,
+    ) -> None:
+        self.nodes = frozenset(nodes)
+        self.ttl = ttl
+        self.max_queued = max_queued
+
+        self._store = LruStore(
+            _MemoEntry,
+            "memo",
+            max_entries,
+            directory,
+            max_entries,
+            on_remove=self._removed,
+        )
+        self._lock = Lock()
+
+        # Hashes of the results held in memory, keyed by job ID.
+        self._hashes: dict[str, str] = {}
+
+        # Hashes of memoisable jobs that have been queued but haven't
+        # completed yet, keyed by job ID. Oldest first.
+        self._queued: OrderedDict[str, str] = OrderedDict()
+
+    def __enter__(self) -> "NodeMemo":
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._store)
+
+    @property
+    def stats(self) -> CacheStats:
+        """
+        A snapshot of how the memo has been used.
+        """
+
+        with self._lock:
+            return self._store.stats.model_copy()
+
+    def close(self) -> None:
+        """
+        Close the on-disk store, if any.
+        """
+
+        with self._lock:
+            self._store.close()
+
+    def lookup(
+        self,
+        node_id: str,
+        inputs: dict[str, Any],
+        version: str | int | None = None,
+    ) -> tuple[Job, JobInfo] | None:
+        """
+        Find a completed execution of a node with the same inputs.
+
+        Args:
+            node_id: The ID of the node.
+            inputs: The node's inputs.
+            version: The version of the node, if known.
+
+        Returns:
+            The job that ran the node and a copy of its `JobInfo`, or `None`
+            if there is no result to reuse.
+        """
+
+        if node_id not in self.nodes:
+            return None
+
+        inputs_hash = self._hash(node_id, inputs, version)
+
+        with self._lock:
+            entry = self._store.get(inputs_hash, valid=self._fresh)
+            if entry is None:
+                return None
+
+            self._hashes[entry.job.job_id] = inputs_hash
+            return entry.job, entry.info.model_copy(deep=True)
+
+    def result(self, job: Job) -> JobInfo | None:
+        """
+        Get the remembered result of a job returned by `lookup`.
+
+        Args:
+            job: The job.
+
+        Returns:
+            A copy of the job's `JobInfo`, or `None` if it isn't remembered.
+        """
+
+        with self._lock:
+            inputs_hash = self._hashes.get(job.job_id)
+            entry = None if inputs_hash is None else self._store.peek(inputs_hash)
+
+            if entry is None or entry.job.job_id != job.job_id:
+                return None
+
+            return entry.info.model_copy(deep=True)
+
+    def queued(
+        self,
+        job: Job,
+        inputs: dict[str, Any],
+        version: str | int | None = None,
+    ) -> None:
+        """
+        Note that a node has been queued, so its result can be remembered
+        when it completes.
+
+        Args:
+            job: The queued job.
+            inputs: The node's inputs.
+            version: The version of the node, if known.
+        """
+
+        if job.node_id not in self.nodes:
+            return
+
+        inputs_hash = self._hash(job.node_id, inputs, version)
+
+        with self._lock:
+            self._queued[job.job_id] = inputs_hash
+            self._queued.move_to_end(job.job_id)
+
+            while len(self._queued) > self.max_queued:
+                self._queued.popitem(last=False)
+
+    def finished(self, job: Job, info: JobInfo) -> None:
+        """
+        Remember the result of a job that finished.
+
+        Args:
+            job: The job.
+            info: The job's `JobInfo`. Ignored unless the job completed.
+        """
+
+        status = JobStatus(info.status.value)
+        if not status.is_terminal():
+            return
+
+        with self._lock:
+            inputs_hash = self._queued.pop(job.job_id, None)
+            if inputs_hash is None or status != JobStatus.COMPLETED:
+                return
+
+            # Another job may have completed with the same inputs.
+            replaced = self._store.peek(inputs_hash)
+            if replaced is not None:
+                self._hashes.pop(replaced.job.job_id, None)
+
+            entry = _MemoEntry(
+                job=job,
+                info=info.model_copy(deep=True),
+                created_at=time(),
+            )
+            self._store.put(inputs_hash, entry)
+            self._hashes[job.job_id] = inputs_hash
+
+    def clear(self) -> None:
+        """
+        Remove every result from memory and disk and reset the stats.
+        """
+
+        with self._lock:
+            self._store.clear()
+            self._hashes.clear()
+
+    @staticmethod
+    def _hash(node_id: str, inputs: dict[str, Any], version: str | int | None) -> str:
+        """
+        Get the hash that identifies a node and its inputs.
+
+        Args:
+            node_id: The ID of the node.
+            inputs: The node's inputs.
+            version: The version of the node, if known.
+
+        Returns:
+            A hex digest of the node's ID, version and inputs.
+        """
+
+        # Versions of a node may give different outputs for the same inputs.
+        return hash_node_inputs(node_key(node_id, version), inputs)
+
+    def _fresh(self, entry: _MemoEntry) -> bool:
+        """
+        Check whether a result is recent enough to reuse.
+
+        Args:
+            entry: The result.
+
+        Returns:
+            Whether the result is no older than `ttl`.
+        """
+
+        return self.ttl is None or time() - entry.created_at <= self.ttl
+
+    def _removed(self, inputs_hash: str, entry: _MemoEntry) -> None:
+        """
+        Forget the job of a result that has left memory. Called by the store
+        with the lock held.
+
+        Args:
+            inputs_hash: Hash of the node and its inputs.
+            entry: The result.
+        """
+
+        self._hashes.pop(entry.job.job_id, None)
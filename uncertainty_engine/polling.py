@@ -0,0 +1,147 @@
+from abc import ABC, abstractmethod
+from itertools import repeat
+from random import uniform
+from typing import Iterator, Optional
+
+from uncertainty_engine.durations import DurationHistory
+from uncertainty_engine.job import Job
+
+STATUS_WAIT_TIME = 5
+"""
+Interval in seconds between status checks with `FixedPoll`.
+"""
+
+
+class PollStrategy(ABC):
+    """
+    Decides how long to wait between status checks while waiting for a job.
+
+    A strategy may be shared between threads and jobs, so any per-job state
+    belongs in the iterator returned by `delays`.
+    """
+
+    @abstractmethod
+    def delays(self) -> Iterator[float]:
+        """
+        Get the waits for one job.
+
+        Returns:
+            An endless iterator of seconds to wait before each status check
+            after the first.
+        """
+
+    def delays_for(self, job: Job) -> Iterator[float]:
+        """
+        Get the waits for a particular job. Strategies that adapt to the job
+        override this. By default, every job waits the same way.
+
+        Args:
+            job: The job being waited for.
+
+        Returns:
+            An endless iterator of seconds to wait before each status check
+            after the first.
+        """
+
+        return self.delays()
+
+
+class FixedPoll(PollStrategy):
+    """
+    Waits the same time between every status check.
+
+    Args:
+        interval: Seconds between status checks.
+
+    Example:
+        >>> client.run_node(train_node, poll=FixedPoll(60))
+    """
+
+    def __init__(self, interval: float = STATUS_WAIT_TIME) -> None:
+        self.interval = interval
+
+    def delays(self) -> Iterator[float]:
+        return repeat(self.interval)
+
+
+class ExponentialBackoffPoll(PollStrategy):
+    """
+    Checks quickly at first so short jobs return promptly, then backs off
+    exponentially up to a cap so long jobs are checked rarely.
+
+    Each wait is jittered so that jobs submitted together don't poll in
+    lockstep.
+
+    Args:
+        initial: Seconds before the second status check.
+        factor: Multiplier applied to the wait after each status check.
+        max_interval: Longest wait in seconds between two status checks.
+        jitter: Fraction by which each wait is randomly lengthened or
+            shortened. `0` disables jitter.
+
+    Example:
+        >>> client.run_node(add_node, poll=ExponentialBackoffPoll(initial=0.1))
+    """
+
+    def __init__(
+        self,
+        initial: float = 0.25,
+        factor: float = 1.5,
+        max_interval: float = 30.0,
+        jitter: float = 0.1,
+    ) -> None:
+        self.initial = initial
+        self.factor = factor
+        self.max_interval = max_interval
+        self.jitter = jitter
+
+    def delays(self) -> Iterator[float]:
+        delay = min(self.max_interval, self.initial)
+
+        while True:
+            yield uniform(delay * (1 - self.jitter), delay * (1 + self.jitter))
+            delay = min(self.max_interval, delay * self.factor)
+
+
+class PredictivePoll(PollStrategy):
+    """
+    Waits until a job is expected to complete before checking it again,
+    based on how long the same node has taken before.
+
+    Once the expected completion time passes, or for jobs with no history,
+    waits as `fallback` does. This avoids polling long jobs that won't be
+    done for minutes while still checking short jobs promptly.
+
+    Args:
+        history: The durations to predict completion from. Must be the
+            client's `durations` so that queued jobs are tracked.
+        fallback: Strategy for waiting once a job is due, or when there's no
+            prediction. Defaults to `ExponentialBackoffPoll()`.
+        q: The percentile of past durations to expect a job to complete by.
+            Defaults to the median.
+
+    Example:
+        >>> history = DurationHistory()
+        >>> client = Client(durations=history, poll_strategy=PredictivePoll(history))
+        >>> client.run_node(train_node)
+    """
+
+    def __init__(
+        self,
+        history: DurationHistory,
+        fallback: Optional[PollStrategy] = None,
+        q: float = 50,
+    ) -> None:
+        self.history = history
+        self.fallback = fallback or ExponentialBackoffPoll()
+        self.q = q
+
+    def delays(self) -> Iterator[float]:
+        return self.fallback.delays()
+
+    def delays_for(self, job: Job) -> Iterator[float]:
+        remaining = self.history.remaining(job, self.q)
+        if remaining:
+            yield remaining
+
+        yield from self.fallback.delays_for(job)
@@ -0,0 +1,163 @@
+from enum import Enum
+from threading import Lock
+from time import monotonic, sleep
+
+from pydantic import BaseModel, Field
+
+from uncertainty_engine.exceptions import DeadlineExceeded
+from uncertainty_engine.timeouts import Deadline
+
+
+class EndpointClass(str, Enum):
+    """
+    Group of endpoints that share a rate limit.
+    """
+
+    QUEUE = "queue"
+    """
+    Core API requests that submit jobs.
+    """
+
+    STATUS = "status"
+    """
+    Every other Core API request, such as job status checks.
+    """
+
+    RESOURCE = "resource"
+    """
+    Resource Service requests.
+    """
+
+    @classmethod
+    def for_core_api(cls, method: str, path: str) -> "EndpointClass":
+        """
+        Get the class of a Core API request.
+
+        Args:
+            method: HTTP method.
+            path: API path.
+
+        Returns:
+            `QUEUE` for node and workflow submissions, otherwise `STATUS`.
+        """
+
+        if method == "POST" and (path == "/nodes/queue" or path.endswith("/run")):
+            return cls.QUEUE
+
+        return cls.STATUS
+
+
+class RateLimit(BaseModel):
+    """
+    A steady request rate with an allowance for short bursts.
+    """
+
+    rate: float = Field(gt=0)
+    """
+    Requests per second allowed on average.
+    """
+
+    burst: int = Field(default=10, ge=1)
+    """
+    Number of requests that can be made at once after a quiet period.
+    """
+
+
+class RateLimitPolicy(BaseModel):
+    """
+    Rate limits for each class of endpoint. Endpoint classes without a limit
+    are not limited.
+
+    Example:
+        >>> client = Client(
+        ...     rate_limit_policy=RateLimitPolicy(
+        ...         queue=RateLimit(rate=5, burst=20),
+        ...         status=RateLimit(rate=50),
+        ...     ),
+        ... )
+    """
+
+    queue: RateLimit | None = None
+    """
+    Limit for node and workflow submissions.
+    """
+
+    status: RateLimit | None = None
+    """
+    Limit for every other Core API request.
+    """
+
+    resource: RateLimit | None = None
+    """
+    Limit for Resource Service requests.
+    """
+
+    def create_limiters(self) -> dict[EndpointClass, "RateLimiter"]:
+        """
+        Create a rate limiter for each limited class of endpoint.
+
+        Returns:
+            A rate limiter for each endpoint class that has a limit.
+        """
+
+        return {
+            endpoint_class: RateLimiter(limit)
+            for endpoint_class in EndpointClass
+            if (limit := getattr(self, endpoint_class.value)) is not None
+        }
+
+
+class RateLimiter:
+    """
+    A token bucket that spaces requests out to a steady rate.
+
+    Each request takes one token. Tokens are added at `rate` per second up
+    to `burst`. A request that finds the bucket empty reserves the next
+    token and blocks until it is due, so waiting callers are served in
+    order. An instance is safe to share between threads.
+
+    Args:
+        limit: The rate and burst to allow.
+    """
+
+    def __init__(self, limit: RateLimit) -> None:
+        self.limit = limit
+        self._tokens = float(limit.burst)
+        self._updated = monotonic()
+        self._lock = Lock()
+
+    def acquire(self, deadline: Deadline | None = None) -> None:
+        """
+        Take a token, blocking until one is available.
+
+        Args:
+            deadline: Optional deadline for the request the token is for.
+
+        Raises:
+            DeadlineExceeded: Raised without waiting if a token won't be
+                available before the deadline, or if the deadline has passed
+                by the time it is.
+        """
+
+        with self._lock:
+            now = monotonic()
+            self._tokens = min(
+                float(self.limit.burst),
+                self._tokens + (now - self._updated) * self.limit.rate,
+            )
+            self._updated = now
+
+            wait = max(0.0, (1 - self._tokens) / self.limit.rate)
+
+            # A wait that uses up the deadline leaves no time for the
+            # request, so it's refused too.
+            if deadline is not None and wait >= deadline.remaining():
+                raise DeadlineExceeded("waiting for the rate limit")
+
+            self._tokens -= 1
+
+        if wait > 0:
+            sleep(wait)
+
+            if deadline is not None:
+                deadline.check("waiting for the rate limit")
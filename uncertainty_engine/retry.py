@@ -0,0 +1,137 @@
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from random import uniform
+from time import monotonic
+from typing import Any
+
+from pydantic import BaseModel
+
+AUTH_STATUS_CODES = frozenset({401, 403})
+"""
+HTTP status codes that indicate the authorisation token should be refreshed.
+"""
+
+TRANSIENT_STATUS_CODES = frozenset({408, 429, 500, 502, 503, 504})
+"""
+HTTP status codes that indicate a transient failure worth retrying.
+"""
+
+REJECTED_STATUS_CODES = frozenset({429})
+"""
+Transient HTTP status codes that mean the server refused a request without
+handling it, so even requests that queue jobs can be retried.
+"""
+
+
+class RetryPolicy(BaseModel):
+    """
+    Controls how transient API failures are retried.
+
+    Retries back off exponentially with full jitter, honour any
+    `Retry-After` header sent by the server, and stop once either the
+    attempt or the elapsed time budget is spent.
+
+    Example:
+        >>> client = Client(retry_policy=RetryPolicy(max_attempts=8))
+    """
+
+    max_attempts: int = 5
+    """
+    Maximum number of attempts per request, including the first.
+    """
+
+    backoff_base: float = 0.5
+    """
+    Backoff ceiling in seconds before the first retry. Doubles per retry.
+    """
+
+    backoff_max: float = 30.0
+    """
+    Largest backoff ceiling in seconds between two attempts.
+    """
+
+    max_elapsed: float = 120.0
+    """
+    Total time budget in seconds for a request and all of its retries.
+    """
+
+    retry_statuses: frozenset[int] = TRANSIENT_STATUS_CODES
+    """
+    HTTP status codes that are retried.
+    """
+
+    def is_retryable_status(self, status_code: int) -> bool:
+        """
+        Check whether a response status should be retried.
+
+        Args:
+            status_code: HTTP status code.
+
+        Returns:
+            `True` if the status indicates a transient failure.
+        """
+
+        return status_code in self.retry_statuses
+
+    def next_delay(
+        self,
+        attempt: int,
+        started: float,
+        retry_after: float | None = None,
+    ) -> float | None:
+        """
+        Get the time to wait before the next attempt.
+
+        Args:
+            attempt: Number of attempts made so far.
+            started: `time.monotonic()` reading taken before the first
+                attempt.
+            retry_after: Delay in seconds requested by the server, if any.
+
+        Returns:
+            Seconds to wait, or `None` if the request should not be retried.
+        """
+
+        if attempt >= self.max_attempts:
+            return None
+
+        if retry_after is not None:
+            delay = retry_after
+        else:
+            ceiling = min(self.backoff_max, self.backoff_base * 2 ** (attempt - 1))
+            delay = uniform(0, ceiling)
+
+        if monotonic() - started + delay > self.max_elapsed:
+            return None
+
+        return delay
+
+    @staticmethod
+    def parse_retry_after(value: Any) -> float | None:
+        """
+        Parse a `Retry-After` header value.
+
+        Args:
+            value: Header value. Either a number of seconds or an HTTP date.
+
+        Returns:
+            Seconds to wait, or `None` if the value is missing or invalid.
+        """
+
+        if not isinstance(value, str):
+            return None
+
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            pass
+
+        try:
+            retry_at = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+
+        if retry_at.tzinfo is None:
+            retry_at = retry_at.replace(tzinfo=timezone.utc)
+
+        return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
@@ -0,0 +1,569 @@
+import logging
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Future,
+    InvalidStateError,
+    ThreadPoolExecutor,
+    wait,
+)
+from heapq import heapify, heappop, heappush
+from itertools import count
+from threading import Condition, Thread
+from time import monotonic, sleep
+from typing import Callable, Iterator, Optional, Sequence
+
+from uncertainty_engine_types import JobInfo, JobStatus
+
+from uncertainty_engine.exceptions import DeadlineExceeded
+from uncertainty_engine.hedging import Hedger
+from uncertainty_engine.job import Job
+from uncertainty_engine.job_future import JobFuture
+from uncertainty_engine.job_retry import JobRetrier
+from uncertainty_engine.polling import PollStrategy
+from uncertainty_engine.timeouts import Deadline
+
+DEFAULT_POLL_CONCURRENCY = 10
+"""
+Default maximum number of status checks a `JobScheduler` makes at once.
+"""
+
+DEFAULT_SUBMIT_CONCURRENCY = 10
+"""
+Default maximum number of jobs queued at once by a bulk submission.
+"""
+
+DEFAULT_MAX_STATUS_ERRORS = 5
+"""
+Default number of status checks of a job that may fail in a row before
+`JobScheduler` reports the job as failed.
+"""
+
+logger = logging.getLogger(__name__)
+
+
+class JobScheduler:
+    """
+    Waits on many jobs at once with a single polling loop.
+
+    Every job is checked on its own schedule from a `PollStrategy`, so slow
+    jobs back off while quick ones are still checked often. Status checks
+    run on up to `max_concurrency` worker threads. A failed status check is
+    tried again on the job's schedule, since the job itself may be fine.
+
+    Args:
+        job_status: Callback that gets the status of a job. Called as
+            `job_status(job, deadline=deadline)`.
+        poll: Strategy for waiting between status checks of each job.
+        max_concurrency: Maximum number of status checks to make at once.
+        max_status_errors: Number of status checks of a job that may fail
+            in a row before the job is reported as failed.
+    """
+
+    def __init__(
+        self,
+        job_status: Callable[..., JobInfo],
+        poll: PollStrategy,
+        max_concurrency: int = DEFAULT_POLL_CONCURRENCY,
+        max_status_errors: int = DEFAULT_MAX_STATUS_ERRORS,
+    ) -> None:
+        self.job_status = job_status
+        self.poll = poll
+        self.max_concurrency = max_concurrency
+        self.max_status_errors = max_status_errors
+
+    def as_completed(
+        self,
+        jobs: Sequence[Job],
+        deadline: Optional[Deadline] = None,
+        hedger: Optional[Hedger] = None,
+        retrier: Optional[JobRetrier] = None,
+    ) -> Iterator[tuple[int, JobInfo]]:
+        """
+        Yield jobs as they reach a terminal status.
+
+        Args:
+            jobs: The jobs to wait for.
+            deadline: Optional deadline for every job to finish.
+            hedger: Optional hedger to resubmit stragglers with. A hedged job
+                finishes with whichever of its copies completes first, or
+                with the last of them to fail.
+            retrier: Optional retrier to queue failed jobs again with. A
+                retried job finishes with its last attempt.
+
+        Returns:
+            An iterator of `(index, info)` pairs, where `index` is the
+            position of the job in `jobs`, in the order that jobs finish. A
+            job whose status couldn't be checked `max_status_errors` times in
+            a row is reported as failed, with the last error as its message,
+            and isn't retried.
+
+        Raises:
+            DeadlineExceeded: Raised if any job is still running at the
+                deadline.
+        """
+
+        start = monotonic()
+
+        # Every job being polled, as `(index, job)`. Hedges and retries are
+        # appended with the index of the job they stand in for. A retry's job
+        # is `None` until it's queued.
+        attempts: list[tuple[int, Optional[Job]]] = list(enumerate(jobs))
+        finished: set[int] = set()
+
+        # Failed jobs waiting to be queued again, keyed by their retry's
+        # attempt.
+        retries: dict[int, tuple[Job, JobInfo]] = {}
+
+        # Attempts waiting for their next status check, as `(due, attempt)`.
+        due = [(start, attempt) for attempt in range(len(attempts))]
+        heapify(due)
+
+        delays: dict[int, Iterator[float]] = {}
+
+        # Status checks that have failed in a row, keyed by attempt.
+        status_errors: dict[int, int] = {}
+
+        in_flight: dict[Future[JobInfo], tuple[int, Job]] = {}
+
+        executor = ThreadPoolExecutor(
+            max_workers=max(1, min(self.max_concurrency, len(jobs))),
+            thread_name_prefix="uncertainty-engine-poll",
+        )
+
+        try:
+            while due or in_flight:
+                if deadline is not None:
+                    deadline.check(f"{len(jobs) - len(finished)} jobs")
+
+                now = monotonic()
+
+                while (
+                    due and due[0][0] <= now and len(in_flight) < self.max_concurrency
+                ):
+                    _, attempt = heappop(due)
+                    index, job = attempts[attempt]
+                    if index in finished:
+                        continue
+
+                    if job is None:
+                        failed, info = retries.pop(attempt)
+                        if retrier is not None:
+                            job = retrier.requeue(failed, info)
+
+                        if job is None:
+                            finished.add(index)
+                            if hedger is not None:
+                                hedger.finished(
+                                    index, failed, info, monotonic() - start
+                                )
+
+                            yield index, info
+                            continue
+
+                        attempts[attempt] = (index, job)
+
+                    future = executor.submit(self.job_status, job, deadline=deadline)
+                    in_flight[future] = (attempt, job)
+
+                # Wake when a check finishes, the next job is due, or the
+                # deadline passes, whichever comes first.
+                timeout = None
+                if due and len(in_flight) < self.max_concurrency:
+                    timeout = max(0.0, due[0][0] - now)
+                if deadline is not None:
+                    remaining = deadline.remaining()
+                    timeout = remaining if timeout is None else min(timeout, remaining)
+
+                if not in_flight:
+                    sleep(timeout or 0.0)
+                    continue
+
+                done, _ = wait(in_flight, timeout=timeout, return_when=FIRST_COMPLETED)
+
+                for future in done:
+                    attempt, job = in_flight.pop(future)
+                    index = attempts[attempt][0]
+
+                    # One job's status error mustn't stop the rest of the
+                    # batch, so it fails that job alone.
+                    status_error = future.exception()
+                    if isinstance(status_error, DeadlineExceeded):
+                        raise status_error
+
+                    if index in finished:
+                        continue
+
+                    if status_error is not None:
+                        logger.warning(
+                            "Failed to get the status of %s",
+                            job,
+                            exc_info=status_error,
+                        )
+
+                        # The job may well still be running, so it's checked
+                        # again unless its checks keep failing.
+                        errors = status_errors.get(attempt, 0) + 1
+                        status_errors[attempt] = errors
+                        if errors < self.max_status_errors:
+                            if attempt not in delays:
+                                delays[attempt] = self.poll.delays_for(job)
+
+                            heappush(
+                                due, (monotonic() + next(delays[attempt]), attempt)
+                            )
+                            continue
+
+                        info = JobInfo(
+                            status=JobStatus.FAILED,
+                            message=f"Failed to get the job's status: {status_error}",
+                            inputs={},
+                        )
+                    else:
+                        status_errors.pop(attempt, None)
+                        info = future.result()
+
+                    if JobStatus(info.status.value).is_terminal():
+                        # A hedged copy that didn't complete is dropped while
+                        # another copy may still complete.
+                        if hedger is not None and hedger.drop(index, job, info):
+                            continue
+
+                        # The job may still be running after a status error,
+                        # so queueing it again could run it twice.
+                        if retrier is not None and status_error is None:
+                            delay = retrier.check(index, job, info)
+                            if delay is not None:
+                                attempts.append((index, None))
+                                retries[len(attempts) - 1] = (job, info)
+                                heappush(due, (monotonic() + delay, len(attempts) - 1))
+                                continue
+
+                        finished.add(index)
+                        if hedger is not None:
+                            hedger.finished(index, job, info, monotonic() - start)
+
+                        yield index, info
+                        continue
+
+                    if hedger is not None:
+                        hedge = hedger.check(index, job, info, monotonic() - start)
+                        if hedge is not None:
+                            attempts.append((index, hedge))
+                            heappush(due, (monotonic(), len(attempts) - 1))
+
+                    if attempt not in delays:
+                        delays[attempt] = self.poll.delays_for(job)
+
+                    heappush(due, (monotonic() + next(delays[attempt]), attempt))
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+            if hedger is not None:
+                hedger.close()
+
+
+class _WatchedJob:
+    """
+    A job being polled by a `JobPoller`.
+    """
+
+    def __init__(
+        self,
+        job: Job,
+        future: Future[JobInfo],
+        poll: PollStrategy,
+        deadline: Optional[Deadline],
+        retrier: Optional[JobRetrier],
+    ) -> None:
+        self.job = job
+        self.future = future
+        self.poll = poll
+        self.delays = poll.delays_for(job)
+        self.deadline = deadline
+        self.retrier = retrier
+
+        # The final `JobInfo` of a failed attempt waiting to be queued again.
+        self.failed: Optional[JobInfo] = None
+
+
+class JobPoller:
+    """
+    Resolves job futures from a single background thread.
+
+    The thread sleeps until the next job is due for a status check and
+    hands due checks to a pool of up to `max_concurrency` workers, so any
+    number of jobs can be tracked without a thread per job. It is started
+    by the first call to `watch`.
+
+    Args:
+        job_status: Callback that gets the status of a job. Called as
+            `job_status(job, deadline=deadline)`.
+        max_concurrency: Maximum number of status checks to make at once.
+    """
+
+    def __init__(
+        self,
+        job_status: Callable[..., JobInfo],
+        max_concurrency: int = DEFAULT_POLL_CONCURRENCY,
+    ) -> None:
+        self.job_status = job_status
+
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_concurrency,
+            thread_name_prefix="uncertainty-engine-poll",
+        )
+
+        # Jobs waiting for their next status check, as `(due, seq, watched)`.
+        # `seq` keeps the ordering stable for jobs due at the same time.
+        self._due: list[tuple[float, int, _WatchedJob]] = []
+        self._seq = count()
+
+        # Jobs handed to the workers whose check hasn't finished.
+        self._checking: set[_WatchedJob] = set()
+
+        self._condition = Condition()
+        self._closed = False
+        self._thread: Optional[Thread] = None
+
+    def watch(
+        self,
+        job: Job,
+        future: Future[JobInfo],
+        poll: PollStrategy,
+        deadline: Optional[Deadline] = None,
+        retrier: Optional[JobRetrier] = None,
+    ) -> None:
+        """
+        Poll a job until it finishes, then resolve its future.
+
+        The future receives the job's `JobInfo`, or the error that stopped
+        it being polled.
+
+        Args:
+            job: The job to poll.
+            future: The future to resolve.
+            poll: Strategy for waiting between status checks.
+            deadline: Optional deadline for the job to finish. The future
+                fails with `DeadlineExceeded` if it passes.
+            retrier: Optional retrier to queue the job again with if it
+                fails. The future receives the last attempt's `JobInfo`, and
+                a `JobFuture`'s `job` is updated to each new attempt.
+        """
+
+        with self._condition:
+            if self._closed:
+                raise RuntimeError("The job poller has been closed.")
+
+            if self._thread is None:
+                self._thread = Thread(
+                    target=self._run,
+                    name="uncertainty-engine-poller",
+                    daemon=True,
+                )
+                self._thread.start()
+
+        self._schedule(_WatchedJob(job, future, poll, deadline, retrier), 0.0)
+
+    def close(self) -> None:
+        """
+        Stop polling. Futures that haven't resolved fail with
+        `RuntimeError`.
+        """
+
+        with self._condition:
+            self._closed = True
+            pending = [watched for _, _, watched in self._due]
+            pending.extend(self._checking)
+            self._due.clear()
+            self._checking.clear()
+            self._condition.notify_all()
+
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+        # A check that's still running can't schedule another once the
+        # poller is closed, so its future is failed here too.
+        for watched in pending:
+            self._fail_closed(watched)
+
+    def _schedule(self, watched: _WatchedJob, delay: float) -> None:
+        """
+        Schedule the next status check of a job.
+
+        Args:
+            watched: The job to check.
+            delay: Seconds to wait before the check.
+        """
+
+        with self._condition:
+            self._checking.discard(watched)
+
+            closed = self._closed
+            if not closed:
+                heappush(self._due, (monotonic() + delay, next(self._seq), watched))
+                self._condition.notify()
+
+        if closed:
+            self._fail_closed(watched)
+
+    def _run(self) -> None:
+        """
+        Hand status checks to the workers as they fall due.
+        """
+
+        while True:
+            with self._condition:
+                while not self._closed:
+                    now = monotonic()
+                    if self._due and self._due[0][0] <= now:
+                        break
+
+                    timeout = self._due[0][0] - now if self._due else None
+                    self._condition.wait(timeout)
+
+                if self._closed:
+                    return
+
+                ready = []
+                while self._due and self._due[0][0] <= now:
+                    watched = heappop(self._due)[2]
+                    if not watched.future.done():
+                        ready.append(watched)
+                        self._checking.add(watched)
+
+            for watched in ready:
+                try:
+                    self._executor.submit(self._check, watched)
+                except RuntimeError:
+                    # The executor was shut down by `close` in the meantime.
+                    self._fail_closed(watched)
+
+    def _check(self, watched: _WatchedJob) -> None:
+        """
+        Check the status of a job and either resolve its future or schedule
+        the next check.
+
+        Args:
+            watched: The job to check.
+        """
+
+        try:
+            self._check_once(watched)
+        finally:
+            # A job whose next check was scheduled has already been moved
+            # back to `_due`.
+            if watched.future.done():
+                with self._condition:
+                    self._checking.discard(watched)
+
+    def _check_once(self, watched: _WatchedJob) -> None:
+        """
+        Make one status check of a job. See `_check`.
+
+        Args:
+            watched: The job to check.
+        """
+
+        if watched.future.done():
+            return
+
+        deadline = watched.deadline
+
+        try:
+            if deadline is not None:
+                deadline.check(f"job {watched.job.job_id}")
+
+            if watched.failed is not None and watched.retrier is not None:
+                self._requeue(watched, watched.retrier, watched.failed)
+                return
+
+            info = self.job_status(watched.job, deadline=deadline)
+            is_terminal = JobStatus(info.status.value).is_terminal()
+        except Exception as e:
+            self._resolve(watched.future, exception=e)
+            return
+
+        if is_terminal:
+            if watched.retrier is not None:
+                delay = watched.retrier.check(0, watched.job, info)
+                if delay is not None:
+                    if deadline is not None:
+                        delay = min(delay, deadline.remaining())
+
+                    watched.failed = info
+                    self._schedule(watched, delay)
+                    return
+
+            self._resolve(watched.future, result=info)
+            return
+
+        delay = next(watched.delays)
+        if deadline is not None:
+            delay = min(delay, deadline.remaining())
+
+        self._schedule(watched, delay)
+
+    def _requeue(
+        self,
+        watched: _WatchedJob,
+        retrier: JobRetrier,
+        failed: JobInfo,
+    ) -> None:
+        """
+        Queue a failed job again and schedule the new job's first status
+        check. The future receives the failed attempt's `JobInfo` if the job
+        can't be queued.
+
+        Args:
+            watched: The failed job.
+            retrier: The retrier to queue the job with.
+            failed: The failed attempt's final `JobInfo`.
+        """
+
+        watched.failed = None
+        job = retrier.requeue(watched.job, failed)
+        if job is None:
+            self._resolve(watched.future, result=failed)
+            return
+
+        watched.job = job
+        watched.delays = watched.poll.delays_for(job)
+        if isinstance(watched.future, JobFuture):
+            watched.future.job = job
+
+        self._schedule(watched, 0.0)
+
+    def _fail_closed(self, watched: _WatchedJob) -> None:
+        """
+        Fail the future of a job that the closed poller won't check again.
+
+        Args:
+            watched: The job.
+        """
+
+        self._resolve(
+            watched.future,
+            exception=RuntimeError("The client closed before the job finished."),
+        )
+
+    @staticmethod
+    def _resolve(
+        future: Future[JobInfo],
+        result: Optional[JobInfo] = None,
+        exception: Optional[BaseException] = None,
+    ) -> None:
+        """
+        Resolve a future unless it was cancelled in the meantime.
+
+        Args:
+            future: The future to resolve.
+            result: The job's result.
+            exception: The error that stopped the job being polled.
+        """
+
+        try:
+            if exception is not None:
+                future.set_exception(exception)
+            else:
+                future.set_result(result)
+        except InvalidStateError:
+            pass
@@ -0,0 +1,157 @@
+from __future__ import annotations
+
+from time import monotonic
+
+from uncertainty_engine.exceptions import DeadlineExceeded
+
+DEFAULT_CONNECT_TIMEOUT = 10.0
+"""
+Default time in seconds to wait for a connection to be established.
+"""
+
+DEFAULT_READ_TIMEOUT = 60.0
+"""
+Default time in seconds to wait between bytes received from the server.
+"""
+
+DEFAULT_TIMEOUT = (DEFAULT_CONNECT_TIMEOUT, DEFAULT_READ_TIMEOUT)
+"""
+Default `(connect, read)` timeout for HTTP requests.
+"""
+
+TimeoutValue = float | tuple[float, float]
+"""
+An HTTP timeout in seconds, either a single value or a `(connect, read)` pair.
+"""
+
+
+class Deadline:
+    """
+    A point in time by which an operation must finish.
+
+    A deadline is shared by every request, retry and poll made on behalf of
+    one call, so it bounds the call end to end.
+
+    Args:
+        seconds: Time in seconds from now until the deadline.
+
+    Example:
+        >>> deadline = Deadline(30)
+        >>> client.run_node(add_node, deadline=deadline)
+    """
+
+    def __init__(self, seconds: float) -> None:
+        self.expires_at = monotonic() + seconds
+
+    @classmethod
+    def coerce(cls, value: float | Deadline | None) -> Deadline | None:
+        """
+        Get a deadline from a number of seconds or an existing deadline.
+
+        Args:
+            value: Seconds from now, an existing deadline, or `None`.
+
+        Returns:
+            The deadline, or `None` if no deadline was given.
+        """
+
+        if value is None or isinstance(value, Deadline):
+            return value
+
+        return cls(value)
+
+    @staticmethod
+    def earliest(*deadlines: Deadline | None) -> Deadline | None:
+        """
+        Get the earliest of some optional deadlines.
+
+        Args:
+            deadlines: Deadlines, any of which may be `None`.
+
+        Returns:
+            The deadline that expires first, or `None` if none were given.
+        """
+
+        given = [deadline for deadline in deadlines if deadline is not None]
+        return min(given, key=lambda deadline: deadline.expires_at, default=None)
+
+    def remaining(self) -> float:
+        """
+        Get the time left until the deadline.
+
+        Returns:
+            Seconds until the deadline. Never negative.
+        """
+
+        return max(0.0, self.expires_at - monotonic())
+
+    @property
+    def expired(self) -> bool:
+        """
+        Check whether the deadline has passed.
+        """
+
+        return self.remaining() <= 0
+
+    def check(self, operation: str = "operation") -> None:
+        """
+        Raise if the deadline has passed.
+
+        Args:
+            operation: Description of the operation for the error message.
+
+        Raises:
+            DeadlineExceeded: Raised if the deadline has passed.
+        """
+
+        if self.expired:
+            raise DeadlineExceeded(operation)
+
+    def clip(self, timeout: TimeoutValue, operation: str = "request") -> TimeoutValue:
+        """
+        Shorten an HTTP timeout so that it doesn't outlive the deadline.
+
+        Args:
+            timeout: HTTP timeout.
+            operation: Description of the request for the error message.
+
+        Returns:
+            The timeout, shortened to the time remaining if necessary.
+
+        Raises:
+            DeadlineExceeded: Raised if the deadline has passed, since a
+                request can't be sent with no time to run.
+        """
+
+        remaining = self.remaining()
+        if remaining <= 0:
+            raise DeadlineExceeded(operation)
+
+        if isinstance(timeout, tuple):
+            connect, read = timeout
+            return (min(connect, remaining), min(read, remaining))
+
+        return min(timeout, remaining)
+
+
+def clip_timeout(
+    timeout: TimeoutValue,
+    deadline: Deadline | None,
+    operation: str = "request",
+) -> TimeoutValue:
+    """
+    Shorten an HTTP timeout to an optional deadline.
+
+    Args:
+        timeout: HTTP timeout.
+        deadline: Optional deadline.
+        operation: Description of the request for the error message.
+
+    Returns:
+        The timeout, shortened to the time remaining until the deadline.
+
+    Raises:
+        DeadlineExceeded: Raised if the deadline has passed.
+    """
+
+    return timeout if deadline is None else deadline.clip(timeout, operation)
@@ -1,3 +1,4 @@
+import hashlib
 import json
 from typing import Any, TypeAlias, TypeVar, Union
 from warnings import warn
@@ -40,6 +41,28 @@ def dict_to_csv_str(data: dict[str, list[float]]) -> str:
     return csv_str
 
 
+@typechecked
+def hash_node_inputs(node_id: str, inputs: dict[str, Any]) -> str:
+    """
+    Get a hash that identifies a node and its inputs.
+
+    Args:
+        node_id: The ID of the node.
+        inputs: The node's inputs.
+
+    Returns:
+        A hex digest that is the same for equal inputs, whatever the order of
+        their keys.
+    """
+    canonical = json.dumps(
+        {"node_id": node_id, "inputs": inputs},
+        sort_keys=True,
+        separators=(",", ":"),
+        default=str,
+    )
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
 @typechecked
 def format_api_error(e: ApiException) -> str:
     """